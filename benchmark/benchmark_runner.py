@@ -6,7 +6,14 @@
 1. JSON-сериализация (/api/benchmark/json)
 2. Средний запрос с БД и шаблоном (/venue.html)
 3. Тяжёлый запрос (/event.html)
-4. Одновременный логин (concurrent /api/login)
+4. Одновременный логин (concurrent /api/login); стоимость bcrypt сервера
+   (BCRYPT_ROUNDS) пишется в отчёт как bcrypt_rounds
+5. api_v2: /api/v2/events против /event.html на одной и той же странице
+   мероприятий (только FastAPI, запускается явно через --scenario api_v2)
+6. compression: байты по сети для identity/gzip/br и CPU на сжатие
+   страниц при каждом уровне gzip/brotli (запускается явно через --scenario compression)
+7. login_storm: /api/benchmark/json под одновременными логинами — задержка
+   обычных запросов, пока bcrypt занят (запускается явно через --scenario login_storm)
 
 Запуск: 5-10 минут нагрузки, сбор перцентилей, CSV, JSON-отчёт.
 """
@@ -17,6 +24,9 @@ import asyncio
 import json
 import sys
 import time
+import zlib
+from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
 
 try:
@@ -25,6 +35,11 @@ except ImportError:
     print("Установите httpx: pip install httpx", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import brotli
+except ImportError:  # без brotli меряем только gzip
+    brotli = None
+
 PERCENTILES = (0.5, 0.75, 0.9, 0.95, 0.99)
 DEFAULT_DURATION_SEC = 300  # 5 минут
 DEFAULT_CONCURRENCY = 10
@@ -76,6 +91,21 @@ def build_histogram(latencies_ms: list[float], bins: int = 20) -> list[dict[str,
     return hist
 
 
+@dataclass
+class ScenarioResults:
+    """Задержки, временные ряды и статистика по сценариям прогона."""
+
+    stats: dict[str, dict] = field(default_factory=dict)
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    time_series: dict[str, list[tuple[float, float]]] = field(default_factory=dict)
+
+    def add(self, name: str, lat: list[float], ts: list[tuple[float, float]]) -> None:
+        self.latencies[name] = lat
+        self.time_series[name] = ts
+        self.stats[name] = compute_stats(lat)
+        print(f"  {name}: requests {len(lat)}, p99: {self.stats[name].get('p99', 0):.2f} ms")
+
+
 async def run_scenario(
     client: httpx.AsyncClient,
     name: str,
@@ -121,6 +151,9 @@ async def run_scenario(
 BENCHMARK_LOGIN = "user1"
 BENCHMARK_PASSWORD = "123!e5T78"
 
+# Совпадает с EVENT_PAGE_SIZE по умолчанию, чтобы сравнивать одинаковый объём данных
+API_V2_PAGE_SIZE = 20
+
 
 async def run_login_scenario(
     base_url: str,
@@ -157,6 +190,109 @@ async def run_login_scenario(
     return latencies, time_series
 
 
+async def run_login_storm_scenario(
+    client: httpx.AsyncClient,
+    base_url: str,
+    duration_sec: float,
+    concurrency: int,
+) -> tuple[dict[str, tuple[list[float], list[tuple[float, float]]]], dict]:
+    """Логины и /api/benchmark/json одновременно; плюс метрики пула bcrypt после прогона."""
+    login, json_ = await asyncio.gather(
+        run_login_scenario(base_url, duration_sec, concurrency, BENCHMARK_LOGIN, BENCHMARK_PASSWORD),
+        run_scenario(client, "json", "GET", "/api/benchmark/json", duration_sec, concurrency),
+    )
+    password_hashing: dict = {}
+    r = await client.get("/api/metrics/password-hashing")
+    if r.status_code == 200:
+        password_hashing = r.json()
+        print(f"  bcrypt pool: {password_hashing}")
+    return {"login_storm_login": login, "login_storm_json": json_}, password_hashing
+
+
+async def warm_up_login(client: httpx.AsyncClient, login: str, password: str) -> int | None:
+    """Один вход до замера; возвращает стоимость bcrypt, с которой работает сервер."""
+    try:
+        await client.post("/api/login", json={"login": login, "password": password})
+        await asyncio.sleep(1.0)  # перехеширование идёт в фоне
+        r = await client.get("/api/metrics/password-hashing")
+        return int(r.json()["rounds"]) if r.status_code == 200 else None
+    except Exception:
+        return None
+
+
+async def run_warm_login_scenario(
+    client: httpx.AsyncClient,
+    base_url: str,
+    duration_sec: float,
+    concurrency: int,
+) -> tuple[int | None, list[float], list[tuple[float, float]]]:
+    """Сценарий 4: одновременный логин после прогрева; возвращает и стоимость bcrypt."""
+    # Первый вход перехеширует пароль под BCRYPT_ROUNDS сервера, дальше меряем уже его
+    rounds = await warm_up_login(client, BENCHMARK_LOGIN, BENCHMARK_PASSWORD)
+    print(f"Scenario 4: Concurrent login (/api/login), bcrypt cost {rounds}...")
+    lat, ts = await run_login_scenario(
+        base_url, duration_sec, concurrency, BENCHMARK_LOGIN, BENCHMARK_PASSWORD
+    )
+    return rounds, lat, ts
+
+
+COMPRESSION_URLS = ("/event.html?page=1", "/session.html", "/programs/official", "/user.html")
+GZIP_LEVELS = (1, 3, 6, 9)
+BROTLI_QUALITIES = (1, 4, 6, 11)
+
+
+def _measure_compression(body: bytes, coding: str, level: int, rounds: int) -> dict:
+    t0 = time.process_time()
+    for _ in range(rounds):
+        if coding == "br":
+            out = brotli.compress(body, quality=level)
+        else:
+            gz = zlib.compressobj(level, zlib.DEFLATED, 31)
+            out = gz.compress(body) + gz.flush()
+    cpu_ms = (time.process_time() - t0) * 1000 / rounds
+    return {
+        "coding": coding,
+        "level": level,
+        "bytes": len(out),
+        "ratio": round(len(out) / len(body), 4) if body else 0,
+        "cpu_ms": round(cpu_ms, 3),
+    }
+
+
+async def run_compression_scenario(
+    client: httpx.AsyncClient, urls: tuple[str, ...], rounds: int = 20
+) -> list[dict]:
+    """Байты по сети для каждой кодировки и CPU на сжатие по уровням.
+
+    Фактический размер ответа сервера берётся при его текущих настройках;
+    стоимость уровней меряется локально на несжатом теле той же страницы.
+    """
+    rows: list[dict] = []
+    for url in urls:
+        wire: dict[str, int] = {}
+        body = b""
+        # httpx декодирует br только при установленном brotli
+        codings = ("identity", "gzip", "br") if brotli is not None else ("identity", "gzip")
+        for coding in codings:
+            r = await client.get(url, headers={"Accept-Encoding": coding})
+            if r.status_code != 200:
+                break
+            wire[coding] = r.num_bytes_downloaded
+            if coding == "identity":
+                body = r.content
+        if not body:
+            print(f"  {url}: пропущено (нет ответа 200)")
+            continue
+        levels = [_measure_compression(body, "gzip", lvl, rounds) for lvl in GZIP_LEVELS]
+        if brotli is not None:
+            levels += [_measure_compression(body, "br", q, rounds) for q in BROTLI_QUALITIES]
+        rows.append({"url": url, "raw_bytes": len(body), "wire_bytes": wire, "levels": levels})
+        print(f"  {url}: raw={len(body)} wire={wire}")
+        for lvl in levels:
+            print(f"    {lvl['coding']}:{lvl['level']} -> {lvl['bytes']} B, {lvl['cpu_ms']} ms CPU")
+    return rows
+
+
 async def main() -> None:
     parser = argparse.ArgumentParser(description="Benchmark web framework")
     parser.add_argument("--base-url", default="http://localhost:8000", help="Base URL")
@@ -167,7 +303,7 @@ async def main() -> None:
     parser.add_argument("--quick", action="store_true", help="Быстрый прогон (60 сек)")
     parser.add_argument(
         "--scenario",
-        choices=["json", "medium", "heavy", "login", "all"],
+        choices=["json", "medium", "heavy", "login", "api_v2", "compression", "login_storm", "all"],
         default="all",
         help="Запустить только указанный сценарий (по умолчанию — все)",
     )
@@ -183,9 +319,13 @@ async def main() -> None:
     print(f"Benchmark: {framework}, duration={duration}s, concurrency={args.concurrency}")
     print("=" * 60)
 
-    all_results: dict[str, dict] = {}
-    all_latencies: dict[str, list[float]] = {}
-    all_time_series: dict[str, list[tuple[float, float]]] = {}
+    collected = ScenarioResults()
+    all_results, all_latencies, all_time_series = (
+        collected.stats, collected.latencies, collected.time_series
+    )
+    compression_rows: list[dict] = []
+    password_hashing: dict = {}
+    bcrypt_rounds: int | None = None
 
     # Оба фреймворка используют одни и те же benchmark-эндпоинты для честного сравнения
     medium_url, heavy_url = "/api/benchmark/medium", "/api/benchmark/heavy"
@@ -196,41 +336,51 @@ async def main() -> None:
             lat, ts = await run_scenario(
                 client, "json", "GET", "/api/benchmark/json", duration, args.concurrency
             )
-            all_latencies["json_serialization"] = lat
-            all_time_series["json_serialization"] = ts
-            all_results["json_serialization"] = compute_stats(lat)
-            print(f"  Requests: {len(lat)}, p99: {all_results['json_serialization'].get('p99', 0):.2f} ms")
+            collected.add("json_serialization", lat, ts)
 
         if args.scenario in ("all", "medium"):
             print(f"Scenario 2: Medium request ({medium_url})...")
             lat, ts = await run_scenario(
                 client, "medium", "GET", medium_url, duration, args.concurrency
             )
-            all_latencies["medium_request"] = lat
-            all_time_series["medium_request"] = ts
-            all_results["medium_request"] = compute_stats(lat)
-            print(f"  Requests: {len(lat)}, p99: {all_results['medium_request'].get('p99', 0):.2f} ms")
+            collected.add("medium_request", lat, ts)
 
         if args.scenario in ("all", "heavy"):
             print(f"Scenario 3: Heavy request ({heavy_url})...")
             lat, ts = await run_scenario(
                 client, "heavy", "GET", heavy_url, duration, args.concurrency
             )
-            all_latencies["heavy_request"] = lat
-            all_time_series["heavy_request"] = ts
-            all_results["heavy_request"] = compute_stats(lat)
-            print(f"  Requests: {len(lat)}, p99: {all_results['heavy_request'].get('p99', 0):.2f} ms")
+            collected.add("heavy_request", lat, ts)
 
         if args.scenario in ("all", "login"):
-            print("Scenario 4: Concurrent login (/api/login)...")
-            lat, ts = await run_login_scenario(
-                args.base_url, duration, args.concurrency,
-                BENCHMARK_LOGIN, BENCHMARK_PASSWORD,
+            bcrypt_rounds, lat, ts = await run_warm_login_scenario(
+                client, args.base_url, duration, args.concurrency
+            )
+            collected.add("concurrent_login", lat, ts)
+
+        if args.scenario == "api_v2":
+            # Одинаковые данные: страница мероприятий со связями, JSON против шаблона
+            for name, url in (
+                ("api_v2_events", f"/api/v2/events?include=users,activities,lodgings&limit={API_V2_PAGE_SIZE}"),
+                ("html_events", "/event.html?page=1"),
+            ):
+                print(f"Scenario 5: {name} ({url})...")
+                lat, ts = await run_scenario(
+                    client, name, "GET", url, duration, args.concurrency
+                )
+                collected.add(name, lat, ts)
+
+        if args.scenario == "compression":
+            print("Scenario 6: Compression (bytes on the wire, CPU per level)...")
+            compression_rows = await run_compression_scenario(client, COMPRESSION_URLS)
+
+        if args.scenario == "login_storm":
+            print("Scenario 7: /api/benchmark/json during concurrent logins...")
+            storm, password_hashing = await run_login_storm_scenario(
+                client, args.base_url, duration, args.concurrency
             )
-            all_latencies["concurrent_login"] = lat
-            all_time_series["concurrent_login"] = ts
-            all_results["concurrent_login"] = compute_stats(lat)
-            print(f"  Requests: {len(lat)}, p99: {all_results['concurrent_login'].get('p99', 0):.2f} ms")
+            for name, (lat, ts) in storm.items():
+                collected.add(name, lat, ts)
 
     # --- CSV ---
     csv_path = out_dir / f"{prefix}_latencies.csv"
@@ -256,6 +406,13 @@ async def main() -> None:
             "histogram": build_histogram(all_latencies[name]),
             "time_series_sample": all_time_series[name][:: max(1, len(all_time_series[name]) // 100)],
         }
+    if compression_rows:
+        report["compression"] = compression_rows
+    if password_hashing:
+        report["password_hashing"] = password_hashing
+    if bcrypt_rounds is not None:
+        # p99 логина сравнивается между прогонами с разным BCRYPT_ROUNDS
+        report["bcrypt_rounds"] = bcrypt_rounds
     json_path = out_dir / f"{prefix}_report.json"
     with open(json_path, "w", encoding="utf-8") as f:
         json.dump(report, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк гидрации доменных моделей из строк БД.
+
+Для каждой модели строится N строк (как их отдаёт asyncpg/Motor) и меряется
+время на превращение их в модели тремя путями:
+  validated — Model(**row): полная валидация pydantic со всеми field_validator
+              (так репозитории работали раньше);
+  construct — Model.model_construct(**row): без валидации, но с обходом всех
+              полей модели на каждый вызов;
+  trusted   — models.trusted.trusted(Model, **row): как в репозиториях сейчас.
+
+Запуск без БД: python benchmark/hydration_bench.py [--rows 100000] [--output-dir results]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydantic import BaseModel
+
+from models.activity import Activity
+from models.event import Event
+from models.lodging import Lodging
+from models.program import Program
+from models.session import Session
+from models.trusted import trusted
+from models.user import User
+from models.venue import Venue
+
+
+START = datetime(2025, 5, 1, 10, 0)
+BCRYPT_HASH = "$2b$12$" + "a" * 53
+
+
+def venue_row(i: int) -> dict[str, Any]:
+    return {"venue_id": i % 500 + 1, "name": f"Площадка {i % 500}"}
+
+
+def user_row(i: int) -> dict[str, Any]:
+    return {
+        "user_id": i + 1,
+        "fio": f"Пользователь {i}",
+        "number_passport": f"{4500000000 + i}",
+        "phone_number": f"8{9990000000 + i % 10000000:010d}",
+        "email": f"user{i}@example.com",
+        "login": f"user{i}",
+        "password": BCRYPT_HASH,
+        "is_admin": False,
+    }
+
+
+def activity_row(i: int, venue: Any) -> dict[str, Any]:
+    return {
+        "activity_id": i + 1,
+        "duration": f"{i % 8 + 1} часа",
+        "address": f"ул. Ленина, {i % 300}",
+        "activity_type": "Семинар",
+        "activity_time": START + timedelta(hours=i % 1000),
+        "venue": venue,
+    }
+
+
+def lodging_row(i: int, venue: Any) -> dict[str, Any]:
+    return {
+        "lodging_id": i + 1,
+        "price": 1000 + i % 9000,
+        "address": f"ул. Мира, {i % 300}",
+        "name": f"Отель {i % 1000}",
+        "type": "Отель",
+        "rating": i % 5 + 1,
+        "check_in": START,
+        "check_out": START + timedelta(days=i % 7 + 1),
+        "venue": venue,
+    }
+
+
+def program_row(i: int, start: Any, end: Any) -> dict[str, Any]:
+    return {
+        "program_id": i + 1,
+        "transfer_type": "Поезд",
+        "cost": 1000 + i % 5000,
+        "transfer_duration_minutes": 60 + i % 600,
+        "start_venue": start,
+        "end_venue": end,
+    }
+
+
+def build_rows(n: int, construct: Callable[..., Any]) -> dict[str, Callable[[], list[Any]]]:
+    """Замыкания, которые гидрируют n строк каждой модели выбранным способом.
+
+    Вложенные объекты (площадки, участники) строятся тем же способом, что и
+    внешняя модель, как это делают репозитории.
+    """
+    venues = [venue_row(i) for i in range(n)]
+    users = [user_row(i) for i in range(n)]
+
+    def venue(i: int) -> Any:
+        return construct(Venue, venues[i % n])
+
+    def hydrate_sessions() -> list[Any]:
+        out = []
+        for i in range(n):
+            program = construct(Program, program_row(i, venue(i), venue(i + 1)))
+            event = construct(
+                Event,
+                {
+                    "event_id": i + 1,
+                    "status": "Активное",
+                    "users": [construct(User, users[i])],
+                    "activities": [construct(Activity, activity_row(i, venue(i)))],
+                    "lodgings": [construct(Lodging, lodging_row(i, venue(i)))],
+                },
+            )
+            out.append(
+                construct(
+                    Session,
+                    {
+                        "session_id": i + 1,
+                        "program": program,
+                        "event": event,
+                        "start_time": START,
+                        "end_time": START + timedelta(days=3),
+                        "type": "Официальные",
+                    },
+                )
+            )
+        return out
+
+    return {
+        "venue": lambda: [construct(Venue, r) for r in venues],
+        "user": lambda: [construct(User, r) for r in users],
+        "activity": lambda: [construct(Activity, activity_row(i, venue(i))) for i in range(n)],
+        "lodging": lambda: [construct(Lodging, lodging_row(i, venue(i))) for i in range(n)],
+        "program": lambda: [
+            construct(Program, program_row(i, venue(i), venue(i + 1))) for i in range(n)
+        ],
+        "session (program + event)": hydrate_sessions,
+    }
+
+
+def validated(model: type[BaseModel], row: dict[str, Any]) -> Any:
+    return model(**row)
+
+
+def constructed(model: type[BaseModel], row: dict[str, Any]) -> Any:
+    return model.model_construct(**row)
+
+
+def trusted_row(model: type[BaseModel], row: dict[str, Any]) -> Any:
+    return trusted(model, **row)
+
+
+def timed(fn: Callable[[], list[Any]]) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Гидрация моделей из строк БД")
+    parser.add_argument("--rows", type=int, default=100_000, help="Строк на модель")
+    parser.add_argument("--output-dir", default=None, help="Куда сохранить JSON-отчёт")
+    args = parser.parse_args()
+
+    slow = build_rows(args.rows, validated)
+    construct = build_rows(args.rows, constructed)
+    fast = build_rows(args.rows, trusted_row)
+    rows = []
+    print(f"{args.rows} строк на модель")
+    print(
+        f"{'model':28} {'validated s':>12} {'construct s':>12} {'trusted s':>10} "
+        f"{'rows/s trusted':>15} {'x':>6}"
+    )
+    for name in slow:
+        before = timed(slow[name])
+        middle = timed(construct[name])
+        after = timed(fast[name])
+        row = {
+            "model": name,
+            "validated_sec": round(before, 4),
+            "construct_sec": round(middle, 4),
+            "trusted_sec": round(after, 4),
+            "trusted_rows_per_sec": round(args.rows / after) if after else 0,
+            "speedup": round(before / after, 2) if after else 0,
+        }
+        rows.append(row)
+        print(
+            f"{name:28} {before:>12.3f} {middle:>12.3f} {after:>10.3f} "
+            f"{row['trusted_rows_per_sec']:>15} {row['speedup']:>6.2f}"
+        )
+
+    if args.output_dir:
+        out_dir = Path(args.output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"hydration_{int(time.time())}.json"
+        path.write_text(json.dumps({"rows": args.rows, "models": rows}, indent=2, ensure_ascii=False), "utf-8")
+        print(f"JSON report: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Микробенчмарк разбора тел запросов: decode + validate для каждого write-эндпоинта.
+
+Сравниваются два пути:
+  dict — json.loads(raw) и затем Schema.model_validate(dict) (как раньше
+         request.json() плюс ручной разбор);
+  raw  — Schema.__pydantic_validator__.validate_json(raw), как в json_body.
+
+Запуск без сервера: python benchmark/request_schemas_bench.py [--rounds N] [--output-dir results]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import timeit
+
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydantic import BaseModel
+
+import request_schemas as rs
+
+
+USER = {
+    "fio": "Иванов Иван Иванович",
+    "number_passport": "1234567890",
+    "phone_number": "89991234567",
+    "email": "ivan@example.com",
+    "login": "ivanov",
+    "password": "Password123!",
+}
+
+# (эндпоинт, схема, пример тела)
+ENDPOINTS: list[tuple[str, type[BaseModel], dict]] = [
+    ("POST /api/venues", rs.VenueIn, {"name": "Москва"}),
+    ("POST /api/activities", rs.ActivityIn, {
+        "duration": "3 часа", "address": "ул. Ленина, 1", "activity_type": "Семинар",
+        "activity_time": "2025-05-01T10:00", "venue": 1,
+    }),
+    ("PUT /activity/{id}", rs.ActivityDatesIn, {"activity_time": "2025-05-01T10:00", "duration": "2 часа"}),
+    ("POST /api/lodgings", rs.LodgingIn, {
+        "price": 5000, "address": "ул. Ленина, 2", "name": "Отель Центр", "type": "Отель",
+        "rating": 4, "check_in": "2025-05-01T14:00", "check_out": "2025-05-03T12:00", "venue": 1,
+    }),
+    ("PUT /lodgings/{id}", rs.LodgingDatesIn, {"check_in": "2025-05-01T14:00", "check_out": "2025-05-03T12:00"}),
+    ("POST /api/programs", rs.ProgramIn, {
+        "transfer_type": "Поезд", "cost": 3000, "transfer_duration_minutes": 240,
+        "start_venue": 1, "end_venue": 2,
+    }),
+    ("POST /api/events", rs.EventIn, {
+        "status": "Активное", "user_ids": list(range(1, 21)),
+        "activity_ids": list(range(1, 11)), "lodging_ids": list(range(1, 6)),
+    }),
+    ("POST /api/sessions", rs.SessionIn, {
+        "program_id": 1, "event_id": 1, "start_time": "2025-05-01T00:00:00",
+        "end_time": "2025-05-03T00:00:00", "type": "Официальные",
+    }),
+    ("POST /session/new", rs.UserSessionIn, {
+        "start_date": "01.05.2025", "end_date": "03.05.2025", "start_venue": "1",
+        "end_venue": "2", "transfer_type": "Поезд", "user_id": "7",
+        "activities[]": ["1", "2", "3"], "lodgings[]": "4",
+    }),
+    ("PATCH /api/sessions/{id}", rs.SessionPatchIn, {"end_time": "2025-05-04T00:00:00"}),
+    ("PUT /session/extend/{id}", rs.SessionExtendIn, {"new_end_date": "2025-05-04"}),
+    ("PUT /session/change_transfer_type/{id}", rs.TransferTypeIn, {"transfer_type": "Автобус", "program_id": 1}),
+    ("POST /session/add_venue", rs.SessionVenueIn, {
+        "event_id": 1, "new_venue_id": 3, "after_venue_id": 1, "transfer_type": "Поезд",
+    }),
+    ("DELETE /session/delete_venue", rs.SessionVenueDeleteIn, {"event_id": 1, "venue_id": 3}),
+    ("POST /sessions/{id}/join", rs.JoinSessionIn, {"user_id": 7}),
+    ("POST /api/register", rs.UserIn, USER),
+    ("PUT /api/users/{id}", rs.AdminUpdateIn, {k: USER[k] for k in ("fio", "number_passport", "phone_number", "email")}),
+    ("PATCH /api/users/{id}", rs.UserPatchIn, {"email": "new@example.com"}),
+    ("POST /api/login", rs.LoginIn, {"login": "ivanov", "password": "Password123!"}),
+    ("POST /api/verify-2fa", rs.Verify2FAIn, {"login": "ivanov", "code": "123456", "two_fa_token": "2fa-ivanov-1"}),
+]
+
+
+def measure(schema: type[BaseModel], payload: dict, rounds: int) -> dict:
+    raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    validator = schema.__pydantic_validator__
+    # Оба пути должны давать одинаковый результат
+    assert schema.model_validate(json.loads(raw)) == validator.validate_json(raw)
+
+    via_dict = min(timeit.repeat(lambda: schema.model_validate(json.loads(raw)), number=rounds, repeat=5))
+    via_raw = min(timeit.repeat(lambda: validator.validate_json(raw), number=rounds, repeat=5))
+    return {
+        "bytes": len(raw),
+        "dict_us": round(via_dict / rounds * 1e6, 3),
+        "raw_us": round(via_raw / rounds * 1e6, 3),
+        "speedup": round(via_dict / via_raw, 2) if via_raw else 0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Decode + validate тел запросов")
+    parser.add_argument("--rounds", type=int, default=20000, help="Итераций на замер")
+    parser.add_argument("--output-dir", default=None, help="Куда сохранить JSON-отчёт")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'endpoint':42} {'bytes':>6} {'dict µs':>9} {'raw µs':>8} {'x':>6}")
+    for endpoint, schema, payload in ENDPOINTS:
+        row = {"endpoint": endpoint, "schema": schema.__name__, **measure(schema, payload, args.rounds)}
+        rows.append(row)
+        print(
+            f"{endpoint:42} {row['bytes']:>6} {row['dict_us']:>9.2f} "
+            f"{row['raw_us']:>8.2f} {row['speedup']:>6.2f}"
+        )
+
+    if args.output_dir:
+        out_dir = Path(args.output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"request_schemas_{int(time.time())}.json"
+        path.write_text(json.dumps({"rounds": args.rounds, "endpoints": rows}, indent=2, ensure_ascii=False), "utf-8")
+        print(f"JSON report: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,8 @@ OUTPUT_DIR="${BENCHMARK_OUTPUT:-results}"
 MODES_FILE="./benchmark/modes.json"
 # BENCHMARK_FRESH_BUILD=1 — полная пересборка образа без кэша (медленно)
 FRESH_BUILD="${BENCHMARK_FRESH_BUILD:-0}"
+# Сценарий login шлёт сотни входов одного пользователя в секунду — лимит входов выключен
+RATE_LIMIT="${RATE_LIMIT_ENABLED:-0}"
 
 mkdir -p "$OUTPUT_DIR"
 
@@ -54,10 +56,10 @@ run_mode() {
         PROFILE_ARGS=""
         for p in $profiles; do PROFILE_ARGS="$PROFILE_ARGS --profile $p"; done
         if [ "$enable_tracing" = "1" ]; then
-            ENABLE_TRACING=$enable_tracing LOG_LEVEL=$log_level \
+            ENABLE_TRACING=$enable_tracing LOG_LEVEL=$log_level RATE_LIMIT_ENABLED=$RATE_LIMIT \
                 docker compose $PROFILE_ARGS up -d --force-recreate db app otel-collector jaeger 2>/dev/null || true
         else
-            ENABLE_TRACING=$enable_tracing LOG_LEVEL=$log_level \
+            ENABLE_TRACING=$enable_tracing LOG_LEVEL=$log_level RATE_LIMIT_ENABLED=$RATE_LIMIT \
                 docker compose $PROFILE_ARGS up -d --force-recreate db app 2>/dev/null || true
         fi
         [ "$enable_tracing" = "1" ] && sleep 20 || sleep 15
@@ -0,0 +1,41 @@
+-- Счётчики версий таблиц для условных GET-запросов (ETag / Last-Modified).
+-- Каждая изменяющая команда увеличивает версию своей таблицы, поэтому
+-- роуты могут проверить актуальность страницы одним запросом к table_version.
+CREATE TABLE IF NOT EXISTS event_db.table_version (
+    table_name VARCHAR(64) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION event_db.bump_table_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO event_db.table_version (table_name, version, updated_at)
+    VALUES (TG_TABLE_NAME, 1, now())
+    ON CONFLICT (table_name) DO UPDATE
+        SET version = event_db.table_version.version + 1,
+            updated_at = now();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'venue', 'program', 'users', 'activity', 'lodgings', 'event',
+        'session', 'event_activity', 'event_lodgings', 'users_event'
+    ]
+    LOOP
+        INSERT INTO event_db.table_version (table_name) VALUES (t)
+        ON CONFLICT (table_name) DO NOTHING;
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_version ON event_db.%1$I', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_version '
+            'AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON event_db.%1$I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION event_db.bump_table_version()',
+            t
+        );
+    END LOOP;
+END;
+$$;
@@ -0,0 +1,199 @@
+-- Сводная таблица каталога: одна строка на сессию со всем, что нужно
+-- страницам /programs/official и /programs/recommended.
+-- Поддерживается триггерами: при изменении пересчитываются только
+-- затронутые сессии, поэтому чтение каталога — один индексный скан.
+CREATE TABLE IF NOT EXISTS event_db.session_catalog (
+    session_id INT PRIMARY KEY REFERENCES event_db.session(id) ON DELETE CASCADE,
+    type VARCHAR(20) NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    start_venue VARCHAR(100),
+    end_venue VARCHAR(100),
+    transfer_type VARCHAR(100) NOT NULL,
+    transport_cost INT NOT NULL,
+    lodging_cost INT NOT NULL,
+    total_cost INT NOT NULL,
+    lodgings JSONB NOT NULL DEFAULT '[]'::jsonb,
+    activities JSONB NOT NULL DEFAULT '[]'::jsonb,
+    user_ids INT[] NOT NULL DEFAULT '{}'
+);
+
+CREATE INDEX IF NOT EXISTS idx_session_catalog_type
+    ON event_db.session_catalog (type, session_id);
+
+CREATE OR REPLACE FUNCTION event_db.refresh_session_catalog(p_session_ids INT[])
+RETURNS void AS $$
+BEGIN
+    DELETE FROM event_db.session_catalog sc
+    WHERE sc.session_id = ANY(p_session_ids)
+      AND NOT EXISTS (SELECT 1 FROM event_db.session s WHERE s.id = sc.session_id);
+
+    INSERT INTO event_db.session_catalog (
+        session_id, type, start_time, end_time, start_venue, end_venue,
+        transfer_type, transport_cost, lodging_cost, total_cost,
+        lodgings, activities, user_ids
+    )
+    SELECT
+        s.id,
+        s.type,
+        s.start_time,
+        s.end_time,
+        sv.name,
+        ev.name,
+        p.transfer_type,
+        p.cost,
+        COALESCE(l.lodging_cost, 0),
+        p.cost + COALESCE(l.lodging_cost, 0),
+        COALESCE(l.items, '[]'::jsonb),
+        COALESCE(a.items, '[]'::jsonb),
+        COALESCE(u.ids, '{}')
+    FROM event_db.session s
+    JOIN event_db.program p ON p.id = s.program_id
+    LEFT JOIN event_db.venue sv ON sv.venue_id = p.start_venue
+    LEFT JOIN event_db.venue ev ON ev.venue_id = p.end_venue
+    LEFT JOIN LATERAL (
+        SELECT
+            SUM(lg.price)::INT AS lodging_cost,
+            jsonb_agg(jsonb_build_object(
+                'name', lg.name,
+                'type', lg.type,
+                'address', lg.address,
+                'check_in', to_char(lg.check_in, 'DD.MM.YYYY'),
+                'check_out', to_char(lg.check_out, 'DD.MM.YYYY'),
+                'rating', lg.rating,
+                'price', lg.price
+            ) ORDER BY el.id) AS items
+        FROM event_db.event_lodgings el
+        JOIN event_db.lodgings lg ON lg.id = el.lodging_id
+        WHERE el.event_id = s.event_id
+    ) l ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT jsonb_agg(jsonb_build_object(
+            'name', act.activity_type,
+            'address', act.address,
+            'date', to_char(act.activity_time, 'DD.MM.YYYY'),
+            'duration', act.duration
+        ) ORDER BY ea.id) AS items
+        FROM event_db.event_activity ea
+        JOIN event_db.activity act ON act.id = ea.activity_id
+        WHERE ea.event_id = s.event_id
+    ) a ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT array_agg(ue.users_id ORDER BY ue.id) AS ids
+        FROM event_db.users_event ue
+        WHERE ue.event_id = s.event_id
+    ) u ON TRUE
+    WHERE s.id = ANY(p_session_ids)
+    ON CONFLICT (session_id) DO UPDATE SET
+        type = EXCLUDED.type,
+        start_time = EXCLUDED.start_time,
+        end_time = EXCLUDED.end_time,
+        start_venue = EXCLUDED.start_venue,
+        end_venue = EXCLUDED.end_venue,
+        transfer_type = EXCLUDED.transfer_type,
+        transport_cost = EXCLUDED.transport_cost,
+        lodging_cost = EXCLUDED.lodging_cost,
+        total_cost = EXCLUDED.total_cost,
+        lodgings = EXCLUDED.lodgings,
+        activities = EXCLUDED.activities,
+        user_ids = EXCLUDED.user_ids;
+END;
+$$ LANGUAGE plpgsql;
+
+-- session: пересчёт самой сессии
+CREATE OR REPLACE FUNCTION event_db.session_catalog_on_session() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM event_db.session_catalog WHERE session_id = OLD.id;
+    ELSE
+        PERFORM event_db.refresh_session_catalog(ARRAY[NEW.id]);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- event_activity / event_lodgings / users_event: все сессии мероприятия
+CREATE OR REPLACE FUNCTION event_db.session_catalog_on_event_link() RETURNS trigger AS $$
+DECLARE
+    v_event_ids INT[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        v_event_ids := ARRAY[NEW.event_id];
+    ELSIF TG_OP = 'DELETE' THEN
+        v_event_ids := ARRAY[OLD.event_id];
+    ELSE
+        v_event_ids := ARRAY[OLD.event_id, NEW.event_id];
+    END IF;
+    PERFORM event_db.refresh_session_catalog(ARRAY(
+        SELECT id FROM event_db.session WHERE event_id = ANY(v_event_ids)
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- program / venue / activity / lodgings: сессии, которые на них ссылаются
+CREATE OR REPLACE FUNCTION event_db.session_catalog_on_reference() RETURNS trigger AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'program' THEN
+        PERFORM event_db.refresh_session_catalog(ARRAY(
+            SELECT id FROM event_db.session WHERE program_id = NEW.id
+        ));
+    ELSIF TG_TABLE_NAME = 'venue' THEN
+        PERFORM event_db.refresh_session_catalog(ARRAY(
+            SELECT s.id FROM event_db.session s
+            JOIN event_db.program p ON p.id = s.program_id
+            WHERE p.start_venue = NEW.venue_id OR p.end_venue = NEW.venue_id
+        ));
+    ELSIF TG_TABLE_NAME = 'activity' THEN
+        PERFORM event_db.refresh_session_catalog(ARRAY(
+            SELECT s.id FROM event_db.session s
+            JOIN event_db.event_activity ea ON ea.event_id = s.event_id
+            WHERE ea.activity_id = NEW.id
+        ));
+    ELSIF TG_TABLE_NAME = 'lodgings' THEN
+        PERFORM event_db.refresh_session_catalog(ARRAY(
+            SELECT s.id FROM event_db.session s
+            JOIN event_db.event_lodgings el ON el.event_id = s.event_id
+            WHERE el.lodging_id = NEW.id
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_session_catalog ON event_db.session;
+CREATE TRIGGER trg_session_catalog
+    AFTER INSERT OR UPDATE OR DELETE ON event_db.session
+    FOR EACH ROW EXECUTE FUNCTION event_db.session_catalog_on_session();
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['event_activity', 'event_lodgings', 'users_event']
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_session_catalog ON event_db.%I', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_session_catalog '
+            'AFTER INSERT OR UPDATE OR DELETE ON event_db.%I '
+            'FOR EACH ROW EXECUTE FUNCTION event_db.session_catalog_on_event_link()',
+            t
+        );
+    END LOOP;
+
+    -- Удаления этих строк каскадом удаляют связи и сессии, чьи триггеры
+    -- уже обновляют каталог, поэтому здесь достаточно UPDATE.
+    FOREACH t IN ARRAY ARRAY['program', 'venue', 'activity', 'lodgings']
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_session_catalog ON event_db.%I', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_session_catalog '
+            'AFTER UPDATE ON event_db.%I '
+            'FOR EACH ROW EXECUTE FUNCTION event_db.session_catalog_on_reference()',
+            t
+        );
+    END LOOP;
+END;
+$$;
+
+SELECT event_db.refresh_session_catalog(ARRAY(SELECT id FROM event_db.session));
@@ -0,0 +1,11 @@
+-- Один пользователь — одна запись участия в мероприятии. Уникальный ключ
+-- позволяет присоединяться к мероприятию одним INSERT ... ON CONFLICT DO NOTHING
+-- без предварительного чтения списка участников.
+DELETE FROM event_db.users_event ue
+USING event_db.users_event dup
+WHERE ue.event_id = dup.event_id
+  AND ue.users_id = dup.users_id
+  AND ue.id > dup.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS users_event_event_user_key
+    ON event_db.users_event (event_id, users_id);
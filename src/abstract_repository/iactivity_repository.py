@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Iterable
 
 from models.activity import Activity
 
@@ -11,10 +12,18 @@ class IActivityRepository(ABC):
     async def get_list(self) -> list[Activity]:
         pass
 
+    @abstractmethod
+    async def get_page(self, limit: int, offset: int) -> list[Activity]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, activity_id: int) -> Activity | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, activity_ids: Iterable[int]) -> dict[int, Activity]:
+        pass
+
     @abstractmethod
     async def add(self, activity: Activity) -> Activity:
         pass
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
+from typing import Iterable
 
 from models.activity import Activity
 from models.lodging import Lodging
@@ -15,10 +16,18 @@ class IEventRepository(ABC):
     async def get_list(self) -> list[Event]:
         pass
 
+    @abstractmethod
+    async def get_page(self, limit: int, offset: int) -> list[Event]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, event_id: int) -> Event | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, event_ids: Iterable[int]) -> dict[int, Event]:
+        pass
+
     @abstractmethod
     async def add(self, event: Event) -> Event:
         pass
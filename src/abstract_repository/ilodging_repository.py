@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Iterable
 
 from models.lodging import Lodging
 
@@ -11,10 +12,18 @@ class ILodgingRepository(ABC):
     async def get_list(self) -> list[Lodging]:
         pass
 
+    @abstractmethod
+    async def get_page(self, limit: int, offset: int) -> list[Lodging]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, lodging_id: int) -> Lodging | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, lodging_ids: Iterable[int]) -> dict[int, Lodging]:
+        pass
+
     @abstractmethod
     async def add(self, lodging: Lodging) -> Lodging:
         pass
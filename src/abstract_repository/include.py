@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Collection
+
+
+# None — загрузить все связи, "shallow" — ни одной, иначе набор путей:
+# {"program.venues", "event"}. Незагруженные связи — models.unloaded.Unloaded.
+Include = str | Collection[str] | None
+
+SHALLOW = "shallow"
+
+
+def resolve_include(include: Include, allowed: Collection[str]) -> frozenset[str]:
+    """Раскрывает include в набор путей; "a.b" подразумевает "a"."""
+    if include is None:
+        return frozenset(allowed)
+    if include == SHALLOW:
+        return frozenset()
+    if isinstance(include, str):
+        include = {include}
+    paths: set[str] = set()
+    for path in include:
+        if path not in allowed:
+            raise ValueError(f"Неизвестная связь в include: {path}")
+        parts = path.split(".")
+        paths.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return frozenset(paths)
@@ -2,17 +2,32 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from typing import ClassVar
+from typing import Iterable
 
+from abstract_repository.include import Include
 from models.program import Program
 
 
 class IProgramRepository(ABC):
+    INCLUDE_PATHS: ClassVar[frozenset[str]] = frozenset({"venues"})
+
     @abstractmethod
     async def get_list(self) -> list[Program]:
         pass
 
     @abstractmethod
-    async def get_by_id(self, program_id: int) -> Program | None:
+    async def get_page(self, limit: int, offset: int) -> list[Program]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(
+        self, program_id: int, include: Include = None
+    ) -> Program | None:
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, program_ids: Iterable[int]) -> dict[int, Program]:
         pass
 
     @abstractmethod
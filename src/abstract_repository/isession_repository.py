@@ -2,18 +2,35 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from datetime import datetime
 from typing import Any
+from typing import ClassVar
+from typing import Iterable
 
+from abstract_repository.include import Include
 from models.session import Session
 
 
 class ISessionRepository(ABC):
+    INCLUDE_PATHS: ClassVar[frozenset[str]] = frozenset({"program", "program.venues", "event"})
+    PATCH_FIELDS: ClassVar[frozenset[str]] = frozenset({"start_time", "end_time", "type"})
+
     @abstractmethod
     async def get_list(self) -> list[Session]:
         pass
 
     @abstractmethod
-    async def get_by_id(self, session_id: int) -> Session | None:
+    async def get_page(self, limit: int, offset: int) -> list[Session]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(
+        self, session_id: int, include: Include = None
+    ) -> Session | None:
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, session_ids: Iterable[int]) -> dict[int, Session]:
         pass
 
     @abstractmethod
@@ -24,6 +41,18 @@ class ISessionRepository(ABC):
     async def update(self, update_session: Session) -> None:
         pass
 
+    @abstractmethod
+    async def patch(self, session_id: int, changes: dict[str, Any]) -> Session | None:
+        pass
+
+    @abstractmethod
+    async def extend(self, session_id: int, end_time: datetime) -> Session | None:
+        pass
+
+    @abstractmethod
+    async def join_event(self, session_id: int, user_id: int) -> Session | None:
+        pass
+
     @abstractmethod
     async def delete(self, session_id: int) -> None:
         pass
@@ -58,10 +87,24 @@ class ISessionRepository(ABC):
     ) -> list[Session]:
         pass
 
+    @abstractmethod
+    async def get_sessions_for_user(
+        self, user_id: int, statuses: list[str]
+    ) -> list[Session]:
+        pass
+
     @abstractmethod
     async def get_sessions_by_type(self, type_session: str) -> list[Session]:
         pass
 
+    @abstractmethod
+    async def get_sessions_overview(self) -> dict[str, list[dict[str, Any]]]:
+        pass
+
+    @abstractmethod
+    async def get_catalog_by_type(self, type_session: str) -> list[dict[str, Any]] | None:
+        pass
+
     @abstractmethod
     async def get_session_parts(self, event_id: int) -> list[dict[str, Any]]:
         pass
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from datetime import datetime
+
+
+class ITableVersionRepository(ABC):
+    @abstractmethod
+    async def get_versions(
+        self, table_names: tuple[str, ...]
+    ) -> dict[str, tuple[int, datetime]]:
+        pass
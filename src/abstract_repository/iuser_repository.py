@@ -2,19 +2,39 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
+from typing import AsyncIterator
+from typing import ClassVar
+from typing import Iterable
 
 from models.user import User
 
 
 class IUserRepository(ABC):
+    PATCH_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"fio", "number_passport", "phone_number", "email", "login"}
+    )
+
     @abstractmethod
     async def get_list(self) -> list[User]:
         pass
 
+    @abstractmethod
+    async def get_page(self, limit: int, offset: int) -> list[User]:
+        pass
+
+    @abstractmethod
+    def iter_list(self, batch_size: int = 500) -> AsyncIterator[User]:
+        """Все пользователи по одному, без загрузки списка целиком."""
+
     @abstractmethod
     async def get_by_id(self, user_id: int) -> User | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, user_ids: Iterable[int]) -> dict[int, User]:
+        pass
+
     @abstractmethod
     async def add(self, user: User) -> User:
         pass
@@ -23,6 +43,16 @@ class IUserRepository(ABC):
     async def update(self, update_user: User) -> None:
         pass
 
+    @abstractmethod
+    async def patch(self, user_id: int, changes: dict[str, Any]) -> User | None:
+        pass
+
+    @abstractmethod
+    async def update_password(
+        self, login: str, password: str, expected: str | None = None
+    ) -> User | None:
+        """Смена хеша пароля; с expected — только если текущий хеш равен ему."""
+
     @abstractmethod
     async def delete(self, user_id: int) -> None:
         pass
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Iterable
 
 from models.venue import Venue
 
@@ -11,10 +12,18 @@ class IVenueRepository(ABC):
     async def get_list(self) -> list[Venue]:
         pass
 
+    @abstractmethod
+    async def get_page(self, limit: int, offset: int) -> list[Venue]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, venue_id: int) -> Venue | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, venue_ids: Iterable[int]) -> dict[int, Venue]:
+        pass
+
     @abstractmethod
     async def add(self, venue: Venue) -> Venue:
         pass
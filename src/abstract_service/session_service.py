@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 
+from abstract_repository.include import Include
 from models.session import Session
 
 
@@ -11,7 +12,9 @@ Session.model_rebuild()
 
 class ISessionService(ABC):
     @abstractmethod
-    async def get_by_id(self, session_id: int) -> Session | None:
+    async def get_by_id(
+        self, session_id: int, include: Include = None
+    ) -> Session | None:
         pass
 
     @abstractmethod
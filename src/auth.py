@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer
+from jose import JWTError
+
+from services.user_service import AuthService
+from settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Шаблоны без входа присылают "Bearer null" из пустого localStorage
+_NO_TOKEN = {"", "null", "undefined"}
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    user_id: int
+    login: str
+    is_admin: bool
+
+
+class TokenCache:
+    """LRU уже проверенных JWT.
+
+    Запись живёт до exp токена, поэтому повторные запросы с тем же токеном
+    не проверяют подпись заново и не ходят в БД за пользователем.
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.time) -> None:
+        self.max_size = max_size
+        self._clock = clock
+        self._tokens: OrderedDict[str, tuple[CurrentUser, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> CurrentUser | None:
+        entry = self._tokens.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+        user, expires_at = entry
+        if expires_at <= self._clock():
+            del self._tokens[token]
+            self.misses += 1
+            return None
+        self._tokens.move_to_end(token)
+        self.hits += 1
+        return user
+
+    def put(self, token: str, user: CurrentUser, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+        self._tokens[token] = (user, expires_at)
+        self._tokens.move_to_end(token)
+        while len(self._tokens) > self.max_size:
+            self._tokens.popitem(last=False)
+
+    def clear(self) -> None:
+        self._tokens.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {"size": len(self._tokens), "hits": self.hits, "misses": self.misses}
+
+
+token_cache = TokenCache(settings.AUTH_TOKEN_CACHE_MAX_SIZE)
+
+
+def user_from_token(token: str) -> CurrentUser:
+    user = token_cache.get(token)
+    if user is not None:
+        return user
+    try:
+        claims = AuthService.decode_token(token)
+        user = CurrentUser(
+            user_id=int(claims["sub"]),
+            login=str(claims.get("login", "")),
+            is_admin=bool(claims.get("is_admin", False)),
+        )
+        expires_at = float(claims["exp"])
+    except (JWTError, KeyError, TypeError, ValueError) as e:
+        logger.info("Недействительный токен: %s", e)
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    token_cache.put(token, user, expires_at)
+    return user
+
+
+_bearer = HTTPBearer(auto_error=False)
+_bearer_dep = Depends(_bearer)
+
+
+async def optional_user(
+    credentials: HTTPAuthorizationCredentials | None = _bearer_dep,
+) -> CurrentUser | None:
+    """Пользователь из Bearer-токена; None, если токена нет."""
+    if credentials is None or credentials.credentials in _NO_TOKEN:
+        return None
+    return user_from_token(credentials.credentials)
+
+
+optional_user_dep = Depends(optional_user)
+
+
+async def current_user(user: CurrentUser | None = optional_user_dep) -> CurrentUser:
+    if user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+def acting_user_id(user: CurrentUser, requested: int | None) -> int:
+    """ID, от имени которого выполняется действие; администратор может указать другого."""
+    if requested is None or requested == user.user_id:
+        return user.user_id
+    if not user.is_admin:
+        raise HTTPException(status_code=403, detail="user_id does not match token")
+    return requested
+
+
+current_user_dep = Depends(current_user)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import os
+import tempfile
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable
+from typing import Callable
+
+from fastapi import Request
+from fastapi.responses import FileResponse
+
+from settings import settings
+from single_flight import SingleFlight
+
+
+try:
+    import brotli
+except ImportError:  # brotli — необязательная зависимость
+    brotli = None
+
+
+logger = logging.getLogger(__name__)
+
+KEEP_GENERATIONS = 2
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    html: Path
+    gzip: Path
+    brotli: Path | None
+
+
+def accepts_encoding(request: Request, coding: str) -> bool:
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() in {coding, "*"}:
+            return params.replace(" ", "") not in {"q=0", "q=0.0", "q=0.00", "q=0.000"}
+    return False
+
+
+class CatalogSnapshots:
+    """Готовые HTML-снимки каталогов, которые отдаются прямо с диска.
+
+    Снимок адресуется дайджестом версий таблиц (см. conditional_get), поэтому
+    любое изменение сессий даёт новый файл, а старые поколения удаляются.
+    """
+
+    def __init__(self, directory: Path, enabled: bool = True) -> None:
+        self.directory = directory
+        self.enabled = enabled
+        self._flight = SingleFlight([])
+
+    def _paths(self, name: str, digest: str) -> Snapshot:
+        base = self.directory / f"{name}-{digest}.html"
+        return Snapshot(
+            html=base,
+            gzip=base.with_name(base.name + ".gz"),
+            brotli=base.with_name(base.name + ".br") if brotli is not None else None,
+        )
+
+    async def ensure(
+        self, name: str, digest: str, render: Callable[[], Awaitable[str]]
+    ) -> Snapshot:
+        snapshot = self._paths(name, digest)
+        if snapshot.html.exists():
+            return snapshot
+
+        async def generate() -> Snapshot:
+            body = (await render()).encode("utf-8")
+            await asyncio.to_thread(self._write, name, snapshot, body)
+            logger.info("Снимок каталога %s обновлён: %s", name, snapshot.html.name)
+            return snapshot
+
+        return await self._flight.do(f"{name}:{digest}", generate, name)
+
+    def _write(self, name: str, snapshot: Snapshot, body: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(snapshot.gzip, gzip.compress(body, compresslevel=9, mtime=0))
+        if snapshot.brotli is not None:
+            self._atomic_write(snapshot.brotli, brotli.compress(body, quality=11))
+        # HTML пишется последним: его наличие означает, что снимок готов целиком
+        self._atomic_write(snapshot.html, body)
+        self._prune(name)
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _prune(self, name: str) -> None:
+        generations = sorted(
+            self.directory.glob(f"{name}-*.html"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in generations[KEEP_GENERATIONS:]:
+            for path in (stale, stale.with_name(stale.name + ".gz"), stale.with_name(stale.name + ".br")):
+                path.unlink(missing_ok=True)
+
+    @staticmethod
+    def file_response(
+        request: Request, snapshot: Snapshot, headers: dict[str, str]
+    ) -> FileResponse:
+        headers = {**headers, "Vary": "Accept-Encoding"}
+        path = snapshot.html
+        if snapshot.brotli is not None and accepts_encoding(request, "br"):
+            path = snapshot.brotli
+            headers["Content-Encoding"] = "br"
+        elif accepts_encoding(request, "gzip"):
+            path = snapshot.gzip
+            headers["Content-Encoding"] = "gzip"
+        return FileResponse(path, media_type="text/html; charset=utf-8", headers=headers)
+
+
+catalog_snapshots = CatalogSnapshots(
+    Path(settings.CATALOG_SNAPSHOT_DIR), enabled=settings.CATALOG_SNAPSHOTS_ENABLED
+)
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import logging
+import zlib
+
+from collections import OrderedDict
+from typing import Callable
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from catalog_snapshots import accepts_encoding
+from settings import settings
+
+
+try:
+    import brotli
+except ImportError:  # brotli — необязательная зависимость
+    brotli = None
+
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "image/svg+xml",
+)
+
+
+class CompressionCache:
+    """Сжатые тела ответов с ETag: одинаковый ответ не сжимается повторно.
+
+    Ключ — адрес запроса (путь и query), ETag и кодировка: у разных ресурсов
+    ETag может совпасть, а слабый W/ ETag не обещает одинаковых байтов.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._bodies: OrderedDict[tuple[str, str, str], bytes] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def get(self, target: str, etag: str, coding: str) -> bytes | None:
+        key = (target, etag, coding)
+        body = self._bodies.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self._bodies.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, target: str, etag: str, coding: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        key = (target, etag, coding)
+        old = self._bodies.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._bodies[key] = body
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, evicted = self._bodies.popitem(last=False)
+            self._size -= len(evicted)
+
+    def record(self, raw: int, compressed: int) -> None:
+        self.bytes_in += raw
+        self.bytes_out += compressed
+
+    def clear(self) -> None:
+        self._bodies.clear()
+        self._size = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._bodies),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+
+compression_cache = CompressionCache(settings.COMPRESSION_CACHE_MAX_BYTES)
+
+
+def _compressor(coding: str, gzip_level: int, brotli_quality: int) -> tuple[
+    Callable[[bytes], bytes], Callable[[], bytes]
+]:
+    """Потоковый компрессор: (сжать кусок со сбросом, завершить поток)."""
+    if coding == "br":
+        br = brotli.Compressor(quality=brotli_quality)
+        return (lambda data: br.process(data) + br.flush()), br.finish
+    gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+    return (lambda data: gz.compress(data) + gz.flush(zlib.Z_SYNC_FLUSH)), gz.flush
+
+
+def compress(body: bytes, coding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    if coding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+    return gz.compress(body) + gz.flush()
+
+
+class CompressionMiddleware:
+    """gzip/brotli для текстовых ответов.
+
+    Короткие ответы (меньше minimum_size) и уже сжатые (снимки каталогов)
+    пропускаются как есть. Потоковые ответы сжимаются по частям со сбросом
+    буфера, чтобы браузер получал разметку сразу. Тела с ETag кэшируются
+    в сжатом виде.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        cache: CompressionCache | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = cache or compression_cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope)
+        if brotli is not None and accepts_encoding(request, "br"):
+            coding = "br"
+        elif accepts_encoding(request, "gzip"):
+            coding = "gzip"
+        else:
+            await self.app(scope, receive, send)
+            return
+        target = scope["path"]
+        if scope.get("query_string"):
+            target += "?" + scope["query_string"].decode("latin-1")
+        await self.app(scope, receive, _CompressingSender(self, coding, target, send))
+
+
+class _CompressingSender:
+    def __init__(
+        self, middleware: CompressionMiddleware, coding: str, target: str, send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.coding = coding
+        self.target = target
+        self.send = send
+        self.start: Message | None = None
+        self.started = False
+        self.passthrough = False
+        self.stream: tuple[Callable[[bytes], bytes], Callable[[], bytes]] | None = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            # Расширения ASGI (pathsend и т.п.) отдаём без изменений
+            if not self.started:
+                self.passthrough = True
+                await self._send_start()
+            await self.send(message)
+            return
+        if self.passthrough:
+            await self.send(message)
+        elif self.stream is not None:
+            await self._send_stream_chunk(message)
+        else:
+            await self._first_body(message)
+
+    async def _send_start(self) -> None:
+        assert self.start is not None
+        self.started = True
+        await self.send(self.start)
+
+    def _compressible(self, headers: Headers) -> bool:
+        assert self.start is not None
+        if self.start["status"] in (204, 206, 304) or "content-encoding" in headers:
+            return False
+        if "content-range" in headers:
+            # Диапазон относится к несжатому телу
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def _first_body(self, message: Message) -> None:
+        assert self.start is not None
+        headers = MutableHeaders(scope=self.start)
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if not self._compressible(headers):
+            self.passthrough = True
+            await self._send_start()
+            await self.send(message)
+            return
+        headers.add_vary_header("Accept-Encoding")
+        if not more_body and len(body) < self.middleware.minimum_size:
+            self.passthrough = True
+            await self._send_start()
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.coding
+        if more_body:
+            # Длина заранее неизвестна — сжимаем по частям
+            del headers["Content-Length"]
+            self.stream = _compressor(
+                self.coding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            await self._send_start()
+            await self._send_stream_chunk(message)
+            return
+
+        compressed = self._compress_cached(headers.get("etag"), body)
+        headers["Content-Length"] = str(len(compressed))
+        await self._send_start()
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    def _compress_cached(self, etag: str | None, body: bytes) -> bytes:
+        cache = self.middleware.cache
+        if etag is not None and (cached := cache.get(self.target, etag, self.coding)) is not None:
+            return cached
+        compressed = compress(
+            body, self.coding, self.middleware.gzip_level, self.middleware.brotli_quality
+        )
+        cache.record(len(body), len(compressed))
+        if etag is not None:
+            cache.put(self.target, etag, self.coding, compressed)
+        return compressed
+
+    async def _send_stream_chunk(self, message: Message) -> None:
+        assert self.stream is not None
+        process, finish = self.stream
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        data = process(body) if body else b""
+        if not more_body:
+            data += finish()
+        self.middleware.cache.record(len(body), len(data))
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+
+def setup_compression(app: FastAPI) -> None:
+    if not settings.COMPRESSION_ENABLED:
+        return
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from abstract_repository.itable_version_repository import ITableVersionRepository
+
+
+CATALOG_TABLES = (
+    "session",
+    "program",
+    "venue",
+    "event",
+    "users_event",
+    "event_activity",
+    "event_lodgings",
+    "activity",
+    "lodgings",
+)
+PROGRAM_TABLES = ("program", "venue")
+VENUE_TABLES = ("venue",)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheValidators:
+    digest: str
+    last_modified: datetime
+
+    @property
+    def etag(self) -> str:
+        return f'W/"{self.digest}"'
+
+    def headers(self) -> dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+
+
+async def get_validators(
+    repo: ITableVersionRepository, route: str, tables: tuple[str, ...]
+) -> CacheValidators | None:
+    """Строит ETag и Last-Modified по версиям таблиц, не загружая сами данные."""
+    versions = await repo.get_versions(tables)
+    if set(versions) != set(tables):
+        return None
+    fingerprint = route + ";" + ";".join(
+        f"{name}:{versions[name][0]}" for name in sorted(tables)
+    )
+    digest = hashlib.blake2b(fingerprint.encode(), digest_size=12).hexdigest()
+    last_modified = max(updated_at for _, updated_at in versions.values())
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=UTC)
+    return CacheValidators(
+        digest=digest,
+        last_modified=last_modified.astimezone(UTC).replace(microsecond=0),
+    )
+
+
+def is_not_modified(request: Request, validators: CacheValidators) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        weak = validators.etag.removeprefix("W/")
+        return "*" in tags or validators.etag in tags or weak in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return validators.last_modified <= since
+    return False
+
+
+def not_modified(validators: CacheValidators) -> Response:
+    return Response(status_code=304, headers=validators.headers())
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import logging
 
-from datetime import datetime
 from json import JSONDecodeError
 from typing import Any
 
 from fastapi import HTTPException
-from fastapi import Request
 
 from models.activity import Activity
+from request_schemas import ActivityDatesIn
+from request_schemas import ActivityIn
 from services.activity_service import ActivityService
 from services.venue_service import VenueService
+from view_models import ActivityView
 
 
 logger = logging.getLogger(__name__)
@@ -25,12 +26,13 @@ class ActivityController:
         self.venue_service = venue_service
         logger.debug("Инициализация ActivityController")
 
-    async def create_new_activity(self, request: Request) -> dict[str, Any]:
+    async def create_new_activity(self, data: ActivityIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["activity_id"] = 1
-            data["venue"] = await self.venue_service.get_by_id(data["venue"])
-            activity = Activity(**data)
+            activity = Activity(
+                activity_id=1,
+                venue=await self.venue_service.get_by_id(data.venue),
+                **data.model_dump(exclude={"venue"}),
+            )
             activity = await self.activity_service.add(activity)
             logger.info("Активность успешно создана: %s", activity)
             return {
@@ -42,13 +44,14 @@ class ActivityController:
             return {"message": "Error creating activity", "error": str(e)}
 
     async def update_activity(
-        self, activity_id: int, request: Request
+        self, activity_id: int, data: ActivityIn
     ) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["activity_id"] = activity_id
-            data["venue"] = await self.venue_service.get_by_id(data["venue"])
-            activity = Activity(**data)
+            activity = Activity(
+                activity_id=activity_id,
+                venue=await self.venue_service.get_by_id(data.venue),
+                **data.model_dump(exclude={"venue"}),
+            )
             await self.activity_service.update(activity)
             logger.info("Активность ID %d успешно обновлена", activity_id)
             return {"message": "Activity updated successfully"}
@@ -93,19 +96,7 @@ class ActivityController:
         try:
             activity_list = await self.activity_service.get_list()
             logger.info("Получено %d активностей", len(activity_list))
-            return {
-                "activities": [
-                    {
-                        "id": a.activity_id,
-                        "duration": a.duration,
-                        "address": a.address,
-                        "activity_type": a.activity_type,
-                        "activity_time": a.activity_time.isoformat(),
-                        "venue": a.venue,
-                    }
-                    for a in activity_list
-                ]
-            }
+            return {"activities": [ActivityView.from_model(a) for a in activity_list]}
         except Exception as e:
             logger.error(
                 "Ошибка при получении списка активностей: %s", str(e), exc_info=True
@@ -127,16 +118,15 @@ class ActivityController:
             return {"message": "Error deleting activity", "error": str(e)}
 
     async def update_activity_dates(
-        self, activity_id: int, request: Request
+        self, activity_id: int, data: ActivityDatesIn
     ) -> dict[str, Any]:
         try:
-            data = await request.json()
             activity = await self.activity_service.get_by_id(activity_id)
             if not activity:
                 raise HTTPException(status_code=404, detail="Activity not found")
 
-            activity.activity_time = datetime.fromisoformat(data["activity_time"])
-            activity.duration = data["duration"]
+            activity.activity_time = data.activity_time
+            activity.duration = data.duration
 
             await self.activity_service.update(activity)
 
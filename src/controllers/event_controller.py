@@ -6,11 +6,19 @@ from typing import Any
 
 from fastapi import Request
 
+from models.activity import Activity
 from models.event import Event
+from models.lodging import Lodging
+from models.user import User
+from request_schemas import EventIn
 from services.activity_service import ActivityService
 from services.event_service import EventService
 from services.lodging_service import LodgingService
 from services.user_service import UserService
+from view_models import ActivityView
+from view_models import EventView
+from view_models import LodgingView
+from view_models import UserView
 
 
 logger = logging.getLogger(__name__)
@@ -30,27 +38,32 @@ class EventController:
         self.lodging_service = lodging_service
         logger.debug("Инициализация EventController")
 
-    async def create_new_event(self, request: Request) -> dict[str, Any]:
+    async def _load_members(
+        self, data: EventIn
+    ) -> tuple[list[User], list[Activity], list[Lodging]]:
+        """Участники, активности и размещения по спискам ID из запроса.
+
+        Каждый список читается одним get_by_ids; порядок ID сохраняется,
+        несуществующие ID пропускаются.
+        """
+        user_ids = data.user_ids
+        activity_ids = data.activity_ids
+        lodging_ids = data.lodging_ids
+        users = await self.user_service.get_by_ids(user_ids)
+        activities = await self.activity_service.get_by_ids(activity_ids)
+        lodgings = await self.lodging_service.get_by_ids(lodging_ids)
+        return (
+            [users[i] for i in user_ids if i in users],
+            [activities[i] for i in activity_ids if i in activities],
+            [lodgings[i] for i in lodging_ids if i in lodgings],
+        )
+
+    async def create_new_event(self, data: EventIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            users = []
-            for user_id in data["user_ids"]:
-                if user := await self.user_service.get_by_id(user_id):
-                    users.append(user)
-            activities = [
-                a
-                for aid in data["activity_ids"]
-                if (a := await self.activity_service.get_by_id(aid)) is not None
-            ]
-
-            lodgings = [
-                ldg
-                for lid in data["lodging_ids"]
-                if (ldg := await self.lodging_service.get_by_id(lid)) is not None
-            ]
+            users, activities, lodgings = await self._load_members(data)
             event = Event(
                 event_id=1,
-                status=data["status"],
+                status=data.status,
                 users=users,
                 activities=activities,
                 lodgings=lodgings,
@@ -130,28 +143,13 @@ class EventController:
             )
             return {"message": "Error completing event", "error": str(e)}
 
-    async def update_event(self, event_id: int, request: Request) -> dict[str, Any]:
+    async def update_event(self, event_id: int, data: EventIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            users = []
-            for user_id in data["user_ids"]:
-                if user := await self.user_service.get_by_id(user_id):
-                    users.append(user)
-            activities = [
-                a
-                for aid in data["activity_ids"]
-                if (a := await self.activity_service.get_by_id(aid)) is not None
-            ]
-
-            lodgings = [
-                ldg
-                for lid in data["lodging_ids"]
-                if (ldg := await self.lodging_service.get_by_id(lid)) is not None
-            ]
+            users, activities, lodgings = await self._load_members(data)
 
             event = Event(
                 event_id=event_id,
-                status=data["status"],
+                status=data.status,
                 users=users,
                 activities=activities,
                 lodgings=lodgings,
@@ -204,47 +202,14 @@ class EventController:
             event_list = await self.event_service.get_all_events()
             events = []
             for t in event_list:
-                activity_list = (
-                    await self.event_service.get_activities_by_event(t.event_id)
-                )
-                lodging_list = (
-                    await self.event_service.get_lodgings_by_event(t.event_id)
-                )
-                user_list = await self.event_service.get_users_by_event(t.event_id)
                 if t.users:
                     events.append(
-                        {
-                            "id": t.event_id,
-                            "status": t.status,
-                            "users": [
-                                {"user_id": u.user_id, "fio": u.fio} for u in user_list
-                            ],
-                            "activities": [
-                                {
-                                    "id": a.activity_id,
-                                    "duration": a.duration,
-                                    "address": a.address,
-                                    "activity_type": a.activity_type,
-                                    "activity_time": a.activity_time.isoformat(),
-                                    "venue": a.venue,
-                                }
-                                for a in activity_list
-                            ],
-                            "lodgings": [
-                                {
-                                    "id": ldg.lodging_id,
-                                    "price": ldg.price,
-                                    "address": ldg.address,
-                                    "name": ldg.name,
-                                    "type": ldg.type,
-                                    "rating": ldg.rating,
-                                    "check_in": ldg.check_in.isoformat(),
-                                    "check_out": ldg.check_out.isoformat(),
-                                    "venue": ldg.venue,
-                                }
-                                for ldg in lodging_list
-                            ],
-                        }
+                        EventView.from_model(
+                            t,
+                            users=await self.event_service.get_users_by_event(t.event_id),
+                            activities=await self.event_service.get_activities_by_event(t.event_id),
+                            lodgings=await self.event_service.get_lodgings_by_event(t.event_id),
+                        )
                     )
 
             logger.info("Получено %d мероприятий", len(events))
@@ -255,3 +220,29 @@ class EventController:
                 "Ошибка при получении списка мероприятий: %s", str(e), exc_info=True
             )
             return {"message": "Error fetching events", "error": str(e)}
+
+    async def get_events_page(self, page: int, page_size: int) -> dict[str, Any]:
+        # Берём на одну запись больше, чтобы узнать, есть ли следующая страница
+        events = await self.event_service.get_page(page_size + 1, (page - 1) * page_size)
+        logger.info("Получено %d мероприятий на странице %d", len(events), page)
+        return {
+            "events": [EventView.from_model(e) for e in events[:page_size]],
+            "page": page,
+            "has_next": len(events) > page_size,
+        }
+
+    async def get_options_page(self, kind: str, offset: int, limit: int) -> dict[str, Any]:
+        """Страница вариантов для выпадающих списков в модальных окнах."""
+        items: list[Any]
+        if kind == "users":
+            items = [UserView.from_model(u) for u in await self.user_service.get_page(limit + 1, offset)]
+        elif kind == "activities":
+            items = [ActivityView.from_model(a) for a in await self.activity_service.get_page(limit + 1, offset)]
+        elif kind == "lodgings":
+            items = [LodgingView.from_model(ldg) for ldg in await self.lodging_service.get_page(limit + 1, offset)]
+        else:
+            raise ValueError(f"Неизвестный список: {kind}")
+        return {
+            "items": items[:limit],
+            "next_offset": offset + limit if len(items) > limit else None,
+        }
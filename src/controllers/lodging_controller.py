@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import logging
 
-from datetime import datetime
 from typing import Any
 
 from fastapi import HTTPException
-from fastapi import Request
 
 from models.lodging import Lodging
+from request_schemas import LodgingDatesIn
+from request_schemas import LodgingIn
 from services.lodging_service import LodgingService
 from services.venue_service import VenueService
+from view_models import LodgingView
 
 
 logger = logging.getLogger(__name__)
@@ -24,12 +25,13 @@ class LodgingController:
         self.venue_service = venue_service
         logger.debug("Инициализация LodgingController")
 
-    async def create_new_lodging(self, request: Request) -> dict[str, Any]:
+    async def create_new_lodging(self, data: LodgingIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["lodging_id"] = 1
-            data["venue"] = await self.venue_service.get_by_id(data["venue"])
-            lodging = Lodging(**data)
+            lodging = Lodging(
+                lodging_id=1,
+                venue=await self.venue_service.get_by_id(data.venue),
+                **data.model_dump(exclude={"venue"}),
+            )
             await self.lodging_service.add(lodging)
             logger.info("Размещение успешно создано: %s", lodging)
             return {
@@ -41,13 +43,14 @@ class LodgingController:
             return {"message": "Error creating lodging", "error": str(e)}
 
     async def update_lodging(
-        self, lodging_id: int, request: Request
+        self, lodging_id: int, data: LodgingIn
     ) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["lodging_id"] = lodging_id
-            data["venue"] = await self.venue_service.get_by_id(data["venue"])
-            lodging = Lodging(**data)
+            lodging = Lodging(
+                lodging_id=lodging_id,
+                venue=await self.venue_service.get_by_id(data.venue),
+                **data.model_dump(exclude={"venue"}),
+            )
             await self.lodging_service.update(lodging)
             logger.info("Размещение ID %d успешно обновлено", lodging_id)
             return {"message": "Lodging updated successfully"}
@@ -95,22 +98,7 @@ class LodgingController:
         try:
             lodging_list = await self.lodging_service.get_list()
             logger.info("Получено %d записей о размещении", len(lodging_list))
-            return {
-                "lodgings": [
-                    {
-                        "id": ldg.lodging_id,
-                        "price": ldg.price,
-                        "address": ldg.address,
-                        "name": ldg.name,
-                        "type": ldg.type,
-                        "rating": ldg.rating,
-                        "check_in": ldg.check_in.isoformat(),
-                        "check_out": ldg.check_out.isoformat(),
-                        "venue": ldg.venue,
-                    }
-                    for ldg in lodging_list
-                ]
-            }
+            return {"lodgings": [LodgingView.from_model(ldg) for ldg in lodging_list]}
         except Exception as e:
             logger.error(
                 "Ошибка при получении списка размещений: %s", str(e), exc_info=True
@@ -132,12 +120,11 @@ class LodgingController:
             return {"message": "Error deleting lodging", "error": str(e)}
 
     async def update_lodging_dates(
-        self, lodging_id: int, request: Request
+        self, lodging_id: int, data: LodgingDatesIn
     ) -> dict[str, Any]:
         try:
-            data = await request.json()
-            check_in = datetime.fromisoformat(data["check_in"])
-            check_out = datetime.fromisoformat(data["check_out"])
+            check_in = data.check_in
+            check_out = data.check_out
 
             lodging = await self.lodging_service.get_by_id(lodging_id)
             if not lodging:
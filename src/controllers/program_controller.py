@@ -7,6 +7,7 @@ from typing import Any
 from fastapi import Request
 
 from models.program import Program
+from request_schemas import ProgramIn
 from services.program_service import ProgramService
 from services.venue_service import VenueService
 
@@ -22,17 +23,17 @@ class ProgramController:
         self.venue_service = venue_service
         logger.debug("Инициализация ProgramController")
 
-    async def create_new_program(self, request: Request) -> dict[str, Any]:
+    async def _build(self, program_id: int, data: ProgramIn) -> Program:
+        return Program(
+            program_id=program_id,
+            start_venue=await self.venue_service.get_by_id(data.start_venue),
+            end_venue=await self.venue_service.get_by_id(data.end_venue),
+            **data.model_dump(exclude={"start_venue", "end_venue"}),
+        )
+
+    async def create_new_program(self, data: ProgramIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["program_id"] = 1
-            data["start_venue"] = await self.venue_service.get_by_id(
-                data["start_venue"]
-            )
-            data["end_venue"] = await self.venue_service.get_by_id(
-                data["end_venue"]
-            )
-            program = Program(**data)
+            program = await self._build(1, data)
             await self.program_service.add(program)
             logger.info("Программа успешно создана: %s", program)
             return {"message": "Program created successfully"}
@@ -43,18 +44,10 @@ class ProgramController:
             return {"message": "Error creating program", "error": str(e)}
 
     async def update_program(
-        self, program_id: int, request: Request
+        self, program_id: int, data: ProgramIn
     ) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["program_id"] = program_id
-            data["start_venue"] = await self.venue_service.get_by_id(
-                data["start_venue"]
-            )
-            data["end_venue"] = await self.venue_service.get_by_id(
-                data["end_venue"]
-            )
-            program = Program(**data)
+            program = await self._build(program_id, data)
             await self.program_service.update(program)
             logger.info("Программа ID %d успешно обновлена", program_id)
             return {"message": "Program updated successfully"}
@@ -3,19 +3,31 @@ from __future__ import annotations
 import logging
 
 from datetime import datetime
+from datetime import time
 from typing import Any
 
 from fastapi import HTTPException
 from fastapi import Request
 
+from abstract_repository.include import SHALLOW
 from models.session import Session
 from models.event import Event
+from request_schemas import JoinSessionIn
+from request_schemas import SessionExtendIn
+from request_schemas import SessionIn
+from request_schemas import SessionVenueDeleteIn
+from request_schemas import SessionVenueIn
+from request_schemas import TransferTypeIn
+from request_schemas import UserSessionIn
 from services.activity_service import ActivityService
 from services.lodging_service import LodgingService
 from services.program_service import ProgramService
 from services.session_service import SessionService
 from services.event_service import EventService
 from services.user_service import UserService
+from view_models import EventView
+from view_models import ProgramView
+from view_models import SessionView
 
 
 logger = logging.getLogger(__name__)
@@ -39,55 +51,52 @@ class SessionController:
         self.lodging_service = lodging_service
         logger.debug("Инициализация SessionController")
 
-    async def create_new_session_user(self, request: Request) -> dict[str, Any]:
-        try:
-            data = await request.json()
-            try:
-                data["start_time"] = datetime.strptime(data["start_date"], "%d.%m.%Y")
-                data["end_time"] = datetime.strptime(data["end_date"], "%d.%m.%Y")
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Неверный формат даты. Используйте ДД.ММ.ГГГГ",
-                )
+    async def _build(self, session_id: int, data: SessionIn) -> Session:
+        return Session(
+            session_id=session_id,
+            program=await self.program_service.get_by_id(data.program_id),
+            event=await self.event_service.get_by_id(data.event_id),
+            start_time=data.start_time,
+            end_time=data.end_time,
+            type=data.type,
+        )
 
+    async def create_new_session_user(self, data: UserSessionIn) -> dict[str, Any]:
+        try:
             program = await self.program_service.get_by_venues(
-                int(data["start_venue"]),
-                int(data["end_venue"]),
-                data["transfer_type"],
+                data.start_venue, data.end_venue, data.transfer_type
             )
 
             if not program:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Программа между площадками {data['start_venue']} и {data['end_venue']} не найдена",
+                    detail=f"Программа между площадками {data.start_venue} и {data.end_venue} не найдена",
                 )
 
-            data["program"] = program
-            data["session_id"] = 1
-            data["type"] = "Личные"
             logger.info("Создание сессии с данными: %s", data)
-            user = await self.user_service.get_by_id(int(data.get("user_id")))
+            user = await self.user_service.get_by_id(data.user_id)
             if not user:
-                raise
+                raise HTTPException(status_code=400, detail="User not found")
+            activity_ids = data.activities
+            lodging_ids = data.lodgings
+            activities = await self.activity_service.get_by_ids(activity_ids)
+            lodgings = await self.lodging_service.get_by_ids(lodging_ids)
             event = Event(
                 event_id=1,
                 status="Активное",
                 users=[user],
-                activities=[
-                    a
-                    for aid in data.get("activities[]")
-                    if (a := await self.activity_service.get_by_id(int(aid))) is not None
-                ],
-                lodgings=[
-                    ldg
-                    for lid in data.get("lodgings[]")
-                    if (ldg := await self.lodging_service.get_by_id(int(lid))) is not None
-                ],
+                activities=[activities[i] for i in activity_ids if i in activities],
+                lodgings=[lodgings[i] for i in lodging_ids if i in lodgings],
+            )
+            event = await self.event_service.add(event)
+            session = Session(
+                session_id=1,
+                program=program,
+                event=event,
+                start_time=data.start_date,
+                end_time=data.end_date,
+                type="Личные",
             )
-            data["event"] = await self.event_service.add(event)
-
-            session = Session(**data)
             created_session = await self.session_service.add(session)
 
             logger.info("Сессия успешно создана, ID: %d", created_session.session_id)
@@ -105,15 +114,9 @@ class SessionController:
                 status_code=500, detail=f"Ошибка при создании сессии: {e!s}"
             )
 
-    async def create_new_session(self, request: Request) -> dict[str, Any]:
+    async def create_new_session(self, data: SessionIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            program_id = data.get("program_id")
-            data["program"] = await self.program_service.get_by_id(program_id)
-            event_id = data.get("event_id")
-            data["event"] = await self.event_service.get_by_id(event_id)
-            data["session_id"] = 1
-            session = Session(**data)
+            session = await self._build(1, data)
             await self.session_service.add(session)
             logger.info("Сессия успешно создана: %s", session)
             return {"message": "Session created successfully"}
@@ -121,25 +124,15 @@ class SessionController:
             logger.error("Ошибка при создании сессии: %s", str(e), exc_info=True)
             return {"message": "Error creating session", "error": str(e)}
 
-    async def add_new_venue(self, request: Request) -> dict[str, Any]:
+    async def add_new_venue(self, data: SessionVenueIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            event_id = int(data.get("event_id"))
-            new_venue_id = int(data.get("new_venue_id"))
-            after_venue_id = int(data.get("after_venue_id"))
-            transfer_type = data.get("transfer_type")
-
-            if not event_id or not new_venue_id or not after_venue_id:
-                logger.warning("Отсутствуют обязательные поля в запросе")
-                return {"message": "Missing required fields in request"}
-
             await self.session_service.insert_venue_after(
-                event_id, new_venue_id, after_venue_id, transfer_type
+                data.event_id, data.new_venue_id, data.after_venue_id, data.transfer_type
             )
             logger.info(
                 "Площадка ID %d успешно добавлена в сессию после площадки %d",
-                new_venue_id,
-                after_venue_id,
+                data.new_venue_id,
+                data.after_venue_id,
             )
             return {"message": "Venue added to session successfully"}
         except Exception as e:
@@ -151,27 +144,12 @@ class SessionController:
     async def get_session_parts(self, session_id: int) -> list[dict[str, Any]]:
         return await self.session_service.get_session_parts(session_id)
 
-    async def delete_venue_from_session(self, request: Request) -> dict[str, Any]:
+    async def delete_venue_from_session(
+        self, data: SessionVenueDeleteIn
+    ) -> dict[str, Any]:
+        venue_id = data.venue_id
+        event_id = data.event_id
         try:
-            data = await request.json()
-            venue_id = data.get("venue_id")
-            event_id = data.get("event_id")
-
-            if not venue_id or not event_id:
-                logger.warning(
-                    "Недостаточно данных в запросе: venue_id=%s, event_id=%s",
-                    venue_id,
-                    event_id,
-                )
-                return {"success": False, "message": "Требуются venue_id и event_id"}
-
-            try:
-                venue_id = int(venue_id)
-                event_id = int(event_id)
-            except (TypeError, ValueError) as e:
-                logger.warning("Некорректные ID в запросе: %s", str(e))
-                return {"success": False, "message": "ID должны быть целыми числами"}
-
             await self.session_service.delete_venue_from_session(event_id, venue_id)
 
             logger.info(
@@ -198,16 +176,10 @@ class SessionController:
             }
 
     async def update_session(
-        self, session_id: int, request: Request
+        self, session_id: int, data: SessionIn
     ) -> dict[str, Any]:
         try:
-            data = await request.json()
-            program_id = data.get("program_id")
-            data["program"] = await self.program_service.get_by_id(program_id)
-            event_id = data.get("event_id")
-            data["event"] = await self.event_service.get_by_id(event_id)
-            data["session_id"] = session_id
-            session = Session(**data)
+            session = await self._build(session_id, data)
             await self.session_service.update(session)
             logger.info("Сессия ID %d успешно обновлена", session_id)
             return {"message": "Session updated successfully"}
@@ -221,15 +193,11 @@ class SessionController:
             return {"message": "Error updating session", "error": str(e)}
 
     async def change_transfer_type(
-        self, session_id: int, request: Request
+        self, session_id: int, data: TransferTypeIn
     ) -> dict[str, Any]:
+        new_transfer_type = data.transfer_type
+        program_id = data.program_id
         try:
-            data = await request.json()
-            new_transfer_type = data.get("transfer_type")
-            program_id = data.get("program_id")
-            if not session_id or not new_transfer_type:
-                logger.warning("Отсутствуют обязательные поля в запросе")
-                return {"message": "Missing required fields in request"}
             new_session = await self.session_service.change_transfer_type(
                 program_id, session_id, new_transfer_type
             )
@@ -261,7 +229,7 @@ class SessionController:
             if session_id is None:
                 logger.warning("ID сессии не передан в запросе")
                 return {"message": "Missing 'id' in request"}
-            session = await self.session_service.get_by_id(session_id)
+            session = await self.session_service.get_by_id(session_id, include=SHALLOW)
             if session and session.program is not None and session.event is not None:
                 logger.info("Сессия ID %d найдена: %s", session_id, session)
                 return {
@@ -305,88 +273,7 @@ class SessionController:
             sessions = []
             for s in session_list:
                 if s and s.program and s.event:
-                    event_users = await self.event_service.get_users_by_event(
-                        s.event.event_id
-                    )
-                    sessions.append(
-                        {
-                            "id": s.session_id,
-                            "start_time": (
-                                s.start_time.isoformat() if s.start_time else None
-                            ),
-                            "end_time": s.end_time.isoformat() if s.end_time else None,
-                            "type": s.type,
-                            "program": (
-                                {
-                                    "id": s.program.program_id,
-                                    "transfer_type": s.program.transfer_type,
-                                    "cost": s.program.cost,
-                                    "transfer_duration_minutes": s.program.transfer_duration_minutes,
-                                    "start_venue": (
-                                        s.program.start_venue.name
-                                        if s.program.start_venue
-                                        else None
-                                    ),
-                                    "end_venue": (
-                                        s.program.end_venue.name
-                                        if s.program.end_venue
-                                        else None
-                                    ),
-                                }
-                                if s.program
-                                else None
-                            ),
-                            "event": (
-                                {
-                                    "id": s.event.event_id,
-                                    "status": s.event.status,
-                                    "users": [
-                                        {
-                                            "id": u.user_id,
-                                            "fio": u.fio,
-                                            "email": u.email,
-                                        }
-                                        for u in event_users
-                                    ],
-                                    "activities": [
-                                        {
-                                            "id": a.activity_id,
-                                            "activity_type": a.activity_type,
-                                            "address": a.address,
-                                            "duration": a.duration,
-                                            "activity_time": a.activity_time.isoformat(),
-                                            "venue": a.venue,
-                                        }
-                                        for a in (
-                                            await self.event_service.get_activities_by_event(
-                                                s.event.event_id
-                                            )
-                                        )
-                                    ],
-                                    "lodgings": [
-                                        {
-                                            "id": ldg.lodging_id,
-                                            "name": ldg.name,
-                                            "address": ldg.address,
-                                            "price": ldg.price,
-                                            "type": ldg.type,
-                                            "rating": ldg.rating,
-                                            "check_in": ldg.check_in.isoformat(),
-                                            "check_out": ldg.check_out.isoformat(),
-                                            "venue": ldg.venue,
-                                        }
-                                        for ldg in (
-                                            await self.event_service.get_lodgings_by_event(
-                                                s.event.event_id
-                                            )
-                                        )
-                                    ],
-                                }
-                                if s.event
-                                else None
-                            ),
-                        }
-                    )
+                    sessions.append(SessionView.from_model(s, EventView.from_model(s.event)))
             logger.info("Получено %d сессий", len(sessions))
             return {"sessions": sessions}
         except Exception as e:
@@ -395,35 +282,44 @@ class SessionController:
             )
             return {"message": "Error fetching sessions", "error": str(e)}
 
+    async def get_sessions_page(self) -> dict[str, Any]:
+        overview = await self.session_service.get_sessions_overview()
+        events = {row["id"]: EventView.from_row(row) for row in overview["events"]}
+        programs = {row["id"]: ProgramView(**row) for row in overview["programs"]}
+        sessions = [
+            SessionView(
+                id=row["id"],
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+                type=row["type"],
+                program=programs[row["program_id"]],
+                event=events[row["event_id"]],
+            )
+            for row in overview["sessions"]
+            if row["program_id"] in programs and row["event_id"] in events
+        ]
+        logger.info("Получено %d сессий", len(sessions))
+        return {
+            "sessions": sessions,
+            "events": list(events.values()),
+            "programs": list(programs.values()),
+        }
+
     async def change_session_duration(
-        self, session_id: int, request: Request
+        self, session_id: int, data: SessionExtendIn
     ) -> dict[str, Any]:
+        new_end_date = datetime.combine(data.new_end_date, time.min)
         try:
-            data = await request.json()
-            new_end_date = data.get("new_end_date")
-            if not new_end_date:
-                raise HTTPException(status_code=400, detail="new_end_date is required")
-            session_data = await self.session_service.get_by_id(session_id)
+            # Один UPDATE: сравнение с текущей датой окончания делает база
+            try:
+                session_data = await self.session_service.extend(session_id, new_end_date)
+            except ValueError as e:
+                return {"message": "Invalid date", "error": str(e)}
             if not session_data:
                 return {
                     "message": "Session not found",
                     "error": f"Session with id {session_id} not found",
                 }
-            current_end_date = session_data.end_time
-            try:
-                new_end_date = datetime.strptime(new_end_date, "%Y-%m-%d")
-            except ValueError:
-                return {
-                    "message": "Invalid date format",
-                    "error": "new_end_date must be in YYYY-MM-DD format",
-                }
-            if new_end_date <= current_end_date:
-                return {
-                    "message": "Invalid date",
-                    "error": f"New end date {new_end_date} must be after current end date {current_end_date}",
-                }
-            session_data.end_time = new_end_date
-            await self.session_service.update(session_data)
 
             logger.info(
                 "Сессия ID %d успешно продлена до %s", session_id, new_end_date
@@ -442,34 +338,16 @@ class SessionController:
             )
             return {"message": "Error updating session", "error": str(e)}
 
-    async def join_to_event(self, session_id: int, request: Request) -> dict[str, Any]:
-        data = await request.json()
-        user_id = data.get("user_id")
-        if not user_id:
-            raise HTTPException(status_code=400, detail="User ID is required")
-        user = await self.user_service.get_by_id(user_id)
-        session = await self.session_service.get_by_id(session_id)
-        if not session:
+    async def join_to_event(
+        self, session_id: int, data: JoinSessionIn
+    ) -> dict[str, Any]:
+        user_id = data.user_id
+        try:
+            personal = await self.session_service.join_event(session_id, user_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if personal is None:
             return {"message": "Session not found"}
-        session.type = "Личные"
-        if session.event:
-            current_users = await self.event_service.get_users_by_event(
-                session.event.event_id
-            )
-
-        if user is not None and any(
-            u.user_id == user.user_id for u in current_users if u is not None
-        ):
-            raise HTTPException(
-                status_code=400, detail="User already joined this event"
-            )
-        if session.event and user:
-            await self.event_service.link_users(
-                session.event.event_id,
-                [u.user_id for u in current_users] + [user.user_id],
-            )
-
-        await self.session_service.add(session)
 
         logger.info(
             "Пользователь %d присоединился к сессии %d", user_id, session_id
@@ -477,5 +355,6 @@ class SessionController:
         return {
             "message": "Вы успешно присоединились к мероприятию",
             "session_id": session_id,
+            "personal_session_id": personal.session_id,
             "new_type": "Личные",
         }
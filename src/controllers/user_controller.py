@@ -5,9 +5,11 @@ import logging
 from typing import Any
 
 from fastapi import HTTPException
-from fastapi import Request
 
 from models.user import User
+from request_schemas import AdminUpdateIn
+from request_schemas import LoginIn
+from request_schemas import UserIn
 from services.user_service import AuthService
 from services.user_service import UserService
 
@@ -73,12 +75,9 @@ class UserController:
             )
             return {"message": "Error fetching users", "error": str(e)}
 
-    async def registrate(self, request: Request) -> dict[str, Any]:
+    async def registrate(self, data: UserIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["user_id"] = 1
-            # data['password'] = self.auth_service.get_password_hash(data['password'])
-            user = User(**data)
+            user = User(user_id=1, **data.model_dump())
             registered_user = await self.auth_service.registrate(user)
             token = self.auth_service.create_access_token(registered_user)
             logger.info("Пользователь успешно зарегистрирован: %s", registered_user)
@@ -92,14 +91,14 @@ class UserController:
             logger.error("Registration error: %s", str(e))
             raise HTTPException(status_code=400, detail=str(e))
 
-    async def create_admin(self, request: Request) -> dict[str, Any]:
+    async def create_admin(self, data: UserIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            if "password" in data:
-                data["password"] = self.auth_service.get_password_hash(data["password"])
-            data["user_id"] = 1
-            data["is_admin"] = True
-            user = User(**data)
+            user = User(
+                user_id=1,
+                is_admin=True,
+                **data.model_dump(exclude={"password"}),
+                password=await self.auth_service.hash_password(data.password),
+            )
             registered_admin = await self.user_service.add(user)
             logger.info("Администратор успешно зарегистрирован: %s", registered_admin)
             return {
@@ -112,10 +111,9 @@ class UserController:
             )
             return {"message": "Error during registration", "error": str(e)}
 
-    async def login(self, request: Request) -> dict[str, Any]:
+    async def login(self, data: LoginIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            user = await self.auth_service.authenticate(data["login"], data["password"])
+            user = await self.auth_service.authenticate(data.login, data.password)
             if user is None:
                 raise HTTPException(status_code=401, detail="Invalid login or password")
             logger.info("Пользователь успешно авторизировался: %s", user)
@@ -150,9 +148,8 @@ class UserController:
             )
             return {"message": "Error deleting user", "error": str(e)}
 
-    async def update_admin(self, user_id: int, request: Request) -> dict[str, Any]:
+    async def update_admin(self, user_id: int, data: AdminUpdateIn) -> dict[str, Any]:
         try:
-            data = await request.json()
             admin_old = await self.user_service.get_by_id(user_id)
             if admin_old is None:
                 return {
@@ -165,7 +162,7 @@ class UserController:
                 "password": admin_old.password,
                 "user_id": user_id,
                 "is_admin": True,
-                **data,
+                **data.model_dump(exclude_unset=True),
             }
             user = User(**user_data)
             admin = await self.user_service.update(user)
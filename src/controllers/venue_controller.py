@@ -7,6 +7,7 @@ from typing import Any
 from fastapi import Request
 
 from models.venue import Venue
+from request_schemas import VenueIn
 from services.venue_service import VenueService
 
 
@@ -18,11 +19,9 @@ class VenueController:
         self.venue_service = venue_service
         logger.debug("Инициализация VenueController")
 
-    async def create_new_venue(self, request: Request) -> dict[str, Any]:
+    async def create_new_venue(self, data: VenueIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["venue_id"] = 1
-            venue = Venue(**data)
+            venue = Venue(venue_id=1, **data.model_dump())
             await self.venue_service.add(venue)
             logger.info("Площадка успешно создана: %s", venue)
             return {"message": "Venue created successfully"}
@@ -30,11 +29,9 @@ class VenueController:
             logger.error("Ошибка при создании площадки: %s", str(e), exc_info=True)
             return {"message": "Error creating venue", "error": str(e)}
 
-    async def update_venue(self, venue_id: int, request: Request) -> dict[str, Any]:
+    async def update_venue(self, venue_id: int, data: VenueIn) -> dict[str, Any]:
         try:
-            data = await request.json()
-            data["venue_id"] = venue_id
-            venue = Venue(**data)
+            venue = Venue(venue_id=venue_id, **data.model_dump())
             await self.venue_service.update(venue)
             logger.info("Площадка ID %d успешно обновлена", venue_id)
             return {"message": "Venue updated successfully"}
@@ -10,22 +10,28 @@ from fastapi import FastAPI
 from fastapi import Request
 from fastapi.responses import HTMLResponse
 from fastapi.responses import JSONResponse
-from fastapi.templating import Jinja2Templates
 
+from compression import setup_compression
 from logger import setup_logging
+from password_hashing import password_hasher
 from routers.activity import activity_router
+from routers.api_v2 import api_v2_router
 from routers.event import event_router
 from routers.lodging import lodging_router
+from routers.metrics import metrics_router
 from routers.program import program_router
 from routers.session import session_router
+from routers.static import static_router
 from routers.user import user_router
 from routers.venue import venue_router
 from routers.external_service import external_service_router
+from settings import settings
+from static_assets import static_assets
+from templating import precompile_templates
+from templating import templates
 from tracing import setup_tracing
 
 
-templates = Jinja2Templates(directory="templates")
-
 setup_logging()
 logger = logging.getLogger(__name__)
 
@@ -33,12 +39,17 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Запуск приложения")
+    static_assets.load()
+    if settings.TEMPLATE_PRECOMPILE:
+        precompile_templates(fail_fast=settings.TEMPLATE_FAIL_FAST)
     yield
+    password_hasher.shutdown()
     logger.info("Завершение работы приложения")
 
 
 app = FastAPI(lifespan=lifespan)
 setup_tracing(app)
+setup_compression(app)
 routers = [
     session_router,
     program_router,
@@ -48,6 +59,9 @@ routers = [
     event_router,
     activity_router,
     external_service_router,
+    metrics_router,
+    api_v2_router,
+    static_router,
 ]
 
 for r in routers:
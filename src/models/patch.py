@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Collection
+from typing import Mapping
+
+from pydantic import BaseModel
+
+
+def validate_changes(
+    model: type[BaseModel], changes: Any, allowed: Collection[str]
+) -> dict[str, Any]:
+    """Проверяет валидаторами модели только переданные поля (для PATCH).
+
+    Остальные поля сущности не читаются и не проверяются. Ошибка — ValueError
+    (pydantic.ValidationError тоже его подкласс).
+    """
+    if not isinstance(changes, Mapping) or not changes:
+        raise ValueError("Нужен непустой объект с изменяемыми полями")
+    unknown = sorted(set(changes) - set(allowed))
+    if unknown:
+        raise ValueError(f"Эти поля нельзя изменить: {', '.join(unknown)}")
+    draft = model.model_construct()
+    for name, value in changes.items():
+        model.__pydantic_validator__.validate_assignment(draft, name, value)
+    return {name: getattr(draft, name) for name in changes}
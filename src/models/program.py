@@ -5,6 +5,7 @@ from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
 
+from models.unloaded import Unloaded
 from models.venue import Venue
 
 
@@ -13,10 +14,10 @@ class Program(BaseModel):
     transfer_type: str
     cost: int
     transfer_duration_minutes: int
-    start_venue: Venue | None = Field(
+    start_venue: Venue | Unloaded | None = Field(
         default=None, description="Площадка отправления"
     )
-    end_venue: Venue | None = Field(
+    end_venue: Venue | Unloaded | None = Field(
         default=None, description="Площадка назначения"
     )
     model_config = ConfigDict(populate_by_name=True)
@@ -54,14 +55,14 @@ class Program(BaseModel):
 
     @field_validator("start_venue")
     @classmethod
-    def check_start_venue(cls, value: Venue | None) -> Venue | None:
-        if value is not None and not isinstance(value, Venue):
+    def check_start_venue(cls, value: Venue | Unloaded | None) -> Venue | Unloaded | None:
+        if value is not None and not isinstance(value, (Venue, Unloaded)):
             raise ValueError("start_venue должен быть экземпляром Venue")
         return value
 
     @field_validator("end_venue")
     @classmethod
-    def check_end_venue(cls, value: Venue | None) -> Venue | None:
-        if value is not None and not isinstance(value, Venue):
+    def check_end_venue(cls, value: Venue | Unloaded | None) -> Venue | Unloaded | None:
+        if value is not None and not isinstance(value, (Venue, Unloaded)):
             raise ValueError("end_venue должен быть экземпляром Venue")
         return value
@@ -10,14 +10,15 @@ from pydantic import field_validator
 
 from models.program import Program
 from models.event import Event
+from models.unloaded import Unloaded
 
 
 class Session(BaseModel):
     session_id: int
-    program: Program | None = Field(
+    program: Program | Unloaded | None = Field(
         default=None, description="Программа сессии"
     )
-    event: Event | None = Field(default=None, description="Мероприятие")
+    event: Event | Unloaded | None = Field(default=None, description="Мероприятие")
     start_time: datetime
     end_time: datetime
     type: str
@@ -33,23 +34,23 @@ class Session(BaseModel):
 
     @field_validator("program")
     @classmethod
-    def check_program(cls, value: Program | None) -> Program | None:
-        if value is not None and not isinstance(value, Program):
+    def check_program(cls, value: Program | Unloaded | None) -> Program | Unloaded | None:
+        if value is not None and not isinstance(value, (Program, Unloaded)):
             raise ValueError("program должен быть экземпляром Program")
         return value
 
     @field_validator("end_time")
     @classmethod
     def check_datetime_order(cls, value: datetime, values: ValidationInfo) -> datetime:
-        entry_time = values.data["start_time"]
+        entry_time = values.data.get("start_time")
         if entry_time and value <= entry_time:
             raise ValueError("end_time должен быть позже start_time")
         return value
 
     @field_validator("event")
     @classmethod
-    def check_event(cls, value: Event | None) -> Event | None:
-        if value is not None and not isinstance(value, Event):
+    def check_event(cls, value: Event | Unloaded | None) -> Event | Unloaded | None:
+        if value is not None and not isinstance(value, (Event, Unloaded)):
             raise ValueError("event должен быть экземпляром Event")
         return value
 
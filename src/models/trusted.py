@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+
+M = TypeVar("M", bound=BaseModel)
+
+_Plan = tuple[tuple[tuple[str, Any], ...], tuple[tuple[str, Callable[[], Any]], ...]]
+
+_plans: dict[type[BaseModel], _Plan] = {}
+_set = object.__setattr__
+
+
+def _plan(model: type[BaseModel]) -> _Plan:
+    defaults = []
+    factories = []
+    for name, field in model.model_fields.items():
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))
+        elif field.default is not PydanticUndefined:
+            defaults.append((name, field.default))
+    return tuple(defaults), tuple(factories)  # type: ignore[return-value]
+
+
+def trusted(model: type[M], **values: Any) -> M:
+    """Модель из строки нашей же БД — без валидации.
+
+    Данные уже прошли валидацию при записи и ограничения таблиц, поэтому
+    field_validator'ы (регулярки, isinstance по спискам) повторно не
+    запускаются. Как model_construct, но без его обхода всех полей на каждый
+    вызов: значения по умолчанию вычисляются один раз на класс.
+    Для пользовательского ввода — только обычный конструктор.
+    """
+    if model.__private_attributes__:
+        return model.model_construct(**values)
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = _plan(model)
+    fields_set = set(values)
+    defaults, factories = plan
+    for name, default in defaults:
+        if name not in values:
+            values[name] = default
+    for name, factory in factories:
+        if name not in values:
+            values[name] = factory()
+    obj = model.__new__(model)
+    _set(obj, "__dict__", values)
+    _set(obj, "__pydantic_fields_set__", fields_set)
+    _set(obj, "__pydantic_extra__", None)
+    _set(obj, "__pydantic_private__", None)
+    return obj
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+
+class RelationNotLoadedError(RuntimeError):
+    """Обращение к полю связи, которую не загрузили (см. include в репозиториях)."""
+
+
+class Unloaded:
+    """Связь, не загруженная по include: известен только её ID.
+
+    Читается лишь атрибут <kind>_id (например, event_id). Любое другое поле
+    приводит к RelationNotLoadedError, а не к пустому значению.
+    """
+
+    __slots__ = ("id", "kind")
+
+    def __init__(self, kind: str, entity_id: int) -> None:
+        self.kind = kind
+        self.id = entity_id
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name in self.__slots__:
+            raise AttributeError(name)
+        if name == f"{self.kind}_id":
+            return self.id
+        raise RelationNotLoadedError(
+            f"Связь {self.kind} (ID {self.id}) не загружена: поле {name} недоступно"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Unloaded)
+            and other.kind == self.kind
+            and other.id == self.id
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.kind, self.id))
+
+    def __repr__(self) -> str:
+        return f"Unloaded({self.kind!r}, {self.id})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: {f"{value.kind}_id": value.id, "loaded": False}
+            ),
+        )
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+
+from collections import OrderedDict
+from typing import Callable
+from typing import Collection
+from typing import Iterable
+
+from settings import settings
+
+
+class NegativeCache:
+    """Короткоживущий кэш промахов get_by_id.
+
+    Запоминает, что сущности с данным ID нет, чтобы повторные запросы
+    по несуществующим ссылкам не доходили до базы. Запись снимается по TTL
+    или явно, когда сущность с этим ID добавлена.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._misses: OrderedDict[tuple[str, int], float] = OrderedDict()
+        self.hits = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def is_missing(self, kind: str, entity_id: int) -> bool:
+        key = (kind, entity_id)
+        expires_at = self._misses.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= self._clock():
+            del self._misses[key]
+            return False
+        self.hits += 1
+        return True
+
+    def remember(self, kind: str, entity_id: int) -> None:
+        if not self.enabled:
+            return
+        key = (kind, entity_id)
+        self._misses[key] = self._clock() + self.ttl
+        self._misses.move_to_end(key)
+        while len(self._misses) > self.max_size:
+            self._misses.popitem(last=False)
+
+    def unknown(self, kind: str, entity_ids: Iterable[int]) -> list[int]:
+        """ID для запроса get_by_ids: без повторов и без заведомо отсутствующих."""
+        return [i for i in dict.fromkeys(entity_ids) if not self.is_missing(kind, i)]
+
+    def remember_absent(
+        self, kind: str, entity_ids: Iterable[int], found: Collection[int]
+    ) -> None:
+        for entity_id in entity_ids:
+            if entity_id not in found:
+                self.remember(kind, entity_id)
+
+    def forget(self, kind: str, entity_id: int | None) -> None:
+        if entity_id is not None:
+            self._misses.pop((kind, entity_id), None)
+
+    def clear(self) -> None:
+        self._misses.clear()
+
+    def stats(self) -> dict[str, float]:
+        return {"size": len(self._misses), "hits": self.hits, "ttl": self.ttl}
+
+
+negative_cache = NegativeCache(
+    settings.NEGATIVE_CACHE_TTL_SEC, settings.NEGATIVE_CACHE_MAX_SIZE
+)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+
+import bcrypt
+
+from settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def hash_password(password: str, rounds: int = 12) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+def hash_rounds(hashed_password: str | bytes) -> int | None:
+    """Стоимость bcrypt-хеша: "$2b$12$..." -> 12."""
+    if isinstance(hashed_password, bytes):
+        hashed_password = hashed_password.decode("utf-8", "replace")
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def check_password(plain_password: str, hashed_password: str | bytes) -> bool:
+    try:
+        hash_bytes = (
+            hashed_password.encode("utf-8")
+            if isinstance(hashed_password, str)
+            else hashed_password
+        )
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hash_bytes)
+    except Exception as e:
+        logger.error(f"Password verification failed: {e!s}")
+        return False
+
+
+def _started(fn: Callable[..., Any], *args: Any) -> tuple[float, Any]:
+    # time.time, а не monotonic: в режиме process часы должны совпадать между процессами
+    return time.time(), fn(*args)
+
+
+class PasswordHasher:
+    """bcrypt вне event loop'а.
+
+    Хеширование и проверка пароля занимают сотни миллисекунд CPU, поэтому
+    выполняются в отдельном пуле (потоки — bcrypt отпускает GIL — или процессы)
+    не больше чем по max_workers одновременно. Остальные ждут в очереди пула,
+    время ожидания попадает в stats(). Новые хеши получают стоимость rounds.
+    """
+
+    def __init__(self, max_workers: int, mode: str = "thread", rounds: int = 12) -> None:
+        self.max_workers = max(1, max_workers)
+        self.mode = mode
+        self.rounds = rounds
+        self.rehashed = 0
+        self._executor: Executor | None = None
+        self.in_flight = 0
+        self.completed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_total = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="bcrypt"
+                )
+            logger.info("Пул bcrypt: %s, воркеров %d", self.mode, self.max_workers)
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        self.in_flight += 1
+        try:
+            started, result = await loop.run_in_executor(
+                self._get_executor(), _started, fn, *args
+            )
+        finally:
+            self.in_flight -= 1
+        waited = max(0.0, started - submitted)
+        self.completed += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        self.run_total += time.time() - started
+        return result
+
+    async def hash(self, password: str) -> str:
+        return str(await self.run(hash_password, password, self.rounds))
+
+    def needs_rehash(self, hashed_password: str | bytes) -> bool:
+        rounds = hash_rounds(hashed_password)
+        return rounds is not None and rounds != self.rounds
+
+    async def verify(self, plain_password: str, hashed_password: str | bytes) -> bool:
+        return bool(await self.run(check_password, plain_password, hashed_password))
+
+    def stats(self) -> dict[str, Any]:
+        done = self.completed or 1
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "rounds": self.rounds,
+            "rehashed": self.rehashed,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.max_workers),
+            "completed": self.completed,
+            "queue_wait_avg_ms": round(self.wait_total / done * 1000, 3),
+            "queue_wait_max_ms": round(self.wait_max * 1000, 3),
+            "run_avg_ms": round(self.run_total / done * 1000, 3),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    settings.BCRYPT_MAX_WORKERS, settings.BCRYPT_EXECUTOR, settings.BCRYPT_ROUNDS
+)
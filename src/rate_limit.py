@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import logging
+import math
+import time
+
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from collections import defaultdict
+from typing import Any
+from typing import Callable
+
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Request
+
+from settings import settings
+
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # общий backend нужен только при RATE_LIMIT_BACKEND=redis
+    redis = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBackend(ABC):
+    """Хранилище token bucket'ов."""
+
+    @abstractmethod
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Забирает токен из ведра key; 0 — можно, иначе секунды до следующего токена."""
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Вёдра в памяти процесса, разбитые на шарды по хэшу ключа.
+
+    В каждом шарде не больше max_keys / shards вёдер: при переполнении
+    вытесняется давно не использованное (оно почти наверняка уже полное,
+    и новое ведро для того же ключа ничем не отличается).
+    """
+
+    def __init__(
+        self,
+        max_keys: int,
+        shards: int = 16,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.shard_size = max(1, max_keys // max(1, shards))
+        self._shards: list[OrderedDict[str, tuple[float, float]]] = [
+            OrderedDict() for _ in range(max(1, shards))
+        ]
+        self._clock = clock
+        self.evicted = 0
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        shard = self._shards[hash(key) % len(self._shards)]
+        now = self._clock()
+        tokens, updated = shard.get(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        shard[key] = (tokens, now)
+        shard.move_to_end(key)
+        if len(shard) > self.shard_size:
+            shard.popitem(last=False)
+            self.evicted += 1
+        return wait
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "memory",
+            "buckets": sum(len(shard) for shard in self._shards),
+            "evicted": self.evicted,
+        }
+
+
+_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+return tostring(wait)
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Вёдра в Redis, общие для всех воркеров; одно ведро — один вызов Lua-скрипта."""
+
+    def __init__(self, url: str, prefix: str = "event-manager:rate:") -> None:
+        if redis is None:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis требует пакет redis")
+        self._client = redis.from_url(url)
+        self._take = self._client.register_script(_TAKE_SCRIPT)
+        self.prefix = prefix
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        wait = await self._take(keys=[self.prefix + key], args=[rate, burst, time.time()])
+        return float(wait)
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": "redis"}
+
+
+class RateLimiter:
+    """Token bucket для эндпоинтов входа: отдельно по IP клиента и по логину.
+
+    Проверка идёт до обращения к БД и bcrypt; при пустом ведре — 429 с
+    Retry-After.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        limits: dict[str, tuple[float, int]],
+        enabled: bool = True,
+        trust_proxy: bool = False,
+    ) -> None:
+        self.backend = backend
+        # scope -> (токенов в секунду, размер ведра)
+        self.limits = limits
+        self.enabled = enabled
+        self.trust_proxy = trust_proxy
+        self._allowed: defaultdict[str, int] = defaultdict(int)
+        self._limited: defaultdict[str, int] = defaultdict(int)
+
+    def client_ip(self, request: Request) -> str:
+        if self.trust_proxy:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",")[0].strip()
+        return request.client.host if request.client else "unknown"
+
+    async def check(self, request: Request, login: str | None = None) -> None:
+        if not self.enabled:
+            return
+        keys = [("ip", self.client_ip(request))]
+        if login:
+            keys.append(("login", login.strip().lower()))
+        for scope, value in keys:
+            rate, burst = self.limits[scope]
+            wait = await self.backend.take(f"{scope}:{value}", rate, burst)
+            if wait > 0:
+                self._limited[scope] += 1
+                logger.warning("Превышен лимит запросов %s=%s на %s", scope, value, request.url.path)
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many requests",
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
+            self._allowed[scope] += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            **self.backend.stats(),
+            "scopes": {
+                scope: {
+                    "rate_per_min": rate * 60,
+                    "burst": burst,
+                    "allowed": self._allowed[scope],
+                    "limited": self._limited[scope],
+                }
+                for scope, (rate, burst) in self.limits.items()
+            },
+        }
+
+
+def make_backend(name: str) -> RateLimitBackend:
+    if name == "redis":
+        logger.info("Лимиты запросов хранятся в Redis")
+        return RedisRateLimitBackend(settings.RATE_LIMIT_REDIS_URL)
+    return MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS, settings.RATE_LIMIT_SHARDS)
+
+
+auth_rate_limiter = RateLimiter(
+    make_backend(settings.RATE_LIMIT_BACKEND),
+    {
+        "ip": (settings.RATE_LIMIT_IP_PER_MIN / 60, settings.RATE_LIMIT_IP_BURST),
+        "login": (settings.RATE_LIMIT_LOGIN_PER_MIN / 60, settings.RATE_LIMIT_LOGIN_BURST),
+    },
+    enabled=settings.RATE_LIMIT_ENABLED,
+    trust_proxy=settings.RATE_LIMIT_TRUST_PROXY,
+)
+
+
+def rate_limit(body: Any) -> Any:
+    """Зависимость для эндпоинтов входа: лимит по IP и по login из тела.
+
+    body — тот же json_body(...), что у эндпоинта: FastAPI кэширует его в
+    пределах запроса, тело разбирается один раз.
+    """
+
+    async def dependency(request: Request, data: Any = body) -> None:
+        await auth_rate_limiter.check(request, getattr(data, "login", None))
+
+    return Depends(dependency)
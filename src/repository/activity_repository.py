@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 
+from typing import Iterable
+
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
@@ -10,6 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from abstract_repository.iactivity_repository import IActivityRepository
 from abstract_repository.ivenue_repository import IVenueRepository
 from models.activity import Activity
+from models.trusted import trusted
+from models.venue import Venue
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -28,7 +33,8 @@ class ActivityRepository(IActivityRepository):
             activities = []
             for row in result.mappings():
                 venue = await self.venue_repo.get_by_id(row["venue"]) if row["venue"] else None
-                activities.append(Activity(
+                activities.append(trusted(
+                    Activity,
                     activity_id=row["id"],
                     duration=row["duration"],
                     address=row["address"],
@@ -42,7 +48,35 @@ class ActivityRepository(IActivityRepository):
             logger.error("Ошибка при получении списка активностей: %s", str(e), exc_info=True)
             return []
 
+    async def get_page(self, limit: int, offset: int) -> list[Activity]:
+        query = text("""
+            SELECT a.*, v.name AS venue_name
+            FROM Activity a
+            LEFT JOIN Venue v ON v.venue_id = a.venue
+            ORDER BY a.id
+            LIMIT :limit OFFSET :offset
+        """)
+        try:
+            result = await self.session.execute(query, {"limit": limit, "offset": offset})
+            return [
+                trusted(
+                    Activity,
+                    activity_id=row["id"],
+                    duration=row["duration"],
+                    address=row["address"],
+                    activity_type=row["activity_type"],
+                    activity_time=row["activity_time"],
+                    venue=trusted(Venue, venue_id=row["venue"], name=row["venue_name"]) if row["venue"] else None,
+                )
+                for row in result.mappings()
+            ]
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении страницы активностей: %s", str(e), exc_info=True)
+            return []
+
     async def get_by_id(self, activity_id: int) -> Activity | None:
+        if negative_cache.is_missing("activity", activity_id):
+            return None
         query = text("SELECT * FROM Activity WHERE id = :activity_id")
         try:
             result = await self.session.execute(query, {"activity_id": activity_id})
@@ -50,7 +84,8 @@ class ActivityRepository(IActivityRepository):
             if row:
                 venue = await self.venue_repo.get_by_id(row["venue"]) if row["venue"] else None
                 logger.debug("Найдена активность ID %d", activity_id)
-                return Activity(
+                return trusted(
+                    Activity,
                     activity_id=row["id"],
                     duration=row["duration"],
                     address=row["address"],
@@ -58,12 +93,40 @@ class ActivityRepository(IActivityRepository):
                     activity_time=row["activity_time"],
                     venue=venue,
                 )
+            negative_cache.remember("activity", activity_id)
             logger.warning("Активность с ID %d не найдена", activity_id)
             return None
         except SQLAlchemyError as e:
             logger.error("Ошибка при получении активности по ID %d: %s", activity_id, str(e), exc_info=True)
             return None
 
+    async def get_by_ids(self, activity_ids: Iterable[int]) -> dict[int, Activity]:
+        ids = negative_cache.unknown("activity", activity_ids)
+        if not ids:
+            return {}
+        query = text("SELECT * FROM Activity WHERE id = ANY(:ids)")
+        try:
+            result = await self.session.execute(query, {"ids": ids})
+            rows = result.mappings().all()
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении активностей по ID %s: %s", ids, str(e), exc_info=True)
+            return {}
+        venues = await self.venue_repo.get_by_ids(row["venue"] for row in rows if row["venue"])
+        activities = {
+            row["id"]: trusted(
+                Activity,
+                activity_id=row["id"],
+                duration=row["duration"],
+                address=row["address"],
+                activity_type=row["activity_type"],
+                activity_time=row["activity_time"],
+                venue=venues.get(row["venue"]),
+            )
+            for row in rows
+        }
+        negative_cache.remember_absent("activity", ids, activities)
+        return activities
+
     async def add(self, activity: Activity) -> Activity:
         query = text("""
             INSERT INTO Activity (duration, address, activity_type, activity_time, Venue)
@@ -82,6 +145,7 @@ class ActivityRepository(IActivityRepository):
             await self.session.commit()
             logger.debug("Активность '%s' успешно добавлена", activity.activity_type)
             activity.activity_id = new_id
+            negative_cache.forget("activity", activity.activity_id)
         except IntegrityError:
             logger.warning("Активность '%s' уже существует", activity.activity_type)
             await self.session.rollback()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from typing import Any
+from typing import Iterable
 
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
@@ -16,7 +17,9 @@ from abstract_repository.iuser_repository import IUserRepository
 from models.activity import Activity
 from models.event import Event
 from models.lodging import Lodging
+from models.trusted import trusted
 from models.user import User
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -89,7 +92,8 @@ class EventRepository(IEventRepository):
                     continue
                 activities = await self.get_activities_by_event(row["id"])
                 lodgings = await self.get_lodgings_by_event(row["id"])
-                events.append(Event(
+                events.append(trusted(
+                    Event,
                     event_id=row["id"],
                     status=row["status"],
                     users=users,
@@ -102,7 +106,27 @@ class EventRepository(IEventRepository):
             logger.error("Ошибка при получении списка мероприятий: %s", str(e), exc_info=True)
             return []
 
+    async def get_page(self, limit: int, offset: int) -> list[Event]:
+        # Как и get_list, показываем только мероприятия с участниками
+        query = text("""
+            SELECT e.id FROM Event e
+            WHERE EXISTS (SELECT 1 FROM users_event ue WHERE ue.event_id = e.id)
+            ORDER BY e.id
+            LIMIT :limit OFFSET :offset
+        """)
+        try:
+            result = await self.session.execute(query, {"limit": limit, "offset": offset})
+            ids = list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении страницы мероприятий: %s", str(e), exc_info=True)
+            return []
+        # Связи всей страницы — через get_by_ids, число запросов не зависит от limit
+        events = await self.get_by_ids(ids)
+        return [events[event_id] for event_id in ids if event_id in events]
+
     async def get_by_id(self, event_id: int) -> Event | None:
+        if negative_cache.is_missing("event", event_id):
+            return None
         query = text("SELECT * FROM Event WHERE id = :event_id")
         try:
             result = await self.session.execute(query, {"event_id": event_id})
@@ -114,19 +138,62 @@ class EventRepository(IEventRepository):
                 activities = await self.get_activities_by_event(row["id"])
                 lodgings = await self.get_lodgings_by_event(row["id"])
                 logger.debug("Найдено мероприятие ID %d", event_id)
-                return Event(
+                return trusted(
+                    Event,
                     event_id=row["id"],
                     status=row["status"],
                     users=users,
                     activities=activities,
                     lodgings=lodgings,
                 )
+            negative_cache.remember("event", event_id)
             logger.warning("Мероприятие ID %d не найдено", event_id)
             return None
         except SQLAlchemyError as e:
             logger.error("Ошибка при получении мероприятия по ID %d: %s", event_id, str(e), exc_info=True)
             return None
 
+    async def get_by_ids(self, event_ids: Iterable[int]) -> dict[int, Event]:
+        ids = negative_cache.unknown("event", event_ids)
+        if not ids:
+            return {}
+        # Связи каждого мероприятия — массивами ID в той же строке
+        query = text("""
+            SELECT
+                e.id,
+                e.status,
+                ARRAY(SELECT ue.users_id FROM users_event ue WHERE ue.event_id = e.id ORDER BY ue.id) AS user_ids,
+                ARRAY(SELECT ea.activity_id FROM event_activity ea WHERE ea.event_id = e.id ORDER BY ea.id) AS activity_ids,
+                ARRAY(SELECT el.lodging_id FROM event_lodgings el WHERE el.event_id = e.id ORDER BY el.id) AS lodging_ids
+            FROM Event e
+            WHERE e.id = ANY(:ids)
+        """)
+        try:
+            result = await self.session.execute(query, {"ids": ids})
+            rows = result.mappings().all()
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении мероприятий по ID %s: %s", ids, str(e), exc_info=True)
+            return {}
+        users = await self.user_repo.get_by_ids(i for row in rows for i in row["user_ids"])
+        activities = await self.activity_repo.get_by_ids(i for row in rows for i in row["activity_ids"])
+        lodgings = await self.lodging_repo.get_by_ids(i for row in rows for i in row["lodging_ids"])
+        events = {}
+        for row in rows:
+            event_users = [users[i] for i in row["user_ids"] if i in users]
+            # Как и get_by_id: мероприятие без участников не отдаём
+            if not event_users:
+                continue
+            events[row["id"]] = trusted(
+                Event,
+                event_id=row["id"],
+                status=row["status"],
+                users=event_users,
+                activities=[activities[i] for i in row["activity_ids"] if i in activities],
+                lodgings=[lodgings[i] for i in row["lodging_ids"] if i in lodgings],
+            )
+        negative_cache.remember_absent("event", ids, {row["id"] for row in rows})
+        return events
+
     async def get_event_by_session_id(self, session_id: int) -> Event | None:
         query = text("SELECT event_id FROM session WHERE id = :session_id")
         try:
@@ -143,11 +210,12 @@ class EventRepository(IEventRepository):
         query = text("INSERT INTO Event (status) VALUES (:status) RETURNING id")
         activity_query = text("INSERT INTO event_activity (event_id, activity_id) VALUES (:event_id, :activity_id)")
         lodging_query = text("INSERT INTO event_lodgings (event_id, lodging_id) VALUES (:event_id, :lodging_id)")
-        user_query = text("INSERT INTO users_event (event_id, users_id) VALUES (:event_id, :users_id)")
+        user_query = text("INSERT INTO users_event (event_id, users_id) VALUES (:event_id, :users_id) ON CONFLICT DO NOTHING")
         try:
             result = await self.session.execute(query, {"status": event.status})
             event_id = result.scalar_one()
             event.event_id = event_id
+            negative_cache.forget("event", event.event_id)
 
             for user in event.users:
                 await self.session.execute(user_query, {"event_id": event_id, "users_id": user.user_id})
@@ -184,7 +252,7 @@ class EventRepository(IEventRepository):
             await self.session.execute(text("DELETE FROM event_lodgings WHERE event_id = :event_id"), {"event_id": update_event.event_id})
 
             for user in update_event.users:
-                await self.session.execute(text("INSERT INTO users_event (event_id, users_id) VALUES (:event_id, :users_id)"), {"event_id": update_event.event_id, "users_id": user.user_id})
+                await self.session.execute(text("INSERT INTO users_event (event_id, users_id) VALUES (:event_id, :users_id) ON CONFLICT DO NOTHING"), {"event_id": update_event.event_id, "users_id": user.user_id})
             for activity in update_event.activities:
                 await self.session.execute(text("INSERT INTO event_activity (event_id, activity_id) VALUES (:event_id, :activity_id)"), {"event_id": update_event.event_id, "activity_id": activity.activity_id})
             for lodging in update_event.lodgings:
@@ -239,7 +307,8 @@ class EventRepository(IEventRepository):
                 users = await self.get_users_by_event(row["id"])
                 if not users:
                     continue
-                events.append(Event(
+                events.append(trusted(
+                    Event,
                     event_id=row["id"],
                     status=row["status"],
                     users=users,
@@ -293,7 +362,8 @@ class EventRepository(IEventRepository):
                 users = await self.get_users_by_event(row.id)
                 if not users:
                     continue
-                events.append(Event(
+                events.append(trusted(
+                    Event,
                     event_id=row.id,
                     status=status,
                     users=users,
@@ -309,7 +379,7 @@ class EventRepository(IEventRepository):
         try:
             await self.session.execute(text("DELETE FROM users_event WHERE event_id = :event_id"), {"event_id": event_id})
             for user_id in user_ids:
-                await self.session.execute(text("INSERT INTO users_event (event_id, users_id) VALUES (:event_id, :users_id)"), {"event_id": event_id, "users_id": user_id})
+                await self.session.execute(text("INSERT INTO users_event (event_id, users_id) VALUES (:event_id, :users_id) ON CONFLICT DO NOTHING"), {"event_id": event_id, "users_id": user_id})
             await self.session.commit()
         except SQLAlchemyError as e:
             await self.session.rollback()
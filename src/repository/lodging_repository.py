@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 
+from typing import Iterable
+
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
@@ -10,6 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from abstract_repository.ilodging_repository import ILodgingRepository
 from abstract_repository.ivenue_repository import IVenueRepository
 from models.lodging import Lodging
+from models.trusted import trusted
+from models.venue import Venue
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -28,7 +33,8 @@ class LodgingRepository(ILodgingRepository):
             lodgings = []
             for row in result.mappings():
                 venue = await self.venue_repo.get_by_id(row["venue"]) if row["venue"] else None
-                lodgings.append(Lodging(
+                lodgings.append(trusted(
+                    Lodging,
                     lodging_id=row["id"],
                     price=row["price"],
                     address=row["address"],
@@ -45,7 +51,38 @@ class LodgingRepository(ILodgingRepository):
             logger.error("Ошибка при получении списка размещений: %s", str(e), exc_info=True)
             raise
 
+    async def get_page(self, limit: int, offset: int) -> list[Lodging]:
+        query = text("""
+            SELECT l.*, v.name AS venue_name
+            FROM lodgings l
+            LEFT JOIN Venue v ON v.venue_id = l.venue
+            ORDER BY l.id
+            LIMIT :limit OFFSET :offset
+        """)
+        try:
+            result = await self.session.execute(query, {"limit": limit, "offset": offset})
+            return [
+                trusted(
+                    Lodging,
+                    lodging_id=row["id"],
+                    price=row["price"],
+                    address=row["address"],
+                    name=row["name"],
+                    type=row["type"],
+                    rating=row["rating"],
+                    check_in=row["check_in"],
+                    check_out=row["check_out"],
+                    venue=trusted(Venue, venue_id=row["venue"], name=row["venue_name"]) if row["venue"] else None,
+                )
+                for row in result.mappings()
+            ]
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении страницы размещений: %s", str(e), exc_info=True)
+            return []
+
     async def get_by_id(self, lodging_id: int) -> Lodging | None:
+        if negative_cache.is_missing("lodging", lodging_id):
+            return None
         query = text("SELECT * FROM lodgings WHERE id = :lodging_id")
         try:
             result = await self.session.execute(query, {"lodging_id": lodging_id})
@@ -53,7 +90,8 @@ class LodgingRepository(ILodgingRepository):
             if row:
                 venue = await self.venue_repo.get_by_id(row["venue"]) if row["venue"] else None
                 logger.debug("Найдено размещение ID %d: %s", lodging_id, row["name"])
-                return Lodging(
+                return trusted(
+                    Lodging,
                     lodging_id=row["id"],
                     price=row["price"],
                     address=row["address"],
@@ -64,12 +102,43 @@ class LodgingRepository(ILodgingRepository):
                     check_out=row["check_out"],
                     venue=venue,
                 )
+            negative_cache.remember("lodging", lodging_id)
             logger.warning("Размещение с ID %d не найдено", lodging_id)
             return None
         except SQLAlchemyError as e:
             logger.error("Ошибка при получении размещения по ID %d: %s", lodging_id, str(e), exc_info=True)
             return None
 
+    async def get_by_ids(self, lodging_ids: Iterable[int]) -> dict[int, Lodging]:
+        ids = negative_cache.unknown("lodging", lodging_ids)
+        if not ids:
+            return {}
+        query = text("SELECT * FROM lodgings WHERE id = ANY(:ids)")
+        try:
+            result = await self.session.execute(query, {"ids": ids})
+            rows = result.mappings().all()
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении размещений по ID %s: %s", ids, str(e), exc_info=True)
+            return {}
+        venues = await self.venue_repo.get_by_ids(row["venue"] for row in rows if row["venue"])
+        lodgings = {
+            row["id"]: trusted(
+                Lodging,
+                lodging_id=row["id"],
+                price=row["price"],
+                address=row["address"],
+                name=row["name"],
+                type=row["type"],
+                rating=row["rating"],
+                check_in=row["check_in"],
+                check_out=row["check_out"],
+                venue=venues.get(row["venue"]),
+            )
+            for row in rows
+        }
+        negative_cache.remember_absent("lodging", ids, lodgings)
+        return lodgings
+
     async def add(self, lodging: Lodging) -> Lodging:
         query = text("""
             INSERT INTO lodgings (price, address, name, type, rating, check_in, check_out, Venue)
@@ -91,6 +160,7 @@ class LodgingRepository(ILodgingRepository):
             await self.session.commit()
             logger.debug("Размещение '%s' успешно добавлено", lodging.name)
             lodging.lodging_id = new_id
+            negative_cache.forget("lodging", lodging.lodging_id)
         except IntegrityError:
             logger.warning("Размещение '%s' уже существует", lodging.name)
             await self.session.rollback()
@@ -2,14 +2,22 @@ from __future__ import annotations
 
 import logging
 
+from typing import Iterable
+
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from abstract_repository.include import Include
+from abstract_repository.include import resolve_include
 from abstract_repository.iprogram_repository import IProgramRepository
 from abstract_repository.ivenue_repository import IVenueRepository
 from models.program import Program
+from models.trusted import trusted
+from models.unloaded import Unloaded
+from models.venue import Venue
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -29,7 +37,8 @@ class ProgramRepository(IProgramRepository):
             for row in result.mappings():
                 start_venue = await self.venue_repo.get_by_id(row["start_venue"]) if row["start_venue"] else None
                 end_venue = await self.venue_repo.get_by_id(row["end_venue"]) if row["end_venue"] else None
-                programs.append(Program(
+                programs.append(trusted(
+                    Program,
                     program_id=row["id"],
                     transfer_type=row["transfer_type"],
                     cost=row["cost"],
@@ -43,16 +52,33 @@ class ProgramRepository(IProgramRepository):
             logger.error("Ошибка при получении списка программ: %s", str(e), exc_info=True)
             return []
 
-    async def get_by_id(self, program_id: int) -> Program | None:
+    async def get_page(self, limit: int, offset: int) -> list[Program]:
+        query = text("SELECT id FROM program ORDER BY id LIMIT :limit OFFSET :offset")
+        try:
+            result = await self.session.execute(query, {"limit": limit, "offset": offset})
+            ids = list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении страницы программ: %s", str(e), exc_info=True)
+            return []
+        programs = await self.get_by_ids(ids)
+        return [programs[program_id] for program_id in ids if program_id in programs]
+
+    async def get_by_id(
+        self, program_id: int, include: Include = None
+    ) -> Program | None:
+        paths = resolve_include(include, self.INCLUDE_PATHS)
+        if negative_cache.is_missing("program", program_id):
+            return None
         query = text("SELECT * FROM program WHERE id = :program_id")
         try:
             result = await self.session.execute(query, {"program_id": program_id})
             row = result.mappings().first()
             if row:
-                start_venue = await self.venue_repo.get_by_id(row["start_venue"]) if row["start_venue"] else None
-                end_venue = await self.venue_repo.get_by_id(row["end_venue"]) if row["end_venue"] else None
+                start_venue = await self._venue(row["start_venue"], paths)
+                end_venue = await self._venue(row["end_venue"], paths)
                 logger.debug("Найдена программа ID %d", program_id)
-                return Program(
+                return trusted(
+                    Program,
                     program_id=row["id"],
                     transfer_type=row["transfer_type"],
                     cost=row["cost"],
@@ -60,12 +86,52 @@ class ProgramRepository(IProgramRepository):
                     start_venue=start_venue,
                     end_venue=end_venue,
                 )
+            negative_cache.remember("program", program_id)
             logger.warning("Программа с ID %d не найдена", program_id)
             return None
         except SQLAlchemyError as e:
             logger.error("Ошибка при получении программы по ID %d: %s", program_id, str(e), exc_info=True)
             return None
 
+    async def _venue(self, venue_id: int | None, paths: frozenset[str]) -> Venue | Unloaded | None:
+        if not venue_id:
+            return None
+        if "venues" not in paths:
+            return Unloaded("venue", venue_id)
+        return await self.venue_repo.get_by_id(venue_id)
+
+    async def get_by_ids(self, program_ids: Iterable[int]) -> dict[int, Program]:
+        ids = negative_cache.unknown("program", program_ids)
+        if not ids:
+            return {}
+        query = text("SELECT * FROM program WHERE id = ANY(:ids)")
+        try:
+            result = await self.session.execute(query, {"ids": ids})
+            rows = result.mappings().all()
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении программ по ID %s: %s", ids, str(e), exc_info=True)
+            return {}
+        venues = await self.venue_repo.get_by_ids(
+            venue_id
+            for row in rows
+            for venue_id in (row["start_venue"], row["end_venue"])
+            if venue_id
+        )
+        programs = {
+            row["id"]: trusted(
+                Program,
+                program_id=row["id"],
+                transfer_type=row["transfer_type"],
+                cost=row["cost"],
+                transfer_duration_minutes=row["transfer_duration_minutes"],
+                start_venue=venues.get(row["start_venue"]),
+                end_venue=venues.get(row["end_venue"]),
+            )
+            for row in rows
+        }
+        negative_cache.remember_absent("program", ids, programs)
+        return programs
+
     async def add(self, program: Program) -> Program:
         query = text("""
             INSERT INTO program (transfer_type, start_venue, end_venue, transfer_duration_minutes, cost)
@@ -84,6 +150,7 @@ class ProgramRepository(IProgramRepository):
             await self.session.commit()
             logger.debug("Программа успешно добавлена")
             program.program_id = new_id
+            negative_cache.forget("program", program.program_id)
         except IntegrityError:
             logger.warning("Программа уже существует")
             await self.session.rollback()
@@ -153,7 +220,8 @@ class ProgramRepository(IProgramRepository):
                 start_venue = await self.venue_repo.get_by_id(row["start_venue"])
                 end_venue = await self.venue_repo.get_by_id(row["end_venue"])
                 logger.debug("Найдена программа ID %d", row["id"])
-                return Program(
+                return trusted(
+                    Program,
                     program_id=row["id"],
                     transfer_type=transfer_type,
                     cost=row["cost"],
@@ -2,8 +2,10 @@
 
 import logging
 
+from datetime import datetime
 from datetime import timedelta
 from typing import Any
+from typing import Iterable
 
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
@@ -11,14 +13,45 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.ievent_repository import IEventRepository
+from abstract_repository.include import SHALLOW
+from abstract_repository.include import Include
+from abstract_repository.include import resolve_include
 from abstract_repository.iprogram_repository import IProgramRepository
 from abstract_repository.isession_repository import ISessionRepository
+from models.activity import Activity
+from models.event import Event
+from models.lodging import Lodging
+from models.program import Program
 from models.session import Session
+from models.trusted import trusted
+from models.unloaded import Unloaded
+from models.user import User
+from models.venue import Venue
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
 
 
+def _venue(venue_id: int | None, name: str | None) -> Venue | None:
+    if venue_id is None:
+        return None
+    return trusted(Venue, venue_id=venue_id, name=name)
+
+
+def _returned_session(row: Any) -> Session:
+    # Строка из RETURNING уже проверена базой и patch, повторная валидация не нужна
+    return trusted(
+        Session,
+        session_id=row["id"],
+        program=Unloaded("program", row["program_id"]) if row["program_id"] else None,
+        event=Unloaded("event", row["event_id"]) if row["event_id"] else None,
+        start_time=row["start_time"],
+        end_time=row["end_time"],
+        type=row["type"],
+    )
+
+
 class SessionRepository(ISessionRepository):
     def __init__(
         self,
@@ -39,7 +72,8 @@ class SessionRepository(ISessionRepository):
             for row in result.mappings():
                 program = await self.program_repo.get_by_id(row["program_id"])
                 event = await self.event_repo.get_by_id(row["event_id"])
-                sessions.append(Session(
+                sessions.append(trusted(
+                    Session,
                     session_id=row["id"],
                     program=program,
                     event=event,
@@ -53,16 +87,34 @@ class SessionRepository(ISessionRepository):
             logger.error("Ошибка при получении списка сессий: %s", str(e), exc_info=True)
             return []
 
-    async def get_by_id(self, session_id: int) -> Session | None:
+    async def get_page(self, limit: int, offset: int) -> list[Session]:
+        query = text("SELECT id FROM session ORDER BY id LIMIT :limit OFFSET :offset")
+        try:
+            result = await self.session.execute(query, {"limit": limit, "offset": offset})
+            ids = list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении страницы сессий: %s", str(e), exc_info=True)
+            return []
+        # Программы и мероприятия страницы — через get_by_ids, без запроса на строку
+        sessions = await self.get_by_ids(ids)
+        return [sessions[session_id] for session_id in ids if session_id in sessions]
+
+    async def get_by_id(
+        self, session_id: int, include: Include = None
+    ) -> Session | None:
+        paths = resolve_include(include, self.INCLUDE_PATHS)
+        if negative_cache.is_missing("session", session_id):
+            return None
         query = text("SELECT * FROM session WHERE id = :session_id")
         try:
             result = await self.session.execute(query, {"session_id": session_id})
             row = result.mappings().first()
             if row:
-                program = await self.program_repo.get_by_id(row["program_id"])
-                event = await self.event_repo.get_by_id(row["event_id"])
+                program = await self._program(row["program_id"], paths)
+                event = await self._event(row["event_id"], paths)
                 logger.debug("Найдена сессия ID %d", session_id)
-                return Session(
+                return trusted(
+                    Session,
                     session_id=row["id"],
                     program=program,
                     event=event,
@@ -70,12 +122,56 @@ class SessionRepository(ISessionRepository):
                     end_time=row["end_time"],
                     type=row["type"],
                 )
+            negative_cache.remember("session", session_id)
             logger.warning("Сессия с ID %d не найдена", session_id)
             return None
         except SQLAlchemyError as e:
             logger.error("Ошибка при получении сессии по ID %d: %s", session_id, str(e), exc_info=True)
             return None
 
+    async def _program(self, program_id: int | None, paths: frozenset[str]) -> Program | Unloaded | None:
+        if not program_id:
+            return None
+        if "program" not in paths:
+            return Unloaded("program", program_id)
+        include = None if "program.venues" in paths else SHALLOW
+        return await self.program_repo.get_by_id(program_id, include=include)
+
+    async def _event(self, event_id: int | None, paths: frozenset[str]) -> Event | Unloaded | None:
+        if not event_id:
+            return None
+        if "event" not in paths:
+            return Unloaded("event", event_id)
+        return await self.event_repo.get_by_id(event_id)
+
+    async def get_by_ids(self, session_ids: Iterable[int]) -> dict[int, Session]:
+        ids = negative_cache.unknown("session", session_ids)
+        if not ids:
+            return {}
+        query = text("SELECT * FROM session WHERE id = ANY(:ids)")
+        try:
+            result = await self.session.execute(query, {"ids": ids})
+            rows = result.mappings().all()
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении сессий по ID %s: %s", ids, str(e), exc_info=True)
+            return {}
+        programs = await self.program_repo.get_by_ids(row["program_id"] for row in rows if row["program_id"])
+        events = await self.event_repo.get_by_ids(row["event_id"] for row in rows if row["event_id"])
+        sessions = {
+            row["id"]: trusted(
+                Session,
+                session_id=row["id"],
+                program=programs.get(row["program_id"]),
+                event=events.get(row["event_id"]),
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+                type=row["type"],
+            )
+            for row in rows
+        }
+        negative_cache.remember_absent("session", ids, sessions)
+        return sessions
+
     async def add(self, session: Session) -> Session:
         query = text("""
             INSERT INTO session (program_id, event_id, start_time, end_time, type)
@@ -96,6 +192,7 @@ class SessionRepository(ISessionRepository):
             await self.session.commit()
             logger.debug("Сессия успешно добавлена")
             session.session_id = new_id
+            negative_cache.forget("session", session.session_id)
         except IntegrityError:
             await self.session.rollback()
             logger.warning("Сессия уже существует")
@@ -136,6 +233,111 @@ class SessionRepository(ISessionRepository):
             logger.error("Ошибка при обновлении сессии ID %d: %s", update_session.session_id, str(e), exc_info=True)
             raise
 
+    async def patch(self, session_id: int, changes: dict[str, Any]) -> Session | None:
+        """Меняет только переданные поля одним UPDATE ... RETURNING.
+
+        Поля уже проверены validate_changes; здесь проверяется лишь порядок
+        start_time/end_time в итоговой строке. Связи в ответе — Unloaded.
+        """
+        # Имена полей попадают в SQL, поэтому только из PATCH_FIELDS
+        unknown = set(changes) - self.PATCH_FIELDS
+        if not changes or unknown:
+            raise ValueError(f"Недопустимые поля для изменения сессии: {sorted(unknown)}")
+        assignments = ", ".join(f"{field} = :{field}" for field in changes)
+        query = text(f"UPDATE session SET {assignments} WHERE id = :session_id RETURNING *")
+        try:
+            result = await self.session.execute(query, {**changes, "session_id": session_id})
+            row = result.mappings().first()
+            if row is None:
+                await self.session.rollback()
+                return None
+            if row["end_time"] <= row["start_time"]:
+                await self.session.rollback()
+                raise ValueError("end_time должен быть позже start_time")
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Ошибка при изменении сессии ID %d: %s", session_id, str(e), exc_info=True)
+            raise
+        logger.debug("Сессия ID %d изменена: %s", session_id, sorted(changes))
+        return _returned_session(row)
+
+    async def extend(self, session_id: int, end_time: datetime) -> Session | None:
+        """Переносит end_time только вперёд; текущая дата сравнивается в WHERE."""
+        query = text("""
+            UPDATE session SET end_time = :end_time
+            WHERE id = :session_id AND end_time < :end_time
+            RETURNING *
+        """)
+        try:
+            result = await self.session.execute(query, {"end_time": end_time, "session_id": session_id})
+            row = result.mappings().first()
+            if row is None:
+                # Строка не изменилась: различаем «нет сессии» и «дата не позже»
+                await self.session.rollback()
+                current = await self.session.execute(
+                    text("SELECT end_time FROM session WHERE id = :session_id"), {"session_id": session_id}
+                )
+                current_end_time = current.scalar_one_or_none()
+                if current_end_time is None:
+                    return None
+                raise ValueError(
+                    f"New end date {end_time} must be after current end date {current_end_time}"
+                )
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Ошибка при продлении сессии ID %d: %s", session_id, str(e), exc_info=True)
+            raise
+        return _returned_session(row)
+
+    async def join_event(self, session_id: int, user_id: int) -> Session | None:
+        """Добавляет пользователя в мероприятие сессии и создаёт ему личную сессию.
+
+        Один оператор — одна транзакция: строка users_event вставляется через
+        ON CONFLICT DO NOTHING по уникальному ключу (event_id, users_id), а копия
+        сессии создаётся только если вставка прошла. Повторное или
+        одновременное присоединение не создаёт дублей.
+        """
+        query = text("""
+            WITH src AS (
+                SELECT program_id, event_id, start_time, end_time
+                FROM session WHERE id = :session_id
+            ),
+            joined AS (
+                INSERT INTO users_event (event_id, users_id)
+                SELECT event_id, :user_id FROM src
+                ON CONFLICT (event_id, users_id) DO NOTHING
+                RETURNING event_id
+            ),
+            created AS (
+                INSERT INTO session (program_id, event_id, start_time, end_time, type)
+                SELECT src.program_id, src.event_id, src.start_time, src.end_time, 'Личные'
+                FROM src JOIN joined ON joined.event_id = src.event_id
+                RETURNING *
+            )
+            SELECT EXISTS (SELECT 1 FROM src) AS session_found, created.*
+            FROM (SELECT 1) AS one LEFT JOIN created ON true
+        """)
+        try:
+            result = await self.session.execute(query, {"session_id": session_id, "user_id": user_id})
+            row = result.mappings().one()
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            logger.warning("Пользователь ID %d не найден при присоединении к сессии %d", user_id, session_id)
+            raise ValueError("User not found")
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Ошибка при присоединении к сессии ID %d: %s", session_id, str(e), exc_info=True)
+            raise
+        if not row["session_found"]:
+            return None
+        if row["id"] is None:
+            raise ValueError("User already joined this event")
+        negative_cache.forget("session", row["id"])
+        return _returned_session(row)
+
     async def delete(self, session_id: int) -> None:
         query = text("DELETE FROM session WHERE id = :session_id")
         try:
@@ -157,7 +359,8 @@ class SessionRepository(ISessionRepository):
             for row in result.mappings():
                 program = await self.program_repo.get_by_id(row["program_id"])
                 event = await self.event_repo.get_by_id(row["event_id"])
-                sessions.append(Session(
+                sessions.append(trusted(
+                    Session,
                     session_id=row["id"],
                     program=program,
                     event=event,
@@ -182,7 +385,8 @@ class SessionRepository(ISessionRepository):
             for row in result.mappings():
                 program = await self.program_repo.get_by_id(row["program_id"])
                 event = await self.event_repo.get_by_id(row["event_id"])
-                sessions.append(Session(
+                sessions.append(trusted(
+                    Session,
                     session_id=row["id"],
                     program=program,
                     event=event,
@@ -318,7 +522,8 @@ class SessionRepository(ISessionRepository):
             for row in result.mappings():
                 program = await self.program_repo.get_by_id(row["program_id"])
                 event = await self.event_repo.get_by_id(row["event_id"])
-                sessions.append(Session(
+                sessions.append(trusted(
+                    Session,
                     session_id=row["id"],
                     program=program,
                     event=event,
@@ -331,6 +536,147 @@ class SessionRepository(ISessionRepository):
             logger.error("Ошибка при получении сессий: %s", str(e), exc_info=True)
             raise
 
+    async def get_sessions_for_user(
+        self, user_id: int, statuses: list[str]
+    ) -> list[Session]:
+        """Сессии всех мероприятий пользователя с заданными статусами.
+
+        Не более четырёх запросов при любом числе сессий: сессии с программами
+        и площадками, затем участники, активности и размещения всех найденных
+        мероприятий разом. Модели собираются здесь же, без get_by_id по строкам.
+        """
+        sessions_query = text("""
+            SELECT
+                s.id, s.start_time, s.end_time, s.type, s.event_id, e.status,
+                p.id AS program_id, p.transfer_type, p.cost, p.transfer_duration_minutes,
+                sv.venue_id AS start_venue_id, sv.name AS start_venue_name,
+                tv.venue_id AS end_venue_id, tv.name AS end_venue_name
+            FROM session s
+            JOIN event e ON e.id = s.event_id
+            LEFT JOIN program p ON p.id = s.program_id
+            LEFT JOIN venue sv ON sv.venue_id = p.start_venue
+            LEFT JOIN venue tv ON tv.venue_id = p.end_venue
+            WHERE e.status = ANY(:statuses)
+              AND EXISTS (
+                  SELECT 1 FROM users_event ue
+                  WHERE ue.event_id = e.id AND ue.users_id = :user_id
+              )
+            ORDER BY s.event_id, s.start_time
+        """)
+        users_query = text("""
+            SELECT ue.event_id, u.id, u.full_name, u.passport, u.phone, u.email, u.login, u.password
+            FROM users_event ue
+            JOIN users u ON u.id = ue.users_id
+            WHERE ue.event_id = ANY(:event_ids)
+            ORDER BY ue.id
+        """)
+        activities_query = text("""
+            SELECT ea.event_id, a.id, a.duration, a.address, a.activity_type, a.activity_time,
+                   v.venue_id, v.name AS venue_name
+            FROM event_activity ea
+            JOIN activity a ON a.id = ea.activity_id
+            LEFT JOIN venue v ON v.venue_id = a.venue
+            WHERE ea.event_id = ANY(:event_ids)
+            ORDER BY ea.id
+        """)
+        lodgings_query = text("""
+            SELECT el.event_id, l.id, l.price, l.address, l.name, l.type, l.rating,
+                   l.check_in, l.check_out, v.venue_id, v.name AS venue_name
+            FROM event_lodgings el
+            JOIN lodgings l ON l.id = el.lodging_id
+            LEFT JOIN venue v ON v.venue_id = l.venue
+            WHERE el.event_id = ANY(:event_ids)
+            ORDER BY el.id
+        """)
+        try:
+            result = await self.session.execute(
+                sessions_query, {"user_id": user_id, "statuses": list(statuses)}
+            )
+            rows = result.mappings().all()
+            if not rows:
+                return []
+            event_status = {row["event_id"]: row["status"] for row in rows}
+            params = {"event_ids": list(event_status)}
+
+            users: dict[int, list[User]] = {}
+            for row in (await self.session.execute(users_query, params)).mappings():
+                users.setdefault(row["event_id"], []).append(trusted(
+                    User,
+                    user_id=row["id"],
+                    fio=row["full_name"],
+                    number_passport=row["passport"],
+                    phone_number=row["phone"],
+                    email=row["email"],
+                    login=row["login"],
+                    password=row["password"],
+                ))
+            activities: dict[int, list[Activity]] = {}
+            for row in (await self.session.execute(activities_query, params)).mappings():
+                activities.setdefault(row["event_id"], []).append(trusted(
+                    Activity,
+                    activity_id=row["id"],
+                    duration=row["duration"],
+                    address=row["address"],
+                    activity_type=row["activity_type"],
+                    activity_time=row["activity_time"],
+                    venue=_venue(row["venue_id"], row["venue_name"]),
+                ))
+            lodgings: dict[int, list[Lodging]] = {}
+            for row in (await self.session.execute(lodgings_query, params)).mappings():
+                lodgings.setdefault(row["event_id"], []).append(trusted(
+                    Lodging,
+                    lodging_id=row["id"],
+                    price=row["price"],
+                    address=row["address"],
+                    name=row["name"],
+                    type=row["type"],
+                    rating=row["rating"],
+                    check_in=row["check_in"],
+                    check_out=row["check_out"],
+                    venue=_venue(row["venue_id"], row["venue_name"]),
+                ))
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении сессий пользователя ID %d: %s", user_id, str(e), exc_info=True)
+            raise
+
+        events: dict[int, Event | None] = {}
+        for event_id, status in event_status.items():
+            # Как и event_repo.get_by_id: мероприятие без участников не отдаём,
+            # пустые списки оставляем значениями по умолчанию
+            fields: dict[str, Any] = {"event_id": event_id, "status": status}
+            if event_id in activities:
+                fields["activities"] = activities[event_id]
+            if event_id in lodgings:
+                fields["lodgings"] = lodgings[event_id]
+            events[event_id] = (
+                trusted(Event, users=users[event_id], **fields) if event_id in users else None
+            )
+
+        sessions = []
+        for row in rows:
+            program = None
+            if row["program_id"] is not None:
+                program = trusted(
+                    Program,
+                    program_id=row["program_id"],
+                    transfer_type=row["transfer_type"],
+                    cost=row["cost"],
+                    transfer_duration_minutes=row["transfer_duration_minutes"],
+                    start_venue=_venue(row["start_venue_id"], row["start_venue_name"]),
+                    end_venue=_venue(row["end_venue_id"], row["end_venue_name"]),
+                )
+            sessions.append(trusted(
+                Session,
+                session_id=row["id"],
+                program=program,
+                event=events[row["event_id"]],
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+                type=row["type"],
+            ))
+        logger.debug("Получено %d сессий пользователя ID %d", len(sessions), user_id)
+        return sessions
+
     async def get_sessions_by_type(self, type_session: str) -> list[Session]:
         query = text("SELECT * FROM session WHERE type = :type")
         try:
@@ -339,7 +685,8 @@ class SessionRepository(ISessionRepository):
             for row in result.mappings():
                 program = await self.program_repo.get_by_id(row["program_id"])
                 event = await self.event_repo.get_by_id(row["event_id"])
-                sessions.append(Session(
+                sessions.append(trusted(
+                    Session,
                     session_id=row["id"],
                     program=program,
                     event=event,
@@ -352,6 +699,94 @@ class SessionRepository(ISessionRepository):
             logger.error("Ошибка при получении сессий по типу %s: %s", type_session, str(e), exc_info=True)
             return []
 
+    async def get_sessions_overview(self) -> dict[str, list[dict[str, Any]]]:
+        """Всё для страницы /session.html одним запросом: сессии, мероприятия
+        с участниками, активностями и размещениями, программы с площадками."""
+        query = text("""
+            WITH ev AS (
+                SELECT
+                    e.id,
+                    e.status,
+                    (SELECT jsonb_agg(jsonb_build_object(
+                        'user_id', u.id, 'fio', u.full_name, 'email', u.email
+                     ) ORDER BY ue.id)
+                     FROM users_event ue JOIN users u ON u.id = ue.users_id
+                     WHERE ue.event_id = e.id) AS users,
+                    COALESCE((SELECT jsonb_agg(jsonb_build_object(
+                        'id', a.id, 'duration', a.duration, 'address', a.address,
+                        'activity_type', a.activity_type, 'activity_time', a.activity_time,
+                        'venue_id', v.venue_id, 'venue_name', v.name
+                     ) ORDER BY ea.id)
+                     FROM event_activity ea
+                     JOIN activity a ON a.id = ea.activity_id
+                     LEFT JOIN venue v ON v.venue_id = a.venue
+                     WHERE ea.event_id = e.id), '[]'::jsonb) AS activities,
+                    COALESCE((SELECT jsonb_agg(jsonb_build_object(
+                        'id', l.id, 'price', l.price, 'address', l.address, 'name', l.name,
+                        'type', l.type, 'rating', l.rating,
+                        'check_in', l.check_in, 'check_out', l.check_out,
+                        'venue_id', v.venue_id, 'venue_name', v.name
+                     ) ORDER BY el.id)
+                     FROM event_lodgings el
+                     JOIN lodgings l ON l.id = el.lodging_id
+                     LEFT JOIN venue v ON v.venue_id = l.venue
+                     WHERE el.event_id = e.id), '[]'::jsonb) AS lodgings
+                FROM event e
+            )
+            SELECT
+                COALESCE((SELECT jsonb_agg(jsonb_build_object(
+                    'id', s.id, 'start_time', s.start_time, 'end_time', s.end_time,
+                    'type', s.type, 'program_id', s.program_id, 'event_id', s.event_id
+                 ) ORDER BY s.id) FROM session s), '[]'::jsonb) AS sessions,
+                COALESCE((SELECT jsonb_agg(jsonb_build_object(
+                    'id', ev.id, 'status', ev.status, 'users', ev.users,
+                    'activities', ev.activities, 'lodgings', ev.lodgings
+                 ) ORDER BY ev.id) FROM ev WHERE ev.users IS NOT NULL), '[]'::jsonb) AS events,
+                COALESCE((SELECT jsonb_agg(jsonb_build_object(
+                    'id', p.id, 'transfer_type', p.transfer_type, 'cost', p.cost,
+                    'transfer_duration_minutes', p.transfer_duration_minutes,
+                    'start_venue', sv.name, 'end_venue', tv.name
+                 ) ORDER BY p.id)
+                 FROM program p
+                 LEFT JOIN venue sv ON sv.venue_id = p.start_venue
+                 LEFT JOIN venue tv ON tv.venue_id = p.end_venue), '[]'::jsonb) AS programs
+        """)
+        try:
+            result = await self.session.execute(query)
+            row = result.mappings().one()
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении обзора сессий: %s", str(e), exc_info=True)
+            return {"sessions": [], "events": [], "programs": []}
+
+        # jsonb отдаёт временные метки строками ISO 8601
+        for s in row["sessions"]:
+            s["start_time"] = datetime.fromisoformat(s["start_time"])
+            s["end_time"] = datetime.fromisoformat(s["end_time"])
+        for event in row["events"]:
+            for a in event["activities"]:
+                a["activity_time"] = datetime.fromisoformat(a["activity_time"])
+            for ldg in event["lodgings"]:
+                ldg["check_in"] = datetime.fromisoformat(ldg["check_in"])
+                ldg["check_out"] = datetime.fromisoformat(ldg["check_out"])
+        return {"sessions": row["sessions"], "events": row["events"], "programs": row["programs"]}
+
+    async def get_catalog_by_type(self, type_session: str) -> list[dict[str, Any]] | None:
+        """Строки каталога из session_catalog; None — витрина недоступна."""
+        query = text("""
+            SELECT session_id, start_time, end_time, start_venue, end_venue,
+                   transfer_type, total_cost, lodgings, activities, user_ids
+            FROM session_catalog
+            WHERE type = :type
+            ORDER BY session_id
+        """)
+        try:
+            result = await self.session.execute(query, {"type": type_session})
+            return [dict(row) for row in result.mappings()]
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.warning("Витрина session_catalog недоступна: %s", str(e))
+            return None
+
     async def get_session_parts(self, event_id: int) -> list[dict[str, Any]]:
         query = text("""
             SELECT
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import logging
+
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from abstract_repository.itable_version_repository import ITableVersionRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class TableVersionRepository(ITableVersionRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        logger.debug("Инициализация TableVersionRepository")
+
+    async def get_versions(
+        self, table_names: tuple[str, ...]
+    ) -> dict[str, tuple[int, datetime]]:
+        query = text(
+            "SELECT table_name, version, updated_at FROM table_version "
+            "WHERE table_name = ANY(:table_names)"
+        )
+        try:
+            result = await self.session.execute(
+                query, {"table_names": list(table_names)}
+            )
+            return {
+                row["table_name"]: (row["version"], row["updated_at"])
+                for row in result.mappings()
+            }
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.warning("Не удалось получить версии таблиц: %s", str(e))
+            return {}
@@ -2,17 +2,45 @@ from __future__ import annotations
 
 import logging
 
+from typing import Any
+from typing import AsyncIterator
+from typing import Iterable
+
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.iuser_repository import IUserRepository
+from models.trusted import trusted
 from models.user import User
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
 
+_PATCH_COLUMNS = {
+    "fio": "full_name",
+    "number_passport": "passport",
+    "phone_number": "phone",
+    "email": "email",
+    "login": "login",
+}
+
+
+def _returned_user(row: Any) -> User:
+    # Строка из RETURNING: изменённые поля уже проверены, остальные взяты из базы
+    return trusted(
+        User,
+        user_id=row["id"],
+        fio=row["full_name"],
+        number_passport=row["passport"],
+        phone_number=row["phone"],
+        email=row["email"],
+        login=row["login"],
+        password=row["password"],
+    )
+
 
 class UserRepository(IUserRepository):
     def __init__(self, session: AsyncSession):
@@ -42,6 +70,7 @@ class UserRepository(IUserRepository):
             await self.session.commit()
             db_id = result.scalar_one()
             user.user_id = db_id
+            negative_cache.forget("user", user.user_id)
 
             logger.debug(f"Пользователь добавлен (ID: {db_id}): {user.login}")
         except IntegrityError:
@@ -61,7 +90,8 @@ class UserRepository(IUserRepository):
         try:
             result = await self.session.execute(query)
             users = [
-                User(
+                trusted(
+                    User,
                     user_id=row["id"],
                     fio=row["full_name"],
                     number_passport=row["passport"],
@@ -80,14 +110,57 @@ class UserRepository(IUserRepository):
             )
             return []
 
+    async def get_page(self, limit: int, offset: int) -> list[User]:
+        query = text("SELECT * FROM users ORDER BY id LIMIT :limit OFFSET :offset")
+        try:
+            result = await self.session.execute(query, {"limit": limit, "offset": offset})
+            return [
+                trusted(
+                    User,
+                    user_id=row["id"],
+                    fio=row["full_name"],
+                    number_passport=row["passport"],
+                    phone_number=row["phone"],
+                    email=row["email"],
+                    login=row["login"],
+                    password=row["password"],
+                )
+                for row in result.mappings()
+            ]
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении страницы пользователей: %s", str(e), exc_info=True)
+            return []
+
+    async def iter_list(self, batch_size: int = 500) -> AsyncIterator[User]:
+        # Серверный курсор: в памяти не больше batch_size строк
+        query = text("SELECT * FROM users ORDER BY id").execution_options(yield_per=batch_size)
+        try:
+            result = await self.session.stream(query)
+            async for row in result.mappings():
+                yield trusted(
+                    User,
+                    user_id=row["id"],
+                    fio=row["full_name"],
+                    number_passport=row["passport"],
+                    phone_number=row["phone"],
+                    email=row["email"],
+                    login=row["login"],
+                    password=row["password"],
+                )
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при потоковом чтении пользователей: %s", str(e), exc_info=True)
+
     async def get_by_id(self, user_id: int) -> User | None:
+        if negative_cache.is_missing("user", user_id):
+            return None
         query = text("SELECT * FROM users WHERE id = :user_id")
         try:
             result = await self.session.execute(query, {"user_id": user_id})
             row = result.mappings().first()
             if row:
                 logger.debug(f"Пользователь найден по ID {user_id}")
-                return User(
+                return trusted(
+                    User,
                     user_id=row["id"],
                     fio=row["full_name"],
                     number_passport=row["passport"],
@@ -96,6 +169,7 @@ class UserRepository(IUserRepository):
                     login=row["login"],
                     password=row["password"],
                 )
+            negative_cache.remember("user", user_id)
             logger.debug(f"Пользователь с ID {user_id} не найден")
             return None
         except SQLAlchemyError as e:
@@ -104,6 +178,32 @@ class UserRepository(IUserRepository):
             )
             return None
 
+    async def get_by_ids(self, user_ids: Iterable[int]) -> dict[int, User]:
+        ids = negative_cache.unknown("user", user_ids)
+        if not ids:
+            return {}
+        query = text("SELECT * FROM users WHERE id = ANY(:ids)")
+        try:
+            result = await self.session.execute(query, {"ids": ids})
+            users = {
+                row["id"]: trusted(
+                    User,
+                    user_id=row["id"],
+                    fio=row["full_name"],
+                    number_passport=row["passport"],
+                    phone_number=row["phone"],
+                    email=row["email"],
+                    login=row["login"],
+                    password=row["password"],
+                )
+                for row in result.mappings()
+            }
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении пользователей по ID %s: %s", ids, str(e), exc_info=True)
+            return {}
+        negative_cache.remember_absent("user", ids, users)
+        return users
+
     async def get_by_login(self, login: str) -> User | None:
         query = text("SELECT * FROM users WHERE login = :login")
         try:
@@ -113,7 +213,8 @@ class UserRepository(IUserRepository):
                 logger.debug(f"Пользователь с логином {login} не найден")
                 return None
             logger.debug(f"Пользователь найден по логину: {login}")
-            return User(
+            return trusted(
+                User,
                 user_id=row["id"],
                 fio=row["full_name"],
                 number_passport=row["passport"],
@@ -167,6 +268,45 @@ class UserRepository(IUserRepository):
                 exc_info=True,
             )
 
+    async def patch(self, user_id: int, changes: dict[str, Any]) -> User | None:
+        """Меняет только переданные поля одним UPDATE ... RETURNING."""
+        # Имена колонок попадают в SQL, поэтому только из _PATCH_COLUMNS
+        unknown = set(changes) - self.PATCH_FIELDS
+        if not changes or unknown:
+            raise ValueError(f"Недопустимые поля для изменения пользователя: {sorted(unknown)}")
+        assignments = ", ".join(f"{_PATCH_COLUMNS[field]} = :{field}" for field in changes)
+        query = text(f"UPDATE users SET {assignments} WHERE id = :user_id RETURNING *")
+        try:
+            result = await self.session.execute(query, {**changes, "user_id": user_id})
+            row = result.mappings().first()
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            raise ValueError("Пользователь с такими данными уже существует")
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(f"Ошибка при изменении пользователя с ID {user_id}: {e}", exc_info=True)
+            raise
+        return _returned_user(row) if row else None
+
+    async def update_password(
+        self, login: str, password: str, expected: str | None = None
+    ) -> User | None:
+        sql = "UPDATE users SET password = :password WHERE login = :login"
+        params = {"password": password, "login": login}
+        if expected is not None:
+            sql += " AND password = :expected"
+            params["expected"] = expected
+        try:
+            result = await self.session.execute(text(sql + " RETURNING *"), params)
+            row = result.mappings().first()
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(f"Ошибка при смене пароля пользователя {login}: {e}", exc_info=True)
+            raise
+        return _returned_user(row) if row else None
+
     async def delete(self, user_id: int) -> None:
         delete_events = text("DELETE FROM users_event WHERE users_id = :user_id")
         delete_user = text("DELETE FROM users WHERE id = :user_id")
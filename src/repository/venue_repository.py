@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import logging
 
+from typing import Iterable
+
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from abstract_repository.ivenue_repository import IVenueRepository
+from models.trusted import trusted
 from models.venue import Venue
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -24,7 +28,7 @@ class VenueRepository(IVenueRepository):
         try:
             result = await self.session.execute(query)
             venues = [
-                Venue(venue_id=row["venue_id"], name=row["name"])
+                trusted(Venue, venue_id=row["venue_id"], name=row["name"])
                 for row in result.mappings()
             ]
             logger.debug("Успешно получено %d площадок", len(venues))
@@ -33,20 +37,52 @@ class VenueRepository(IVenueRepository):
             logger.error("Ошибка при получении списка площадок: %s", str(e), exc_info=True)
             raise
 
+    async def get_page(self, limit: int, offset: int) -> list[Venue]:
+        query = text("SELECT * FROM Venue ORDER BY venue_id LIMIT :limit OFFSET :offset")
+        try:
+            result = await self.session.execute(query, {"limit": limit, "offset": offset})
+            return [
+                trusted(Venue, venue_id=row["venue_id"], name=row["name"])
+                for row in result.mappings()
+            ]
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении страницы площадок: %s", str(e), exc_info=True)
+            raise
+
     async def get_by_id(self, venue_id: int) -> Venue | None:
+        if negative_cache.is_missing("venue", venue_id):
+            return None
         query = text("SELECT * FROM Venue WHERE venue_id = :venue_id")
         try:
             result = await self.session.execute(query, {"venue_id": venue_id})
             row = result.mappings().first()
             if row:
                 logger.debug("Найдена площадка ID %d: %s", venue_id, row["name"])
-                return Venue(venue_id=row["venue_id"], name=row["name"])
+                return trusted(Venue, venue_id=row["venue_id"], name=row["name"])
+            negative_cache.remember("venue", venue_id)
             logger.warning("Площадка с ID %d не найдена", venue_id)
             return None
         except SQLAlchemyError as e:
             logger.error("Ошибка при получении площадки по ID %d: %s", venue_id, str(e), exc_info=True)
             return None
 
+    async def get_by_ids(self, venue_ids: Iterable[int]) -> dict[int, Venue]:
+        ids = negative_cache.unknown("venue", venue_ids)
+        if not ids:
+            return {}
+        query = text("SELECT * FROM Venue WHERE venue_id = ANY(:ids)")
+        try:
+            result = await self.session.execute(query, {"ids": ids})
+            venues = {
+                row["venue_id"]: trusted(Venue, venue_id=row["venue_id"], name=row["name"])
+                for row in result.mappings()
+            }
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при получении площадок по ID %s: %s", ids, str(e), exc_info=True)
+            return {}
+        negative_cache.remember_absent("venue", ids, venues)
+        return venues
+
     async def add(self, venue: Venue) -> Venue:
         query = text("INSERT INTO Venue (name) VALUES (:name) RETURNING venue_id")
         try:
@@ -55,6 +91,7 @@ class VenueRepository(IVenueRepository):
             await self.session.commit()
             logger.debug("Площадка '%s' успешно добавлена", venue.name)
             venue.venue_id = new_id
+            negative_cache.forget("venue", venue.venue_id)
         except IntegrityError:
             logger.warning("Площадка '%s' уже существует", venue.name)
             await self.session.rollback()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from typing import Any
+from typing import Iterable
 
 from bson import Int64
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -13,6 +14,8 @@ from pymongo.errors import PyMongoError
 from abstract_repository.ivenue_repository import IVenueRepository
 from abstract_repository.iactivity_repository import IActivityRepository
 from models.activity import Activity
+from models.trusted import trusted
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -26,12 +29,19 @@ class ActivityRepository(IActivityRepository):
         logger.debug("Инициализация ActivityRepository для MongoDB")
 
     async def get_list(self) -> list[Activity]:
+        return await self._load_list(self.activities.find().sort("_id"))
+
+    async def get_page(self, limit: int, offset: int) -> list[Activity]:
+        return await self._load_list(self.activities.find().sort("_id").skip(offset).limit(limit))
+
+    async def _load_list(self, cursor: Any) -> list[Activity]:
         try:
             activities = []
-            async for doc in self.activities.find().sort("_id"):
+            async for doc in cursor:
                 venue = await self.venue_repo.get_by_id(doc["venue_id"])
                 activities.append(
-                    Activity(
+                    trusted(
+                        Activity,
                         activity_id=int(doc["_id"]),
                         duration=doc["duration"],
                         address=doc["address"],
@@ -49,6 +59,8 @@ class ActivityRepository(IActivityRepository):
             return []
 
     async def get_by_id(self, activity_id: int) -> Activity | None:
+        if negative_cache.is_missing("activity", activity_id):
+            return None
         try:
             doc = await self.activities.find_one({"_id": activity_id})
             if doc:
@@ -56,7 +68,8 @@ class ActivityRepository(IActivityRepository):
                 logger.debug(
                     "Найдена активность ID %d: %s", activity_id, doc["activity_type"]
                 )
-                return Activity(
+                return trusted(
+                    Activity,
                     activity_id=int(doc["_id"]),
                     duration=doc["duration"],
                     address=doc["address"],
@@ -64,6 +77,7 @@ class ActivityRepository(IActivityRepository):
                     activity_time=doc["activity_time"],
                     venue=venue,
                 )
+            negative_cache.remember("activity", activity_id)
             logger.warning("Активность с ID %d не найдена", activity_id)
             return None
         except PyMongoError as e:
@@ -72,6 +86,31 @@ class ActivityRepository(IActivityRepository):
             )
             return None
 
+    async def get_by_ids(self, activity_ids: Iterable[int]) -> dict[int, Activity]:
+        ids = negative_cache.unknown("activity", activity_ids)
+        if not ids:
+            return {}
+        try:
+            docs = await self.activities.find({"_id": {"$in": ids}}).to_list(None)
+        except PyMongoError as e:
+            logger.error("Ошибка при получении активностей по ID %s: %s", ids, e)
+            return {}
+        venues = await self.venue_repo.get_by_ids(doc["venue_id"] for doc in docs)
+        activities = {
+            int(doc["_id"]): trusted(
+                Activity,
+                activity_id=int(doc["_id"]),
+                duration=doc["duration"],
+                address=doc["address"],
+                activity_type=doc["activity_type"],
+                activity_time=doc["activity_time"],
+                venue=venues.get(doc["venue_id"]),
+            )
+            for doc in docs
+        }
+        negative_cache.remember_absent("activity", ids, activities)
+        return activities
+
     async def add(self, activity: Activity) -> Activity:
         try:
             if not activity.venue:
@@ -97,6 +136,7 @@ class ActivityRepository(IActivityRepository):
 
             result = await self.activities.insert_one(doc)
             activity.activity_id = result.inserted_id
+            negative_cache.forget("activity", activity.activity_id)
             logger.debug(
                 "Активность '%s' успешно добавлена с ID %s",
                 activity.activity_type,
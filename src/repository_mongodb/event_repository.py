@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from typing import Any
+from typing import Iterable
 
 from bson import Int64
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -15,9 +16,11 @@ from abstract_repository.ilodging_repository import ILodgingRepository
 from abstract_repository.ievent_repository import IEventRepository
 from abstract_repository.iuser_repository import IUserRepository
 from models.activity import Activity
-from models.lodging import Lodging
 from models.event import Event
+from models.lodging import Lodging
+from models.trusted import trusted
 from models.user import User
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -105,11 +108,18 @@ class EventRepository(IEventRepository):
             return []
 
     async def get_list(self) -> list[Event]:
+        return await self._load_list(self.events.find().sort("_id"))
+
+    async def get_page(self, limit: int, offset: int) -> list[Event]:
+        return await self._load_list(self.events.find().sort("_id").skip(offset).limit(limit))
+
+    async def _load_list(self, cursor: Any) -> list[Event]:
         try:
             events = []
-            async for doc in self.events.find().sort("_id"):
+            async for doc in cursor:
                 events.append(
-                    Event(
+                    trusted(
+                        Event,
                         event_id=int(doc["_id"]),
                         status=doc["status"],
                         users=await self.get_users_by_event(int(doc["_id"])),
@@ -138,7 +148,8 @@ class EventRepository(IEventRepository):
                 return None
 
             logger.debug("Мероприятие с session ID %d успешно найдено", session_id)
-            return Event(
+            return trusted(
+                Event,
                 event_id=event["_id"],
                 status=event["status"],
                 users=await self.get_users_by_event(event["_id"]),
@@ -150,13 +161,17 @@ class EventRepository(IEventRepository):
             return None
 
     async def get_by_id(self, event_id: int) -> Event | None:
+        if negative_cache.is_missing("event", event_id):
+            return None
         try:
             event = await self.events.find_one({"_id": event_id})
             if not event:
+                negative_cache.remember("event", event_id)
                 return None
 
             logger.debug("Найдено мероприятие ID %d", event_id)
-            return Event(
+            return trusted(
+                Event,
                 event_id=event["_id"],
                 status=event["status"],
                 users=await self.get_users_by_event(event_id),
@@ -167,6 +182,42 @@ class EventRepository(IEventRepository):
             logger.error("Ошибка при получении по ID: %s", str(e), exc_info=True)
             return None
 
+    async def get_by_ids(self, event_ids: Iterable[int]) -> dict[int, Event]:
+        ids = negative_cache.unknown("event", event_ids)
+        if not ids:
+            return {}
+        try:
+            docs = await self.events.find({"_id": {"$in": ids}}).to_list(None)
+        except PyMongoError as e:
+            logger.error("Ошибка при получении по ID: %s", str(e), exc_info=True)
+            return {}
+        users = await self.user_repo.get_by_ids(
+            i for doc in docs for i in doc.get("users", [])
+        )
+        activities = await self.activity_repo.get_by_ids(
+            i for doc in docs for i in doc.get("activities", [])
+        )
+        lodgings = await self.lodging_repo.get_by_ids(
+            int(i) for doc in docs for i in doc.get("lodgings", [])
+        )
+        events = {
+            int(doc["_id"]): trusted(
+                Event,
+                event_id=doc["_id"],
+                status=doc["status"],
+                users=[users[i] for i in doc.get("users", []) if i in users],
+                activities=[
+                    activities[i] for i in doc.get("activities", []) if i in activities
+                ],
+                lodgings=[
+                    lodgings[int(i)] for i in doc.get("lodgings", []) if int(i) in lodgings
+                ],
+            )
+            for doc in docs
+        }
+        negative_cache.remember_absent("event", ids, events)
+        return events
+
     async def add(self, event: Event) -> Event:
         try:
             last_id = await self.events.find().sort("_id", -1).limit(1).next()
@@ -185,6 +236,7 @@ class EventRepository(IEventRepository):
 
             result = await self.events.insert_one(doc)
             event.event_id = result.inserted_id
+            negative_cache.forget("event", event.event_id)
             logger.debug("Мероприятие создано с ID %s", str(result.inserted_id))
             return event
         except DuplicateKeyError:
@@ -273,7 +325,8 @@ class EventRepository(IEventRepository):
             events = []
             async for doc in self.events.find(query):
                 events.append(
-                    Event(
+                    trusted(
+                        Event,
                         event_id=int(doc["_id"]),
                         status=doc["status"],
                         users=await self.get_users_by_event(int(doc["_id"])),
@@ -342,7 +395,8 @@ class EventRepository(IEventRepository):
             events = []
             async for doc in self.events.find({"status": status, "users": user_id}):
                 events.append(
-                    Event(
+                    trusted(
+                        Event,
                         event_id=int(doc["_id"]),
                         status=doc["status"],
                         users=await self.get_users_by_event(int(doc["_id"])),
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from typing import Any
+from typing import Iterable
 
 from bson import Int64
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -12,6 +13,8 @@ from pymongo.errors import PyMongoError
 from abstract_repository.ilodging_repository import ILodgingRepository
 from abstract_repository.ivenue_repository import IVenueRepository
 from models.lodging import Lodging
+from models.trusted import trusted
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -25,9 +28,15 @@ class LodgingRepository(ILodgingRepository):
         logger.debug("Инициализация LodgingRepository для MongoDB")
 
     async def get_list(self) -> list[Lodging]:
+        return await self._load_list(self.collection.find().sort("_id"))
+
+    async def get_page(self, limit: int, offset: int) -> list[Lodging]:
+        return await self._load_list(self.collection.find().sort("_id").skip(offset).limit(limit))
+
+    async def _load_list(self, cursor: Any) -> list[Lodging]:
         try:
             lodgings = []
-            async for doc in self.collection.find().sort("_id"):
+            async for doc in cursor:
                 venue = await self.venue_repo.get_by_id(doc["venue_id"])
                 if not venue:
                     logger.warning(
@@ -36,7 +45,8 @@ class LodgingRepository(ILodgingRepository):
                     continue
 
                 lodgings.append(
-                    Lodging(
+                    trusted(
+                        Lodging,
                         lodging_id=int(doc["_id"]),
                         price=doc["price"],
                         address=doc["address"],
@@ -58,9 +68,12 @@ class LodgingRepository(ILodgingRepository):
             raise
 
     async def get_by_id(self, lodging_id: int) -> Lodging | None:
+        if negative_cache.is_missing("lodging", lodging_id):
+            return None
         try:
             doc = await self.collection.find_one({"_id": int(lodging_id)})
             if not doc:
+                negative_cache.remember("lodging", lodging_id)
                 logger.warning("Размещение с ID %d не найдено", lodging_id)
                 return None
 
@@ -72,7 +85,8 @@ class LodgingRepository(ILodgingRepository):
                 return None
 
             logger.debug("Найдено размещение ID %d: %s", lodging_id, doc["name"])
-            return Lodging(
+            return trusted(
+                Lodging,
                 lodging_id=int(doc["_id"]),
                 price=doc["price"],
                 address=doc["address"],
@@ -92,6 +106,42 @@ class LodgingRepository(ILodgingRepository):
             )
             return None
 
+    async def get_by_ids(self, lodging_ids: Iterable[int]) -> dict[int, Lodging]:
+        ids = [int(i) for i in negative_cache.unknown("lodging", lodging_ids)]
+        if not ids:
+            return {}
+        try:
+            docs = await self.collection.find({"_id": {"$in": ids}}).to_list(None)
+        except PyMongoError as e:
+            logger.error(
+                "Ошибка при получении размещений по ID %s: %s", ids, str(e), exc_info=True
+            )
+            return {}
+        venues = await self.venue_repo.get_by_ids(doc["venue_id"] for doc in docs)
+        lodgings = {}
+        for doc in docs:
+            # Как и get_by_id: размещение без площадки не отдаём
+            venue = venues.get(doc["venue_id"])
+            if not venue:
+                logger.warning(
+                    f"Площадка с ID {doc['venue_id']} не найдена для размещения {doc['_id']}"
+                )
+                continue
+            lodgings[int(doc["_id"])] = trusted(
+                Lodging,
+                lodging_id=int(doc["_id"]),
+                price=doc["price"],
+                address=doc["address"],
+                name=doc["name"],
+                type=doc["type"],
+                rating=doc["rating"],
+                check_in=doc["check_in"],
+                check_out=doc["check_out"],
+                venue=venue,
+            )
+        negative_cache.remember_absent("lodging", ids, {int(doc["_id"]) for doc in docs})
+        return lodgings
+
     async def add(self, lodging: Lodging) -> Lodging:
         try:
             if lodging.venue is None:
@@ -117,6 +167,7 @@ class LodgingRepository(ILodgingRepository):
                 "Размещение '%s' успешно добавлено с ID %d", lodging.name, new_id
             )
             lodging.lodging_id = new_id
+            negative_cache.forget("lodging", lodging.lodging_id)
             return lodging
         except PyMongoError as e:
             logger.error(
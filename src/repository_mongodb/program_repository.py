@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from typing import Any
+from typing import Iterable
 
 from bson import Int64
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -10,9 +11,14 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo.errors import DuplicateKeyError
 from pymongo.errors import PyMongoError
 
+from abstract_repository.include import Include
+from abstract_repository.include import resolve_include
 from abstract_repository.ivenue_repository import IVenueRepository
 from abstract_repository.iprogram_repository import IProgramRepository
 from models.program import Program
+from models.trusted import trusted
+from models.unloaded import Unloaded
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -26,9 +32,15 @@ class ProgramRepository(IProgramRepository):
         logger.debug("Инициализация ProgramRepository для MongoDB")
 
     async def get_list(self) -> list[Program]:
+        return await self._load_list(self.collection.find().sort("_id"))
+
+    async def get_page(self, limit: int, offset: int) -> list[Program]:
+        return await self._load_list(self.collection.find().sort("_id").skip(offset).limit(limit))
+
+    async def _load_list(self, cursor: Any) -> list[Program]:
         try:
             programs = []
-            async for doc in self.collection.find().sort("_id"):
+            async for doc in cursor:
                 start_venue = await self.venue_repo.get_by_id(
                     doc["start_venue_id"]
                 )
@@ -41,7 +53,8 @@ class ProgramRepository(IProgramRepository):
                     continue
 
                 programs.append(
-                    Program(
+                    trusted(
+                        Program,
                         program_id=int(doc["_id"]),
                         transfer_type=doc["transfer_type"],
                         cost=doc["price"],
@@ -59,22 +72,33 @@ class ProgramRepository(IProgramRepository):
             )
             return []
 
-    async def get_by_id(self, program_id: int) -> Program | None:
+    async def get_by_id(
+        self, program_id: int, include: Include = None
+    ) -> Program | None:
+        paths = resolve_include(include, self.INCLUDE_PATHS)
+        if negative_cache.is_missing("program", program_id):
+            return None
         try:
             doc = await self.collection.find_one({"_id": program_id})
             if not doc:
+                negative_cache.remember("program", program_id)
                 logger.warning("Программа с ID %d не найдена", program_id)
                 return None
 
-            start_venue = await self.venue_repo.get_by_id(doc["start_venue_id"])
-            end_venue = await self.venue_repo.get_by_id(doc["end_venue_id"])
+            if "venues" in paths:
+                start_venue = await self.venue_repo.get_by_id(doc["start_venue_id"])
+                end_venue = await self.venue_repo.get_by_id(doc["end_venue_id"])
+            else:
+                start_venue = Unloaded("venue", doc["start_venue_id"])
+                end_venue = Unloaded("venue", doc["end_venue_id"])
 
             if not start_venue or not end_venue:
                 logger.warning(f"Не удалось найти площадки для программы {doc['_id']}")
                 return None
 
             logger.debug("Найдена программа ID %d", program_id)
-            return Program(
+            return trusted(
+                Program,
                 program_id=int(doc["_id"]),
                 transfer_type=doc["transfer_type"],
                 cost=doc["price"],
@@ -91,6 +115,41 @@ class ProgramRepository(IProgramRepository):
             )
             return None
 
+    async def get_by_ids(self, program_ids: Iterable[int]) -> dict[int, Program]:
+        ids = negative_cache.unknown("program", program_ids)
+        if not ids:
+            return {}
+        try:
+            docs = await self.collection.find({"_id": {"$in": ids}}).to_list(None)
+        except PyMongoError as e:
+            logger.error(
+                "Ошибка при получении программ по ID %s: %s", ids, str(e), exc_info=True
+            )
+            return {}
+        venues = await self.venue_repo.get_by_ids(
+            venue_id
+            for doc in docs
+            for venue_id in (doc["start_venue_id"], doc["end_venue_id"])
+        )
+        programs = {}
+        for doc in docs:
+            start_venue = venues.get(doc["start_venue_id"])
+            end_venue = venues.get(doc["end_venue_id"])
+            if not start_venue or not end_venue:
+                logger.warning(f"Не удалось найти площадки для программы {doc['_id']}")
+                continue
+            programs[int(doc["_id"])] = trusted(
+                Program,
+                program_id=int(doc["_id"]),
+                transfer_type=doc["transfer_type"],
+                cost=doc["price"],
+                transfer_duration_minutes=doc["transfer_duration_minutes"],
+                start_venue=start_venue,
+                end_venue=end_venue,
+            )
+        negative_cache.remember_absent("program", ids, {int(doc["_id"]) for doc in docs})
+        return programs
+
     async def add(self, program: Program) -> Program:
         try:
             if (
@@ -115,6 +174,7 @@ class ProgramRepository(IProgramRepository):
             await self.collection.insert_one(doc)
             logger.debug("Программа успешно добавлена с ID %s", new_id)
             program.program_id = new_id
+            negative_cache.forget("program", program.program_id)
             return program
         except DuplicateKeyError:
             logger.warning("Такая программа уже существует")
@@ -204,7 +264,8 @@ class ProgramRepository(IProgramRepository):
                 return None
 
             logger.debug("Найдена программа ID %s", str(doc["_id"]))
-            return Program(
+            return trusted(
+                Program,
                 program_id=int(doc["_id"]),
                 transfer_type=transfer_type,
                 cost=doc["price"],
@@ -2,25 +2,46 @@ from __future__ import annotations
 
 import logging
 
+from datetime import datetime
 from datetime import timedelta
 from typing import Any
+from typing import Iterable
 
 from bson import Int64
 from motor.motor_asyncio import AsyncIOMotorClient
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 from pymongo.errors import PyMongoError
 
+from abstract_repository.include import SHALLOW
+from abstract_repository.include import Include
+from abstract_repository.include import resolve_include
 from abstract_repository.iprogram_repository import IProgramRepository
 from abstract_repository.isession_repository import ISessionRepository
 from abstract_repository.ievent_repository import IEventRepository
 from models.program import Program
 from models.session import Session
+from models.trusted import trusted
+from models.unloaded import Unloaded
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
 
 
+def _returned_session(doc: dict[str, Any]) -> Session:
+    return trusted(
+        Session,
+        session_id=int(doc["_id"]),
+        program=Unloaded("program", doc["program"]["_id"]),
+        event=Unloaded("event", doc["event"]["_id"]),
+        start_time=doc["start_time"],
+        end_time=doc["end_time"],
+        type=doc["type"],
+    )
+
+
 class SessionRepository(ISessionRepository):
     def __init__(
         self,
@@ -35,14 +56,21 @@ class SessionRepository(ISessionRepository):
         logger.debug("Инициализация SessionRepository для MongoDB")
 
     async def get_list(self) -> list[Session]:
+        return await self._load_list(self.sessions.find())
+
+    async def get_page(self, limit: int, offset: int) -> list[Session]:
+        return await self._load_list(self.sessions.find().sort("_id").skip(offset).limit(limit))
+
+    async def _load_list(self, cursor: Any) -> list[Session]:
         try:
             sessions = []
-            async for doc in self.sessions.find():
+            async for doc in cursor:
                 program_doc = await self.program_repo.get_by_id(doc["program"]["_id"])
                 event_doc = await self.event_repo.get_by_id(doc["event"]["_id"])
 
                 sessions.append(
-                    Session(
+                    trusted(
+                        Session,
                         session_id=int(doc["_id"]),
                         program=program_doc,
                         event=event_doc,
@@ -59,15 +87,32 @@ class SessionRepository(ISessionRepository):
             )
             return []
 
-    async def get_by_id(self, session_id: int) -> Session | None:
+    async def get_by_id(
+        self, session_id: int, include: Include = None
+    ) -> Session | None:
+        paths = resolve_include(include, self.INCLUDE_PATHS)
+        if negative_cache.is_missing("session", session_id):
+            return None
         try:
             doc = await self.sessions.find_one({"_id": session_id})
             if doc:
-                program_doc = await self.program_repo.get_by_id(doc["program"]["_id"])
-                event_doc = await self.event_repo.get_by_id(doc["event"]["_id"])
+                program_id = doc["program"]["_id"]
+                event_id = doc["event"]["_id"]
+                if "program" in paths:
+                    program_doc = await self.program_repo.get_by_id(
+                        program_id,
+                        include=None if "program.venues" in paths else SHALLOW,
+                    )
+                else:
+                    program_doc = Unloaded("program", program_id)
+                if "event" in paths:
+                    event_doc = await self.event_repo.get_by_id(event_id)
+                else:
+                    event_doc = Unloaded("event", event_id)
 
                 logger.debug("Найдена сессия ID %d", session_id)
-                return Session(
+                return trusted(
+                    Session,
                     session_id=int(doc["_id"]),
                     program=program_doc,
                     event=event_doc,
@@ -75,6 +120,7 @@ class SessionRepository(ISessionRepository):
                     end_time=doc["end_time"],
                     type=doc["type"],
                 )
+            negative_cache.remember("session", session_id)
             logger.warning("Сессия с ID %d не найдена", session_id)
             return None
         except PyMongoError as e:
@@ -86,6 +132,34 @@ class SessionRepository(ISessionRepository):
             )
             return None
 
+    async def get_by_ids(self, session_ids: Iterable[int]) -> dict[int, Session]:
+        ids = negative_cache.unknown("session", session_ids)
+        if not ids:
+            return {}
+        try:
+            docs = await self.sessions.find({"_id": {"$in": ids}}).to_list(None)
+        except PyMongoError as e:
+            logger.error(
+                "Ошибка при получении сессий по ID %s: %s", ids, str(e), exc_info=True
+            )
+            return {}
+        programs = await self.program_repo.get_by_ids(doc["program"]["_id"] for doc in docs)
+        events = await self.event_repo.get_by_ids(doc["event"]["_id"] for doc in docs)
+        sessions = {
+            int(doc["_id"]): trusted(
+                Session,
+                session_id=int(doc["_id"]),
+                program=programs.get(doc["program"]["_id"]),
+                event=events.get(doc["event"]["_id"]),
+                start_time=doc["start_time"],
+                end_time=doc["end_time"],
+                type=doc["type"],
+            )
+            for doc in docs
+        }
+        negative_cache.remember_absent("session", ids, sessions)
+        return sessions
+
     async def add(self, session: Session) -> Session:
         try:
             if not session.event:
@@ -109,6 +183,7 @@ class SessionRepository(ISessionRepository):
 
             result = await self.sessions.insert_one(doc)
             session.session_id = int(str(result.inserted_id))
+            negative_cache.forget("session", session.session_id)
             logger.debug("Сессия успешно добавлена с ID %s", str(result.inserted_id))
             return session
 
@@ -158,6 +233,97 @@ class SessionRepository(ISessionRepository):
                 exc_info=True,
             )
 
+    async def patch(self, session_id: int, changes: dict[str, Any]) -> Session | None:
+        unknown = set(changes) - self.PATCH_FIELDS
+        if not changes or unknown:
+            raise ValueError(f"Недопустимые поля для изменения сессии: {sorted(unknown)}")
+        update = {"$set": changes}
+        try:
+            if "start_time" in changes or "end_time" in changes:
+                # Порядок дат проверяется условием на итоговые значения
+                start = changes.get("start_time", "$start_time")
+                end = changes.get("end_time", "$end_time")
+                condition = {"_id": session_id, "$expr": {"$lt": [start, end]}}
+                doc = await self.sessions.find_one_and_update(
+                    condition, update, return_document=ReturnDocument.AFTER
+                )
+                if doc is None and await self.sessions.count_documents({"_id": session_id}):
+                    raise ValueError("end_time должен быть позже start_time")
+            else:
+                doc = await self.sessions.find_one_and_update(
+                    {"_id": session_id}, update, return_document=ReturnDocument.AFTER
+                )
+        except PyMongoError as e:
+            logger.error(
+                "Ошибка при изменении сессии ID %d: %s", session_id, str(e), exc_info=True
+            )
+            raise
+        return _returned_session(doc) if doc else None
+
+    async def extend(self, session_id: int, end_time: datetime) -> Session | None:
+        try:
+            doc = await self.sessions.find_one_and_update(
+                {"_id": session_id, "end_time": {"$lt": end_time}},
+                {"$set": {"end_time": end_time}},
+                return_document=ReturnDocument.AFTER,
+            )
+            if doc is None:
+                current = await self.sessions.find_one(
+                    {"_id": session_id}, {"end_time": 1}
+                )
+                if current is None:
+                    return None
+                raise ValueError(
+                    f"New end date {end_time} must be after current end date {current['end_time']}"
+                )
+        except PyMongoError as e:
+            logger.error(
+                "Ошибка при продлении сессии ID %d: %s", session_id, str(e), exc_info=True
+            )
+            raise
+        return _returned_session(doc)
+
+    async def join_event(self, session_id: int, user_id: int) -> Session | None:
+        try:
+            doc = await self.sessions.find_one({"_id": session_id})
+            if doc is None:
+                return None
+            event_id = doc["event"]["_id"]
+            # Условие в фильтре делает добавление атомарным: второй такой же
+            # запрос ничего не изменит
+            joined = await self.db["events"].update_one(
+                {"_id": event_id, "users": {"$ne": user_id}},
+                {"$push": {"users": user_id}},
+            )
+            if joined.modified_count == 0:
+                raise ValueError("User already joined this event")
+            last_id = await self.sessions.find().sort("_id", -1).limit(1).next()
+            personal = {
+                "_id": int(last_id["_id"]) + 1,
+                "program": doc["program"],
+                "event": doc["event"],
+                "start_time": doc["start_time"],
+                "end_time": doc["end_time"],
+                "type": "Личные",
+            }
+            try:
+                await self.sessions.insert_one(personal)
+            except PyMongoError:
+                await self.db["events"].update_one(
+                    {"_id": event_id}, {"$pull": {"users": user_id}}
+                )
+                raise
+        except PyMongoError as e:
+            logger.error(
+                "Ошибка при присоединении к сессии ID %d: %s",
+                session_id,
+                str(e),
+                exc_info=True,
+            )
+            raise
+        negative_cache.forget("session", personal["_id"])
+        return _returned_session(personal)
+
     async def delete(self, session_id: int) -> None:
         try:
             result = await self.sessions.delete_one({"_id": session_id})
@@ -183,7 +349,8 @@ class SessionRepository(ISessionRepository):
                 event_doc = await self.event_repo.get_by_id(doc["event"]["_id"])
 
                 sessions.append(
-                    Session(
+                    trusted(
+                        Session,
                         session_id=int(doc["_id"]),
                         program=program_doc,
                         event=event_doc,
@@ -223,7 +390,8 @@ class SessionRepository(ISessionRepository):
                 event_doc = await self.event_repo.get_by_id(doc["event"]["_id"])
 
                 sessions.append(
-                    Session(
+                    trusted(
+                        Session,
                         session_id=int(doc["_id"]),
                         program=program_doc,
                         event=event_doc,
@@ -496,7 +664,8 @@ class SessionRepository(ISessionRepository):
                 event_doc = await self.event_repo.get_by_id(doc["event"]["_id"])
 
                 sessions.append(
-                    Session(
+                    trusted(
+                        Session,
                         session_id=int(doc["_id"]),
                         program=program_doc,
                         event=event_doc,
@@ -523,6 +692,17 @@ class SessionRepository(ISessionRepository):
             )
             raise
 
+    async def get_sessions_for_user(
+        self, user_id: int, statuses: list[str]
+    ) -> list[Session]:
+        sessions: list[Session] = []
+        for status in statuses:
+            for event in await self.event_repo.get_events_for_user(user_id, status):
+                sessions.extend(
+                    await self.get_sessions_by_event_id_ordered(event.event_id)
+                )
+        return sessions
+
     async def get_sessions_by_type(self, type_session: str) -> list[Session]:
         try:
             sessions = []
@@ -531,7 +711,8 @@ class SessionRepository(ISessionRepository):
                 event_doc = await self.event_repo.get_by_id(doc["event"]["_id"])
 
                 sessions.append(
-                    Session(
+                    trusted(
+                        Session,
                         session_id=int(doc["_id"]),
                         program=program_doc,
                         event=event_doc,
@@ -552,6 +733,78 @@ class SessionRepository(ISessionRepository):
             )
             return []
 
+    async def get_sessions_overview(self) -> dict[str, list[dict[str, Any]]]:
+        sessions = await self.get_list()
+        events = await self.event_repo.get_list()
+        programs = await self.program_repo.get_list()
+        return {
+            "sessions": [
+                {
+                    "id": s.session_id,
+                    "start_time": s.start_time,
+                    "end_time": s.end_time,
+                    "type": s.type,
+                    "program_id": s.program.program_id if s.program else None,
+                    "event_id": s.event.event_id if s.event else None,
+                }
+                for s in sessions
+            ],
+            "events": [
+                {
+                    "id": e.event_id,
+                    "status": e.status,
+                    "users": [
+                        {"user_id": u.user_id, "fio": u.fio, "email": u.email}
+                        for u in e.users
+                    ],
+                    "activities": [
+                        {
+                            "id": a.activity_id,
+                            "duration": a.duration,
+                            "address": a.address,
+                            "activity_type": a.activity_type,
+                            "activity_time": a.activity_time,
+                            "venue_id": a.venue.venue_id if a.venue else None,
+                            "venue_name": a.venue.name if a.venue else None,
+                        }
+                        for a in e.activities
+                    ],
+                    "lodgings": [
+                        {
+                            "id": ldg.lodging_id,
+                            "price": ldg.price,
+                            "address": ldg.address,
+                            "name": ldg.name,
+                            "type": ldg.type,
+                            "rating": ldg.rating,
+                            "check_in": ldg.check_in,
+                            "check_out": ldg.check_out,
+                            "venue_id": ldg.venue.venue_id if ldg.venue else None,
+                            "venue_name": ldg.venue.name if ldg.venue else None,
+                        }
+                        for ldg in e.lodgings
+                    ],
+                }
+                for e in events
+                if e.users
+            ],
+            "programs": [
+                {
+                    "id": p.program_id,
+                    "transfer_type": p.transfer_type,
+                    "cost": p.cost,
+                    "transfer_duration_minutes": p.transfer_duration_minutes,
+                    "start_venue": p.start_venue.name if p.start_venue else None,
+                    "end_venue": p.end_venue.name if p.end_venue else None,
+                }
+                for p in programs
+            ],
+        }
+
+    async def get_catalog_by_type(self, type_session: str) -> list[dict[str, Any]] | None:
+        # Витрины каталога в MongoDB нет — сервис соберёт каталог из сессий
+        return None
+
     async def get_session_parts(self, event_id: int) -> list[dict[str, Any]]:
         try:
             session_parts = []
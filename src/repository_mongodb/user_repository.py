@@ -3,19 +3,46 @@ from __future__ import annotations
 import logging
 
 from typing import Any
+from typing import AsyncIterator
+from typing import Iterable
 
 from bson import Int64
 from motor.motor_asyncio import AsyncIOMotorClient
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 from pymongo.errors import PyMongoError
 
 from abstract_repository.iuser_repository import IUserRepository
+from models.trusted import trusted
 from models.user import User
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
 
+_PATCH_FIELDS = {
+    "fio": "full_name",
+    "number_passport": "passport",
+    "phone_number": "phone",
+    "email": "email",
+    "login": "login",
+}
+
+
+def _returned_user(doc: dict[str, Any]) -> User:
+    return trusted(
+        User,
+        user_id=int(doc["_id"]),
+        fio=doc["full_name"],
+        number_passport=doc["passport"],
+        phone_number=doc["phone"],
+        email=doc["email"],
+        login=doc["login"],
+        password=doc["password"],
+        is_admin=doc.get("is_admin", False),
+    )
+
 
 class UserRepository(IUserRepository):
     def __init__(self, client: AsyncIOMotorClient[Any]):
@@ -42,6 +69,7 @@ class UserRepository(IUserRepository):
 
             result = await self.users.insert_one(user_data)
             user.user_id = result.inserted_id
+            negative_cache.forget("user", user.user_id)
             logger.debug(
                 f"Пользователь добавлен (ID: {result.inserted_id}): {user.login}"
             )
@@ -52,11 +80,18 @@ class UserRepository(IUserRepository):
             raise
 
     async def get_list(self) -> list[User]:
+        return await self._load_list(self.users.find().sort("_id"))
+
+    async def get_page(self, limit: int, offset: int) -> list[User]:
+        return await self._load_list(self.users.find().sort("_id").skip(offset).limit(limit))
+
+    async def _load_list(self, cursor: Any) -> list[User]:
         try:
             users = []
-            async for doc in self.users.find().sort("_id"):
+            async for doc in cursor:
                 users.append(
-                    User(
+                    trusted(
+                        User,
                         user_id=int(doc["_id"]),
                         fio=doc["full_name"],
                         number_passport=doc["passport"],
@@ -76,12 +111,32 @@ class UserRepository(IUserRepository):
             )
             return []
 
+    async def iter_list(self, batch_size: int = 500) -> AsyncIterator[User]:
+        try:
+            async for doc in self.users.find().sort("_id").batch_size(batch_size):
+                yield trusted(
+                    User,
+                    user_id=int(doc["_id"]),
+                    fio=doc["full_name"],
+                    number_passport=doc["passport"],
+                    phone_number=doc["phone"],
+                    email=doc["email"],
+                    login=doc["login"],
+                    password=doc["password"],
+                    is_admin=doc.get("is_admin", False),
+                )
+        except PyMongoError as e:
+            logger.error(f"Ошибка при потоковом чтении пользователей: {e}", exc_info=True)
+
     async def get_by_id(self, user_id: int) -> User | None:
+        if negative_cache.is_missing("user", user_id):
+            return None
         try:
             doc = await self.users.find_one({"_id": user_id})
             if doc:
                 logger.debug(f"Пользователь найден по ID {user_id}")
-                return User(
+                return trusted(
+                    User,
                     user_id=int(doc["_id"]),
                     fio=doc["full_name"],
                     number_passport=doc["passport"],
@@ -91,6 +146,7 @@ class UserRepository(IUserRepository):
                     password=doc["password"],
                     is_admin=doc.get("is_admin", False),
                 )
+            negative_cache.remember("user", user_id)
             logger.debug(f"Пользователь с ID {user_id} не найден")
             return None
 
@@ -100,6 +156,33 @@ class UserRepository(IUserRepository):
             )
             return None
 
+    async def get_by_ids(self, user_ids: Iterable[int]) -> dict[int, User]:
+        ids = negative_cache.unknown("user", user_ids)
+        if not ids:
+            return {}
+        try:
+            users = {
+                int(doc["_id"]): trusted(
+                    User,
+                    user_id=int(doc["_id"]),
+                    fio=doc["full_name"],
+                    number_passport=doc["passport"],
+                    phone_number=doc["phone"],
+                    email=doc["email"],
+                    login=doc["login"],
+                    password=doc["password"],
+                    is_admin=doc.get("is_admin", False),
+                )
+                async for doc in self.users.find({"_id": {"$in": ids}})
+            }
+        except PyMongoError as e:
+            logger.error(
+                "Ошибка при получении пользователей по ID %s: %s", ids, str(e), exc_info=True
+            )
+            return {}
+        negative_cache.remember_absent("user", ids, users)
+        return users
+
     async def get_by_login(self, login: str) -> User | None:
         try:
             doc = await self.users.find_one({"login": login})
@@ -108,7 +191,8 @@ class UserRepository(IUserRepository):
                 return None
 
             logger.debug(f"Пользователь найден по логину: {login}")
-            return User(
+            return trusted(
+                User,
                 user_id=int(doc["_id"]),
                 fio=doc["full_name"],
                 number_passport=doc["passport"],
@@ -164,6 +248,40 @@ class UserRepository(IUserRepository):
             )
             raise
 
+    async def patch(self, user_id: int, changes: dict[str, Any]) -> User | None:
+        unknown = set(changes) - self.PATCH_FIELDS
+        if not changes or unknown:
+            raise ValueError(f"Недопустимые поля для изменения пользователя: {sorted(unknown)}")
+        try:
+            doc = await self.users.find_one_and_update(
+                {"_id": user_id},
+                {"$set": {_PATCH_FIELDS[field]: value for field, value in changes.items()}},
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            raise ValueError("Пользователь с такими данными уже существует")
+        except PyMongoError as e:
+            logger.error(f"Ошибка при изменении пользователя с ID {user_id}: {e}", exc_info=True)
+            raise
+        return _returned_user(doc) if doc else None
+
+    async def update_password(
+        self, login: str, password: str, expected: str | None = None
+    ) -> User | None:
+        query = {"login": login}
+        if expected is not None:
+            query["password"] = expected
+        try:
+            doc = await self.users.find_one_and_update(
+                query,
+                {"$set": {"password": password}},
+                return_document=ReturnDocument.AFTER,
+            )
+        except PyMongoError as e:
+            logger.error(f"Ошибка при смене пароля пользователя {login}: {e}", exc_info=True)
+            raise
+        return _returned_user(doc) if doc else None
+
     async def delete(self, user_id: int) -> None:
         try:
             # Start a transaction if needed (MongoDB 4.0+)
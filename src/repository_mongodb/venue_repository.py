@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from typing import Any
+from typing import Iterable
 
 from bson import Int64
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -11,7 +12,9 @@ from pymongo.errors import DuplicateKeyError
 from pymongo.errors import PyMongoError
 
 from abstract_repository.ivenue_repository import IVenueRepository
+from models.trusted import trusted
 from models.venue import Venue
+from negative_cache import negative_cache
 
 
 logger = logging.getLogger(__name__)
@@ -24,10 +27,16 @@ class VenueRepository(IVenueRepository):
         logger.debug("Инициализация VenueRepository для MongoDB")
 
     async def get_list(self) -> list[Venue]:
+        return await self._load_list(self.collection.find().sort("_id"))
+
+    async def get_page(self, limit: int, offset: int) -> list[Venue]:
+        return await self._load_list(self.collection.find().sort("_id").skip(offset).limit(limit))
+
+    async def _load_list(self, cursor: Any) -> list[Venue]:
         try:
             venues = []
-            async for doc in self.collection.find().sort("_id"):
-                venues.append(Venue(venue_id=int(doc["_id"]), name=doc["name"]))
+            async for doc in cursor:
+                venues.append(trusted(Venue, venue_id=int(doc["_id"]), name=doc["name"]))
 
             logger.debug("Успешно получено %d площадок", len(venues))
             return venues
@@ -38,14 +47,17 @@ class VenueRepository(IVenueRepository):
             raise
 
     async def get_by_id(self, venue_id: int) -> Venue | None:
+        if negative_cache.is_missing("venue", venue_id):
+            return None
         try:
             doc = await self.collection.find_one({"_id": int(str(venue_id))})
             if not doc:
+                negative_cache.remember("venue", venue_id)
                 logger.warning("Площадка с ID %s не найдена", venue_id)
                 return None
 
             logger.debug("Найдена площадка ID %d: %s", venue_id, doc["name"])
-            return Venue(venue_id=int(doc["_id"]), name=doc["name"])
+            return trusted(Venue, venue_id=int(doc["_id"]), name=doc["name"])
         except PyMongoError as e:
             logger.error(
                 "Ошибка при получении площадки по ID %s: %s",
@@ -55,6 +67,23 @@ class VenueRepository(IVenueRepository):
             )
             return None
 
+    async def get_by_ids(self, venue_ids: Iterable[int]) -> dict[int, Venue]:
+        ids = [int(i) for i in negative_cache.unknown("venue", venue_ids)]
+        if not ids:
+            return {}
+        try:
+            venues = {
+                int(doc["_id"]): trusted(Venue, venue_id=int(doc["_id"]), name=doc["name"])
+                async for doc in self.collection.find({"_id": {"$in": ids}})
+            }
+        except PyMongoError as e:
+            logger.error(
+                "Ошибка при получении площадок по ID %s: %s", ids, str(e), exc_info=True
+            )
+            return {}
+        negative_cache.remember_absent("venue", ids, venues)
+        return venues
+
     async def add(self, venue: Venue) -> Venue:
         try:
             last_id = await self.collection.find().sort("_id", -1).limit(1).next()
@@ -65,6 +94,7 @@ class VenueRepository(IVenueRepository):
             new_id = result.inserted_id
             logger.debug("Площадка '%s' успешно добавлена с ID %d", venue.name, new_id)
             venue.venue_id = new_id
+            negative_cache.forget("venue", venue.venue_id)
             return venue
         except DuplicateKeyError:
             logger.warning("Площадка с именем '%s' уже существует", venue.name)
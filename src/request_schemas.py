@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from datetime import date
+from datetime import datetime
+from typing import Annotated
+from typing import Any
+from typing import Literal
+from typing import TypeVar
+
+from fastapi import Depends
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
+from pydantic import BeforeValidator
+from pydantic import ConfigDict
+from pydantic import EmailStr
+from pydantic import Field
+from pydantic import StringConstraints
+from pydantic import ValidationError
+from pydantic import model_validator
+
+from models.lodging import Lodging
+from models.user import User
+from models.venue import Venue
+
+
+M = TypeVar("M", bound=BaseModel)
+
+PositiveId = Annotated[int, Field(gt=0)]
+SessionType = Literal["Официальные", "Рекомендованные", "Личные"]
+EventStatus = Literal["Активное", "Завершено", "Отменено"]
+TransferType = Literal["Автобус", "Самолет", "Автомобиль", "Паром", "Поезд"]
+ActivityType = Literal[
+    "Конференция",
+    "Семинар",
+    "Выставка",
+    "Форум",
+    "Экскурсия",
+    "Нетворкинг",
+    "Мастер-класс",
+    "Выступление",
+    "Церемония",
+]
+LodgingType = Literal["Отель", "Хостел", "Аппартаменты", "Квартира"]
+Duration = Annotated[str, StringConstraints(pattern=r"^\d+\s*(час|часа|часов)$")]
+
+
+def _ru_date(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return datetime.strptime(value, "%d.%m.%Y")
+        except ValueError:
+            raise ValueError("Неверный формат даты. Используйте ДД.ММ.ГГГГ")
+    return value
+
+
+def _as_list(value: Any) -> Any:
+    # FormData с одним выбранным вариантом приходит строкой, без вариантов — null
+    if value is None:
+        return []
+    if isinstance(value, (str, int)):
+        return [value]
+    return value
+
+
+RuDate = Annotated[datetime, BeforeValidator(_ru_date)]
+IdList = Annotated[list[int], BeforeValidator(_as_list)]
+
+
+def json_body(schema: type[M]) -> Any:
+    """Зависимость FastAPI: тело запроса, разобранное сразу в схему.
+
+    Сырые байты идут в скомпилированный валидатор pydantic-core без
+    промежуточного dict. Ошибка разбора — 422 до вызова контроллера.
+    """
+    validator = schema.__pydantic_validator__
+
+    async def dependency(request: Request) -> M:
+        raw = await request.body()
+        try:
+            return validator.validate_json(raw)  # type: ignore[no-any-return]
+        except ValidationError as e:
+            errors = e.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("body", *error["loc"])
+            raise RequestValidationError(errors, body=raw)
+
+    return Depends(dependency)
+
+
+class VenueIn(BaseModel):
+    name: Annotated[str, StringConstraints(min_length=1, max_length=Venue.MAX_NAME_LENGTH)]
+
+
+class ActivityIn(BaseModel):
+    duration: Duration
+    address: Annotated[str, StringConstraints(min_length=1)]
+    activity_type: ActivityType
+    activity_time: datetime
+    venue: PositiveId
+
+
+class ActivityDatesIn(BaseModel):
+    activity_time: datetime
+    duration: Duration
+
+
+class LodgingDatesIn(BaseModel):
+    check_in: datetime
+    check_out: datetime
+
+    @model_validator(mode="after")
+    def check_order(self) -> LodgingDatesIn:
+        if self.check_out <= self.check_in:
+            raise ValueError("check_out должен быть позже check_in")
+        return self
+
+
+class LodgingIn(LodgingDatesIn):
+    price: PositiveId
+    address: Annotated[
+        str, StringConstraints(min_length=1, max_length=Lodging.MAX_ADDRESS_LENGTH)
+    ]
+    name: Annotated[str, StringConstraints(min_length=1, max_length=Lodging.MAX_NAME_LENGTH)]
+    type: LodgingType
+    rating: Annotated[int, Field(ge=1, le=Lodging.MAX_RATE)]
+    venue: PositiveId
+
+
+class ProgramIn(BaseModel):
+    transfer_type: TransferType
+    cost: PositiveId
+    transfer_duration_minutes: PositiveId
+    start_venue: PositiveId
+    end_venue: PositiveId
+
+
+class EventIn(BaseModel):
+    status: EventStatus
+    user_ids: Annotated[list[int], Field(min_length=1)]
+    activity_ids: Annotated[list[int], Field(min_length=1)]
+    lodging_ids: Annotated[list[int], Field(min_length=1)]
+
+
+class SessionIn(BaseModel):
+    program_id: PositiveId
+    event_id: PositiveId
+    start_time: datetime
+    end_time: datetime
+    type: SessionType
+
+    @model_validator(mode="after")
+    def check_order(self) -> SessionIn:
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time должен быть позже start_time")
+        return self
+
+
+class UserSessionIn(BaseModel):
+    """Форма /session/new: даты ДД.ММ.ГГГГ, списки ID как в FormData."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    start_date: RuDate
+    end_date: RuDate
+    start_venue: PositiveId
+    end_venue: PositiveId
+    transfer_type: TransferType
+    # Пользователь берётся из Bearer-токена; другой user_id может указать только администратор
+    user_id: PositiveId | None = None
+    activities: IdList = Field(default_factory=list, alias="activities[]")
+    lodgings: IdList = Field(default_factory=list, alias="lodgings[]")
+
+
+class SessionPatchIn(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    type: SessionType | None = None
+
+
+class SessionExtendIn(BaseModel):
+    new_end_date: date
+
+
+class TransferTypeIn(BaseModel):
+    transfer_type: TransferType
+    program_id: PositiveId | None = None
+
+
+class SessionVenueIn(BaseModel):
+    event_id: PositiveId
+    new_venue_id: PositiveId
+    after_venue_id: PositiveId
+    transfer_type: TransferType
+
+
+class SessionVenueDeleteIn(BaseModel):
+    event_id: PositiveId
+    venue_id: PositiveId
+
+
+class JoinSessionIn(BaseModel):
+    user_id: PositiveId | None = None
+
+
+Passport = Annotated[str, StringConstraints(min_length=User.PASSPORT_LENGTH)]
+Phone = Annotated[str, StringConstraints(pattern=r"^8\d{10}$")]
+Fio = Annotated[str, StringConstraints(min_length=1, max_length=User.MAX_FIO_LENGTH)]
+Login = Annotated[str, StringConstraints(min_length=1, max_length=User.MAX_LOGIN_LENGTH)]
+
+
+class UserIn(BaseModel):
+    """Регистрация. Сложность пароля проверяет модель User."""
+
+    fio: Fio
+    number_passport: Passport
+    phone_number: Phone
+    email: EmailStr
+    login: Login
+    password: Annotated[str, StringConstraints(min_length=User.MIN_PASSWORD_LENGTH)]
+
+
+class UserPatchIn(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    fio: Fio | None = None
+    number_passport: Passport | None = None
+    phone_number: Phone | None = None
+    email: EmailStr | None = None
+    login: Login | None = None
+
+
+class AdminUpdateIn(UserPatchIn):
+    """PUT из формы администратора: лишние поля формы игнорируются, пароль не меняется."""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class LoginIn(BaseModel):
+    login: str
+    password: str
+
+
+class RecoverPasswordIn(BaseModel):
+    login: str
+
+
+class ResetPasswordIn(BaseModel):
+    token: str
+    password: str
+
+
+class Verify2FAIn(BaseModel):
+    login: str
+    code: str
+    two_fa_token: str
+
+
+class TwoFAIn(BaseModel):
+    login: str
+    code: str
+
+
+class ExpirePasswordIn(BaseModel):
+    login: str
+
+
+class ChangePasswordIn(BaseModel):
+    login: str
+    new_password: str
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 
-from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter
@@ -10,24 +9,30 @@ from fastapi import Depends
 from fastapi import Request
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 
+from request_schemas import ActivityDatesIn
+from request_schemas import ActivityIn
+from request_schemas import json_body
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from templating import templates
 
 
 logger = logging.getLogger(__name__)
 
 activity_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
+activity_body = json_body(ActivityIn)
+activity_dates_body = json_body(ActivityDatesIn)
 
 
 @activity_router.post("/api/activities", response_class=HTMLResponse)
 async def create_activity(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    request: Request,
+    data: ActivityIn = activity_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_activity_contr().create_new_activity(request)
+    result = await service_locator.get_activity_contr().create_new_activity(data)
     logger.info("Активность успешно создана: %s", result)
     return templates.TemplateResponse("activity.html", {"request": request})
 
@@ -39,8 +44,6 @@ async def get_all_activities(
     activity_list = await service_locator.get_activity_contr().get_all_activities()
     activities = activity_list.get("activities", [])
     logger.info("Получено %d активностей", len(activities))
-    for a in activities:
-        a["activity_time"] = datetime.fromisoformat(a["activity_time"])
     logger.info("Получение списка площадок")
     venues_list = await service_locator.get_venue_contr().get_all_venues()
     venues = venues_list.get("venues", [])
@@ -64,10 +67,11 @@ async def get_activity(
 async def update_activity(
     activity_id: int,
     request: Request,
+    data: ActivityIn = activity_body,
     service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
     result = await service_locator.get_activity_contr().update_activity(
-        activity_id, request
+        activity_id, data
     )
     logger.info("Активность ID %d успешно обновлена: %s", activity_id, result)
     return templates.TemplateResponse("activity.html", {"request": request})
@@ -99,10 +103,12 @@ async def delete_activity_for_session(
 
 @activity_router.post("/activity/add/{session_id}", response_class=HTMLResponse)
 async def add_activity_to_session(
-    session_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    session_id: int,
+    data: ActivityIn = activity_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> RedirectResponse:
     try:
-        result = await service_locator.get_activity_contr().create_new_activity(request)
+        result = await service_locator.get_activity_contr().create_new_activity(data)
         logger.info("Активность успешно создана: %s", result)
         event = await service_locator.get_event_serv().get_event_by_session_id(
             session_id
@@ -131,9 +137,9 @@ async def add_activity_to_session(
 @activity_router.put("/activity/{activity_id}")
 async def update_activity_dates(
     activity_id: int,
-    request: Request,
+    data: ActivityDatesIn = activity_dates_body,
     service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     return await service_locator.get_activity_contr().update_activity_dates(
-        activity_id, request
+        activity_id, data
     )
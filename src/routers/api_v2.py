@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from dataclasses import dataclass
+from typing import Any
+from typing import Literal
+
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from models.activity import Activity
+from models.event import Event
+from models.lodging import Lodging
+from models.program import Program
+from models.session import Session
+from models.user import User
+from models.venue import Venue
+from service_locator import ServiceLocator
+from service_locator import get_service_locator
+from settings import settings
+
+
+try:
+    import orjson
+except ImportError:  # orjson — необязательная зависимость
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+api_v2_router = APIRouter(prefix="/api/v2")
+get_sl_dep = Depends(get_service_locator)
+
+Kind = Literal["venues", "programs", "sessions", "events", "activities", "lodgings", "users"]
+
+
+@dataclass(frozen=True, slots=True)
+class _Resource:
+    model: type[BaseModel]
+    id_field: str
+    # связь -> ресурс, на который она ссылается
+    relations: dict[str, str]
+    # поля, которые никогда не отдаются наружу
+    hidden: frozenset[str] = frozenset()
+
+
+RESOURCES: dict[str, _Resource] = {
+    "venues": _Resource(Venue, "venue_id", {}),
+    "programs": _Resource(
+        Program, "program_id", {"start_venue": "venues", "end_venue": "venues"}
+    ),
+    "sessions": _Resource(Session, "session_id", {"program": "programs", "event": "events"}),
+    "events": _Resource(
+        Event,
+        "event_id",
+        {"users": "users", "activities": "activities", "lodgings": "lodgings"},
+    ),
+    "activities": _Resource(Activity, "activity_id", {"venue": "venues"}),
+    "lodgings": _Resource(Lodging, "lodging_id", {"venue": "venues"}),
+    "users": _Resource(User, "user_id", {}, frozenset({"password", "number_passport"})),
+}
+
+
+def _parse_list(value: str | None) -> set[str] | None:
+    if value is None:
+        return None
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
+def parse_includes(kind: str, include: str | None) -> dict[str, Any]:
+    """Разбирает ?include=program.start_venue,event в дерево раскрываемых связей."""
+    tree: dict[str, Any] = {}
+    for path in _parse_list(include) or ():
+        node, current = tree, kind
+        for part in path.split("."):
+            target = RESOURCES[current].relations.get(part)
+            if target is None:
+                raise HTTPException(
+                    status_code=422, detail=f"Связь {part!r} недоступна для {current}"
+                )
+            node = node.setdefault(part, {})
+            current = target
+    return tree
+
+
+def parse_fields(kind: str, fields: str | None) -> set[str] | None:
+    selected = _parse_list(fields)
+    if selected is None:
+        return None
+    resource = RESOURCES[kind]
+    known = set(resource.model.model_fields) - resource.hidden
+    if unknown := selected - known:
+        raise HTTPException(
+            status_code=422, detail=f"Неизвестные поля {kind}: {', '.join(sorted(unknown))}"
+        )
+    return selected
+
+
+def _ref(value: Any, kind: str) -> Any:
+    """Нераскрытая связь отдаётся идентификатором."""
+    if value is None:
+        return None
+    id_field = RESOURCES[kind].id_field
+    if isinstance(value, list):
+        return [getattr(item, id_field) for item in value]
+    return getattr(value, id_field)
+
+
+def serialize(
+    entity: BaseModel,
+    kind: str,
+    fields: set[str] | None = None,
+    includes: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Сущность -> dict для JSON: только выбранные поля, связи — id или вложенный объект."""
+    resource = RESOURCES[kind]
+    includes = includes or {}
+    names = [
+        name
+        for name in type(entity).model_fields
+        if name not in resource.hidden and (fields is None or name in fields)
+    ]
+    scalars = [name for name in names if name not in resource.relations]
+    data = entity.model_dump(mode="json", include=set(scalars))
+    for name in names:
+        target = resource.relations.get(name)
+        if target is None:
+            continue
+        value = getattr(entity, name)
+        if name not in includes:
+            data[name] = _ref(value, target)
+        elif isinstance(value, list):
+            data[name] = [serialize(item, target, None, includes[name]) for item in value]
+        else:
+            data[name] = None if value is None else serialize(value, target, None, includes[name])
+    return {name: data[name] for name in names}
+
+
+def _json_response(payload: Any, status_code: int = 200) -> Response:
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def _service(service_locator: ServiceLocator, kind: str) -> Any:
+    services = {
+        "venues": service_locator.get_venue_serv,
+        "programs": service_locator.get_program_serv,
+        "sessions": service_locator.get_session_serv,
+        "events": service_locator.get_event_serv,
+        "activities": service_locator.get_activity_serv,
+        "lodgings": service_locator.get_lodging_serv,
+        "users": service_locator.get_user_serv,
+    }
+    return services[kind]()
+
+
+async def _load_list(
+    service_locator: ServiceLocator, kind: str, limit: int, offset: int
+) -> list[Any]:
+    return await _service(service_locator, kind).get_page(limit, offset)
+
+
+async def _load_one(service_locator: ServiceLocator, kind: str, entity_id: int) -> Any:
+    return await _service(service_locator, kind).get_by_id(entity_id)
+
+
+@api_v2_router.get("/{kind}")
+async def list_resources(
+    kind: Kind,
+    fields: str | None = None,
+    include: str | None = None,
+    limit: int = Query(50, ge=1),
+    offset: int = Query(0, ge=0),
+    service_locator: ServiceLocator = get_sl_dep,
+) -> Response:
+    selected = parse_fields(kind, fields)
+    includes = parse_includes(kind, include)
+    limit = min(limit, settings.API_V2_PAGE_MAX_SIZE)
+    items = await _load_list(service_locator, kind, limit, offset)
+    logger.info("API v2: отдано %d объектов %s", len(items), kind)
+    return _json_response(
+        {
+            "items": [serialize(item, kind, selected, includes) for item in items],
+            "offset": offset,
+            "limit": limit,
+        }
+    )
+
+
+@api_v2_router.get("/{kind}/{entity_id}")
+async def get_resource(
+    kind: Kind,
+    entity_id: int,
+    fields: str | None = None,
+    include: str | None = None,
+    service_locator: ServiceLocator = get_sl_dep,
+) -> Response:
+    selected = parse_fields(kind, fields)
+    includes = parse_includes(kind, include)
+    entity = await _load_one(service_locator, kind, entity_id)
+    if entity is None:
+        return _json_response({"detail": "Not found"}, status_code=404)
+    return _json_response(serialize(entity, kind, selected, includes))
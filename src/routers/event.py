@@ -2,108 +2,81 @@ from __future__ import annotations
 
 import logging
 
-from datetime import datetime
 from typing import Any
+from typing import Literal
 
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Query
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
 from fastapi.responses import Response
-from fastapi.templating import Jinja2Templates
 
+from request_schemas import EventIn
+from request_schemas import json_body
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from settings import settings
+from template_streaming import stream_template
+from templating import templates
+from view_models import dumps
 
 
 logger = logging.getLogger(__name__)
 
 event_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
+event_body = json_body(EventIn)
 
 
 @event_router.post("/api/events", response_class=HTMLResponse)
 async def create_event(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    request: Request,
+    data: EventIn = event_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_event_contr().create_new_event(request)
+    result = await service_locator.get_event_contr().create_new_event(data)
     logger.info("Мероприятие успешно создано: %s", result)
     return templates.TemplateResponse("event.html", {"request": request})
 
 
 @event_router.get("/event.html", response_class=HTMLResponse)
 async def get_all_events(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
-) -> HTMLResponse:
-    event_list = await service_locator.get_event_contr().get_all_events()
-    events = event_list.get("events", [])
-    logger.info("Получено %d мероприятий", len(events))
-
-    user_id = (
-        events[0]["users"][0]["user_id"] if events and events[0]["users"] else None
+    request: Request,
+    page: int = Query(1, ge=1),
+    service_locator: ServiceLocator = get_sl_dep,
+) -> Response:
+    # Списки пользователей, активностей и размещений для модальных окон
+    # подгружаются отдельно через /event/options/{kind}
+    result = await service_locator.get_event_contr().get_events_page(
+        page, settings.EVENT_PAGE_SIZE
     )
-    user = None
-    if user_id is not None:
-        logger.info("Получение данных пользователя ID %s", user_id)
-        user = await service_locator.get_user_contr().get_user_profile(user_id)
-    users = await service_locator.get_user_contr().get_all_users()
-    all_activities = await service_locator.get_activity_contr().get_all_activities()
-    all_lodgings = await service_locator.get_lodging_contr().get_all_lodgings()
-
-    activities = event_list.get("activities", [])
-    for a in all_activities["activities"]:
-        a["activity_time"] = datetime.fromisoformat(a["activity_time"])
-    for a in activities:
-        a["activity_time"] = datetime.fromisoformat(a["activity_time"])
-    lodgings = event_list.get("lodgings", [])
-    for ldg in lodgings:
-        ldg["check_in"] = datetime.fromisoformat(ldg["check_in"])
-        ldg["check_out"] = datetime.fromisoformat(ldg["check_out"])
-    for ldg in all_lodgings["lodgings"]:
-        ldg["check_in"] = datetime.fromisoformat(ldg["check_in"])
-        ldg["check_out"] = datetime.fromisoformat(ldg["check_out"])
-
-    for event in events:
-        for activity in event["activities"]:
-            if isinstance(activity.get("venue"), dict):
-                activity["venue_name"] = activity["venue"].get("name", "Undefined")
-            elif hasattr(activity.get("venue"), "name"):
-                activity["venue_name"] = activity["venue"].name
-            else:
-                activity["venue_name"] = "Undefined"
-
-        for lodging in event["lodgings"]:
-            if isinstance(lodging.get("venue"), dict):
-                lodging["venue_name"] = lodging["venue"].get("name", "Undefined")
-            elif hasattr(lodging.get("venue"), "name"):
-                lodging["venue_name"] = lodging["venue"].name
-            else:
-                lodging["venue_name"] = "Undefined"
-
-    logger.info("Данные об активностях и размещениях обработаны")
-    return templates.TemplateResponse(
-        "event.html",
-        {
-            "request": request,
-            "events": jsonable_encoder(events),
-            "user": user["user"] if user else None,
-            "activities": activities,
-            "lodgings": lodgings,
-            "users": users["users"],
-            "all_activities": all_activities["activities"],
-            "all_lodgings": all_lodgings["lodgings"],
-        },
+    logger.info("Получено %d мероприятий", len(result["events"]))
+    return await stream_template("event.html", {"request": request, **result})
+
+
+@event_router.get("/event/options/{kind}")
+async def get_event_options(
+    kind: Literal["users", "activities", "lodgings"],
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1),
+    service_locator: ServiceLocator = get_sl_dep,
+) -> Response:
+    result = await service_locator.get_event_contr().get_options_page(
+        kind, offset, min(limit, settings.OPTIONS_PAGE_MAX_SIZE)
     )
+    return Response(content=dumps(result, ensure_ascii=False), media_type="application/json")
 
 
 @event_router.put("/api/events/{event_id}", response_class=HTMLResponse)
 async def update_event(
-    event_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    event_id: int,
+    request: Request,
+    data: EventIn = event_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_event_contr().update_event(event_id, request)
+    result = await service_locator.get_event_contr().update_event(event_id, data)
     logger.info("Мероприятие ID %d успешно обновлено: %s", event_id, result)
     return templates.TemplateResponse("event.html", {"request": request})
 
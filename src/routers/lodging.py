@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 
-from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter
@@ -10,24 +9,30 @@ from fastapi import Depends
 from fastapi import Request
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 
+from request_schemas import LodgingDatesIn
+from request_schemas import LodgingIn
+from request_schemas import json_body
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from templating import templates
 
 
 logger = logging.getLogger(__name__)
 
 lodging_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
+lodging_body = json_body(LodgingIn)
+lodging_dates_body = json_body(LodgingDatesIn)
 
 
 @lodging_router.post("/api/lodgings", response_class=HTMLResponse)
 async def create_lodging(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    request: Request,
+    data: LodgingIn = lodging_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_lodging_contr().create_new_lodging(request)
+    result = await service_locator.get_lodging_contr().create_new_lodging(data)
     logger.info("Размещение успешно создано: %s", result)
     return templates.TemplateResponse("lodging.html", {"request": request})
 
@@ -39,9 +44,6 @@ async def get_all_lodgings(
     lodging_list = await service_locator.get_lodging_contr().get_all_lodgings()
     lodgings = lodging_list.get("lodgings", [])
     logger.info("Получено %d размещений", len(lodgings))
-    for ldg in lodgings:
-        ldg["check_in"] = datetime.fromisoformat(ldg["check_in"])
-        ldg["check_out"] = datetime.fromisoformat(ldg["check_out"])
     logger.info("Получение списка площадок")
     venues_list = await service_locator.get_venue_contr().get_all_venues()
     venues = venues_list.get("venues", [])
@@ -68,10 +70,11 @@ async def get_lodging(
 async def update_lodging(
     lodging_id: int,
     request: Request,
+    data: LodgingIn = lodging_body,
     service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
     result = await service_locator.get_lodging_contr().update_lodging(
-        lodging_id, request
+        lodging_id, data
     )
     logger.info("Размещение ID %d успешно обновлено: %s", lodging_id, result)
     return templates.TemplateResponse("lodging.html", {"request": request})
@@ -101,10 +104,12 @@ async def delete_lodging_for_session(
 
 @lodging_router.post("/lodging/add/{session_id}", response_class=HTMLResponse)
 async def add_lodging_to_session(
-    session_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    session_id: int,
+    data: LodgingIn = lodging_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> RedirectResponse:
     try:
-        result = await service_locator.get_lodging_contr().create_new_lodging(request)
+        result = await service_locator.get_lodging_contr().create_new_lodging(data)
         logger.info("Размещение успешно создано: %s", result)
         event = await service_locator.get_event_serv().get_event_by_session_id(
             session_id
@@ -134,9 +139,9 @@ async def add_lodging_to_session(
 @lodging_router.put("/lodgings/{lodging_id}")
 async def update_lodging_dates(
     lodging_id: int,
-    request: Request,
+    data: LodgingDatesIn = lodging_dates_body,
     service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     return await service_locator.get_lodging_contr().update_lodging_dates(
-        lodging_id, request
+        lodging_id, data
     )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from auth import token_cache
+from compression import compression_cache
+from negative_cache import negative_cache
+from password_hashing import password_hasher
+from rate_limit import auth_rate_limiter
+from single_flight import single_flight
+from ttl_store import auth_state
+
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("/api/metrics/single-flight")
+async def get_single_flight_metrics() -> dict[str, Any]:
+    return {"enabled": single_flight.enabled, "routes": single_flight.stats()}
+
+
+@metrics_router.get("/api/metrics/negative-cache")
+async def get_negative_cache_metrics() -> dict[str, Any]:
+    return {"enabled": negative_cache.enabled, **negative_cache.stats()}
+
+
+@metrics_router.get("/api/metrics/compression")
+async def get_compression_metrics() -> dict[str, Any]:
+    return compression_cache.stats()
+
+
+@metrics_router.get("/api/metrics/password-hashing")
+async def get_password_hashing_metrics() -> dict[str, Any]:
+    return password_hasher.stats()
+
+
+@metrics_router.get("/api/metrics/auth-token-cache")
+async def get_auth_token_cache_metrics() -> dict[str, Any]:
+    return token_cache.stats()
+
+
+@metrics_router.get("/api/metrics/auth-state")
+async def get_auth_state_metrics() -> dict[str, Any]:
+    return auth_state.stats()
+
+
+@metrics_router.get("/api/metrics/rate-limit")
+async def get_rate_limit_metrics() -> dict[str, Any]:
+    return auth_rate_limiter.stats()
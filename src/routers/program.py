@@ -7,24 +7,33 @@ from fastapi import Depends
 from fastapi import Request
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
-
+from fastapi.responses import Response
+
+from conditional_get import PROGRAM_TABLES
+from conditional_get import get_validators
+from conditional_get import is_not_modified
+from conditional_get import not_modified
+from request_schemas import ProgramIn
+from request_schemas import json_body
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from templating import templates
 
 
 logger = logging.getLogger(__name__)
 
 program_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
+program_body = json_body(ProgramIn)
 
 
 @program_router.post("/api/programs", response_class=HTMLResponse)
 async def create_program(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    request: Request,
+    data: ProgramIn = program_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_program_contr().create_new_program(request)
+    result = await service_locator.get_program_contr().create_new_program(data)
     logger.info("Программа успешно создана: %s", result)
     return templates.TemplateResponse("program.html", {"request": request})
 
@@ -32,7 +41,13 @@ async def create_program(
 @program_router.get("/program.html", response_class=HTMLResponse)
 async def get_all_programs(
     request: Request, service_locator: ServiceLocator = get_sl_dep
-) -> HTMLResponse:
+) -> Response:
+    validators = await get_validators(
+        service_locator.get_table_version_repo(), request.url.path, PROGRAM_TABLES
+    )
+    if validators and is_not_modified(request, validators):
+        return not_modified(validators)
+
     program_list = await service_locator.get_program_contr().get_all_programs()
     programs = program_list.get("programs", [])
     logger.info("Получено %d программ", len(programs))
@@ -42,18 +57,24 @@ async def get_all_programs(
     venues = venues_list.get("venues", [])
     logger.info("Получено %d площадок", len(venues))
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "program.html",
         {"request": request, "programs": programs, "venues": venues},
     )
+    if validators:
+        response.headers.update(validators.headers())
+    return response
 
 
 @program_router.put("/api/programs/{program_id}", response_class=HTMLResponse)
 async def update_program(
-    program_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    program_id: int,
+    request: Request,
+    data: ProgramIn = program_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
     result = await service_locator.get_program_contr().update_program(
-        program_id, request
+        program_id, data
     )
     logger.info("Программа ID %d успешно обновлена: %s", program_id, result)
     return templates.TemplateResponse("program.html", {"request": request})
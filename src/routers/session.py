@@ -2,7 +2,6 @@
 
 import logging
 
-from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter
@@ -14,36 +13,65 @@ from fastapi.responses import HTMLResponse
 from fastapi.responses import JSONResponse
 from fastapi.responses import RedirectResponse
 from fastapi.responses import Response
-from fastapi.templating import Jinja2Templates
-
-from models.event import Event
 
+from auth import CurrentUser
+from auth import acting_user_id
+from auth import current_user_dep
+from catalog_snapshots import catalog_snapshots
+from conditional_get import CATALOG_TABLES
+from conditional_get import get_validators
+from conditional_get import is_not_modified
+from conditional_get import not_modified
+from request_schemas import JoinSessionIn
+from request_schemas import SessionExtendIn
+from request_schemas import SessionIn
+from request_schemas import SessionPatchIn
+from request_schemas import SessionVenueDeleteIn
+from request_schemas import SessionVenueIn
+from request_schemas import TransferTypeIn
+from request_schemas import UserSessionIn
+from request_schemas import json_body
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from single_flight import single_flight
+from template_streaming import stream_template
+from templating import templates
 
 
 logger = logging.getLogger(__name__)
 
 session_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
+session_body = json_body(SessionIn)
+user_session_body = json_body(UserSessionIn)
+transfer_type_body = json_body(TransferTypeIn)
+session_venue_delete_body = json_body(SessionVenueDeleteIn)
+session_venue_body = json_body(SessionVenueIn)
+session_extend_body = json_body(SessionExtendIn)
+session_patch_body = json_body(SessionPatchIn)
+join_body = json_body(JoinSessionIn)
 
 
 @session_router.post("/api/sessions", response_class=HTMLResponse)
 async def create_session(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    request: Request,
+    data: SessionIn = session_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_session_contr().create_new_session(request)
+    result = await service_locator.get_session_contr().create_new_session(data)
     logger.info("Сессия успешно создана: %s", result)
     return templates.TemplateResponse("session.html", {"request": request})
 
 
 @session_router.post("/session/new", response_class=HTMLResponse)
 async def create_session_user(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    data: UserSessionIn = user_session_body,
+    user: CurrentUser = current_user_dep,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> JSONResponse:
     logger.info("create_session_user\n")
-    result = await service_locator.get_session_contr().create_new_session_user(request)
+    data = data.model_copy(update={"user_id": acting_user_id(user, data.user_id)})
+    result = await service_locator.get_session_contr().create_new_session_user(data)
     logger.info("Сессия успешно создана: %s", result)
     return JSONResponse(content=result)
 
@@ -66,135 +94,31 @@ async def get_session_page(
     )
 
 
-def _serialize_event_for_template(event: Event) -> dict[str, Any]:
-    """Преобразует Event в словарь, сериализуемый в JSON для data-атрибутов."""
-    return {
-        "event_id": event.event_id,
-        "status": event.status,
-        "users": [{"user_id": u.user_id, "fio": u.fio, "email": u.email} for u in (event.users or [])],
-        "activities": [
-            {
-                "id": a.activity_id,
-                "activity_type": a.activity_type,
-                "address": a.address,
-                "duration": a.duration,
-                "activity_time": a.activity_time.isoformat() if a.activity_time else None,
-                "venue_name": a.venue.name if a.venue else "Не указан",
-            }
-            for a in (event.activities or [])
-        ],
-        "lodgings": [
-            {
-                "id": ldg.lodging_id,
-                "name": ldg.name,
-                "address": ldg.address,
-                "price": ldg.price,
-                "type": ldg.type,
-                "rating": ldg.rating,
-                "check_in": ldg.check_in.isoformat() if ldg.check_in else None,
-                "check_out": ldg.check_out.isoformat() if ldg.check_out else None,
-                "venue_name": ldg.venue.name if ldg.venue else "Не указан",
-            }
-            for ldg in (event.lodgings or [])
-        ],
-    }
+async def _load_sessions_page(service_locator: ServiceLocator) -> dict[str, Any]:
+    return await service_locator.get_session_contr().get_sessions_page()
 
 
 @session_router.get("/session.html", response_class=HTMLResponse)
 async def get_all_sessions(
     request: Request, service_locator: ServiceLocator = get_sl_dep
-) -> HTMLResponse:
-    session_list = await service_locator.get_session_contr().get_all_sessions()
-    sessions = session_list.get("sessions", [])
-    user = None
-
-    for session in sessions:
-        st = session.get("start_time")
-        et = session.get("end_time")
-        session["start_time"] = datetime.fromisoformat(st) if st else None
-        session["end_time"] = datetime.fromisoformat(et) if et else None
-
-        if session.get("event"):
-            event = session["event"]
-            serialized_activities = []
-            for act in event["activities"]:
-                venue_name = None
-                if hasattr(act.get("venue"), "name"):
-                    venue_name = act["venue"].name
-                elif isinstance(act.get("venue"), dict):
-                    venue_name = act["venue"].get("name", "Не указан")
-                elif "venue_id" in act:
-                    venue = await service_locator.get_venue_serv().get_by_id(
-                        act["venue_id"]
-                    )
-                    venue_name = venue.name if venue else "Не указан"
-                else:
-                    venue_name = "Не указан"
-
-                serialized_activities.append(
-                    {
-                        "id": act.get("id"),
-                        "activity_type": act.get("activity_type"),
-                        "address": act.get("address"),
-                        "duration": act.get("duration"),
-                        "activity_time": act.get("activity_time"),
-                        "venue_name": venue_name,
-                    }
-                )
-            event["activities"] = serialized_activities
-
-        if "lodgings" in event:
-            serialized_lodgings = []
-            for lod in event["lodgings"]:
-                venue_name = None
-                if hasattr(lod.get("venue"), "name"):
-                    venue_name = lod["venue"].name
-                elif isinstance(lod.get("venue"), dict):
-                    venue_name = lod["venue"].get("name", "Не указан")
-                elif "venue_id" in lod:
-                    venue = await service_locator.get_venue_serv().get_by_id(
-                        lod["venue_id"]
-                    )
-                    venue_name = venue.name if venue else "Не указан"
-                else:
-                    venue_name = "Не указан"
-
-                serialized_lodgings.append(
-                    {
-                        "id": lod.get("id"),
-                        "name": lod.get("name"),
-                        "type": lod.get("type"),
-                        "address": lod.get("address"),
-                        "price": lod.get("price"),
-                        "rating": lod.get("rating"),
-                        "check_in": lod.get("check_in"),
-                        "check_out": lod.get("check_out"),
-                        "venue_name": venue_name,
-                    }
-                )
-            event["lodgings"] = serialized_lodgings
-
-    events_raw = await service_locator.get_event_serv().get_all_events()
-    events_serialized = [_serialize_event_for_template(e) for e in events_raw]
-
-    return templates.TemplateResponse(
-        "session.html",
-        {
-            "request": request,
-            "sessions": sessions,
-            "events": events_serialized,
-            "programs": await service_locator.get_program_serv().get_list(),
-            "user": user,
-        },
+) -> Response:
+    page = await single_flight.run(
+        request, lambda: _load_sessions_page(service_locator)
+    )
+    return await stream_template(
+        "session.html", {"request": request, **page, "user": None}
     )
 
 
 @session_router.put("/api/sessions/{session_id}", response_class=HTMLResponse)
 async def update_session(
-    session_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    session_id: int,
+    request: Request,
+    data: SessionIn = session_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
     result = await service_locator.get_session_contr().update_session(
-        session_id, request
+        session_id, data
     )
     logger.info("Сессия ID %d успешно обновлена: %s", session_id, result)
     return templates.TemplateResponse("session.html", {"request": request})
@@ -261,10 +185,12 @@ async def edit_page(
 
 @session_router.put("/session/change_transfer_type/{session_id}")
 async def change_transfer_type(
-    session_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    session_id: int,
+    data: TransferTypeIn = transfer_type_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     result = await service_locator.get_session_contr().change_transfer_type(
-        session_id, request
+        session_id, data
     )
     logger.info("Транспорт в сессии успешно изменен: %s", result)
     return {"session_id": session_id, "program_id": result["program_id"]}
@@ -272,10 +198,11 @@ async def change_transfer_type(
 
 @session_router.delete("/session/delete_venue")
 async def delete_venue_from_session(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    data: SessionVenueDeleteIn = session_venue_delete_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     result = await service_locator.get_session_contr().delete_venue_from_session(
-        request
+        data
     )
     logger.info("Площадка успешно удалена из сессии: %s", result)
     return result
@@ -283,19 +210,22 @@ async def delete_venue_from_session(
 
 @session_router.post("/session/add_venue")
 async def add_new_venue(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    data: SessionVenueIn = session_venue_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> None:
-    result = await service_locator.get_session_contr().add_new_venue(request)
+    result = await service_locator.get_session_contr().add_new_venue(data)
     logger.info("Площадка успешно добавлена в сессию: %s", result)
 
 
 @session_router.put("/session/extend/{session_id}")
 async def api_change_session_duration(
-    session_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    session_id: int,
+    data: SessionExtendIn = session_extend_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     try:
         result = await service_locator.get_session_contr().change_session_duration(
-            session_id, request
+            session_id, data
         )
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -309,6 +239,23 @@ async def api_change_session_duration(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@session_router.patch("/api/sessions/{session_id}")
+async def api_patch_session(
+    session_id: int,
+    data: SessionPatchIn = session_patch_body,
+    service_locator: ServiceLocator = get_sl_dep,
+) -> dict[str, Any]:
+    """Меняет только переданные поля (start_time, end_time, type) одним UPDATE."""
+    changes = data.model_dump(exclude_unset=True)
+    try:
+        session = await service_locator.get_session_serv().patch(session_id, changes)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return session.model_dump(mode="json")
+
+
 def _build_session_catalog_item(
     session: Any, include_user_ids: bool = False
 ) -> dict[str, Any]:
@@ -373,23 +320,85 @@ def _build_session_catalog_item(
     return item
 
 
+def _catalog_row_to_item(
+    row: dict[str, Any], include_user_ids: bool = False
+) -> dict[str, Any]:
+    item = {
+        "session_id": row["session_id"],
+        "start_venue": row["start_venue"] or "Не указан",
+        "end_venue": row["end_venue"] or "Не указан",
+        "transfer_type": row["transfer_type"],
+        "start_time": row["start_time"].strftime("%d.%m.%Y"),
+        "end_time": row["end_time"].strftime("%d.%m.%Y"),
+        "total_cost": row["total_cost"],
+        "lodgings": row["lodgings"],
+        "activities": row["activities"],
+    }
+    if include_user_ids:
+        item["user_ids"] = list(row["user_ids"])
+    return item
+
+
+async def _load_catalog(
+    service_locator: ServiceLocator, type_session: str, include_user_ids: bool = False
+) -> Any:
+    session_serv = service_locator.get_session_serv()
+    rows = await session_serv.get_catalog_by_type(type_session)
+    if rows is not None:
+        return [_catalog_row_to_item(row, include_user_ids) for row in rows]
+
+    sessions = await session_serv.get_sessions_by_type(type_session)
+    return jsonable_encoder(
+        [_build_session_catalog_item(s, include_user_ids) for s in sessions]
+    )
+
+
+async def _catalog_response(
+    request: Request,
+    service_locator: ServiceLocator,
+    catalog: str,
+    type_session: str,
+    title: str,
+    include_user_ids: bool = False,
+) -> Response:
+    validators = await get_validators(
+        service_locator.get_table_version_repo(), f"/programs/{catalog}", CATALOG_TABLES
+    )
+    if validators and is_not_modified(request, validators):
+        return not_modified(validators)
+
+    async def render() -> str:
+        sessions_data = await _load_catalog(
+            service_locator, type_session, include_user_ids
+        )
+        return templates.get_template("program_catalog.html").render(
+            request=request, sessions=sessions_data, catalog_title=title
+        )
+
+    if validators and catalog_snapshots.enabled:
+        snapshot = await catalog_snapshots.ensure(catalog, validators.digest, render)
+        return catalog_snapshots.file_response(request, snapshot, validators.headers())
+
+    headers = validators.headers() if validators else None
+    if single_flight.is_enabled(request.url.path):
+        # Одновременным запросам нужна общая готовая строка, поток не подходит
+        return HTMLResponse(await single_flight.run(request, render), headers=headers)
+
+    sessions_data = await _load_catalog(service_locator, type_session, include_user_ids)
+    return await stream_template(
+        "program_catalog.html",
+        {"request": request, "sessions": sessions_data, "catalog_title": title},
+        headers=headers,
+    )
+
+
 @session_router.get("/programs/official", response_class=HTMLResponse)
 @session_router.get("/tours", response_class=HTMLResponse)  # legacy alias
 async def get_official_programs(
     request: Request, service_locator: ServiceLocator = get_sl_dep
-) -> HTMLResponse:
-    sessions = await service_locator.get_session_serv().get_sessions_by_type(
-        "Официальные"
-    )
-    sessions_data = [_build_session_catalog_item(s) for s in sessions]
-
-    return templates.TemplateResponse(
-        "program_catalog.html",
-        {
-            "request": request,
-            "sessions": jsonable_encoder(sessions_data),
-            "catalog_title": "Официальные программы",
-        },
+) -> Response:
+    return await _catalog_response(
+        request, service_locator, "official", "Официальные", "Официальные программы"
     )
 
 
@@ -397,27 +406,24 @@ async def get_official_programs(
 @session_router.get("/recommended", response_class=HTMLResponse)  # legacy alias
 async def get_recommended_programs(
     request: Request, service_locator: ServiceLocator = get_sl_dep
-) -> HTMLResponse:
-    sessions = await service_locator.get_session_serv().get_sessions_by_type(
-        "Рекомендованные"
-    )
-    sessions_data = [
-        _build_session_catalog_item(s, include_user_ids=True) for s in sessions
-    ]
-
-    return templates.TemplateResponse(
-        "program_catalog.html",
-        {
-            "request": request,
-            "sessions": jsonable_encoder(sessions_data),
-            "catalog_title": "Рекомендованные программы",
-        },
+) -> Response:
+    return await _catalog_response(
+        request,
+        service_locator,
+        "recommended",
+        "Рекомендованные",
+        "Рекомендованные программы",
+        include_user_ids=True,
     )
 
 
 @session_router.post("/sessions/{session_id}/join")
 async def join_session(
-    session_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    session_id: int,
+    data: JoinSessionIn = join_body,
+    user: CurrentUser = current_user_dep,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     logger.info("Присоединяемся к сессии %d ID", session_id)
-    return await service_locator.get_session_contr().join_to_event(session_id, request)
+    data = data.model_copy(update={"user_id": acting_user_id(user, data.user_id)})
+    return await service_locator.get_session_contr().join_to_event(session_id, data)
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi import Request
+from fastapi.responses import Response
+
+from static_assets import static_assets
+
+
+static_router = APIRouter()
+
+
+@static_router.get("/static/{path:path}", include_in_schema=False)
+async def get_static(path: str, request: Request) -> Response:
+    return static_assets.response(path, request.headers.get("if-none-match"))
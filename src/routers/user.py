@@ -12,26 +12,48 @@ from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Request
-from fastapi.responses import Response
 from fastapi.responses import HTMLResponse
 from fastapi.responses import JSONResponse
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from fastapi.responses import Response
 
+from auth import CurrentUser
+from auth import current_user_dep
 from models.session import Session
-
+from rate_limit import rate_limit
+from request_schemas import AdminUpdateIn
+from request_schemas import ChangePasswordIn
+from request_schemas import ExpirePasswordIn
+from request_schemas import LoginIn
+from request_schemas import RecoverPasswordIn
+from request_schemas import ResetPasswordIn
+from request_schemas import TwoFAIn
+from request_schemas import UserIn
+from request_schemas import UserPatchIn
+from request_schemas import Verify2FAIn
+from request_schemas import json_body
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from settings import settings
+from template_streaming import stream_template
+from templating import templates
 
 
 logger = logging.getLogger(__name__)
 
 user_router = APIRouter()
 
-templates = Jinja2Templates(directory="templates")
-
 get_sl_dep = Depends(get_service_locator)
+user_body = json_body(UserIn)
+login_body = json_body(LoginIn)
+verify_2fa_body = json_body(Verify2FAIn)
+two_fa_body = json_body(TwoFAIn)
+admin_update_body = json_body(AdminUpdateIn)
+user_patch_body = json_body(UserPatchIn)
+recover_password_body = json_body(RecoverPasswordIn)
+reset_password_body = json_body(ResetPasswordIn)
+expire_password_body = json_body(ExpirePasswordIn)
+change_password_body = json_body(ChangePasswordIn)
 
 # MAIL_HOST = os.getenv("MAIL_HOST", "mailhog")
 # MAIL_PORT = int(os.getenv("MAIL_PORT", "1025"))
@@ -51,11 +73,11 @@ async def send_email(to_email: str, subject: str, body: str) -> None:
         logger.error("Ошибка отправки письма: %s", e)
 
 
-@user_router.post("/api/register")
+@user_router.post("/api/register", dependencies=[rate_limit(user_body)])
 async def register_user(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    data: UserIn = user_body, service_locator: ServiceLocator = get_sl_dep
 ) -> JSONResponse:
-    result = await service_locator.get_user_contr().registrate(request)
+    result = await service_locator.get_user_contr().registrate(data)
     logger.info("Пользователь успешно зарегистрирован: %s", result)
 
     return JSONResponse(
@@ -67,6 +89,12 @@ async def register_user(
     )
 
 
+@user_router.get("/api/me")
+async def get_me(user: CurrentUser = current_user_dep) -> dict[str, Any]:
+    """Текущий пользователь из токена, без запроса в БД."""
+    return {"user_id": user.user_id, "login": user.login, "is_admin": user.is_admin}
+
+
 @user_router.get("/profile")
 async def show_profile(request: Request) -> HTMLResponse:
     return templates.TemplateResponse("profile.html", {"request": request})
@@ -74,38 +102,59 @@ async def show_profile(request: Request) -> HTMLResponse:
 
 @user_router.post("/api/users", response_class=HTMLResponse)
 async def register_admin(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    request: Request,
+    data: UserIn = user_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_user_contr().create_admin(request)
+    result = await service_locator.get_user_contr().create_admin(data)
     logger.info("Администратор успешно зарегистрирован: %s", result)
     return templates.TemplateResponse("user.html", {"request": request})
 
 
 @user_router.put("/api/users/{user_id}", response_class=HTMLResponse)
 async def update_admin(
-    user_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    user_id: int,
+    request: Request,
+    data: AdminUpdateIn = admin_update_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_user_contr().update_admin(user_id, request)
+    result = await service_locator.get_user_contr().update_admin(user_id, data)
     logger.info("Администратор успешно обновлен: %s", result)
     return templates.TemplateResponse("user.html", {"request": request})
 
 
-@user_router.post("/api/login")
+@user_router.patch("/api/users/{user_id}")
+async def api_patch_user(
+    user_id: int,
+    data: UserPatchIn = user_patch_body,
+    service_locator: ServiceLocator = get_sl_dep,
+) -> dict[str, Any]:
+    """Меняет только переданные поля профиля одним UPDATE; пароль — отдельно."""
+    changes = data.model_dump(exclude_unset=True)
+    try:
+        user = await service_locator.get_user_serv().patch(user_id, changes)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user.model_dump(mode="json", exclude={"password", "number_passport"})
+
+
+@user_router.post("/api/login", dependencies=[rate_limit(login_body)])
 async def login_user(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    data: LoginIn = login_body, service_locator: ServiceLocator = get_sl_dep
 ) -> dict[str, Any]:
-    result = await service_locator.get_user_contr().login(request)
+    result = await service_locator.get_user_contr().login(data)
     logger.info("Результат входа: %s", result)
     return result
 
 
-@user_router.post("/api/login1")
+@user_router.post("/api/login1", dependencies=[rate_limit(login_body)])
 async def login1_user(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    data: LoginIn = login_body, service_locator: ServiceLocator = get_sl_dep
 ) -> Response:
-    data = await request.json()
-    login = data.get("login")
-    password = data.get("password")
+    login = data.login
+    password = data.password
 
     auth_serv = service_locator.get_auth_serv()
 
@@ -164,23 +213,18 @@ async def get_user_profile(
     user_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
 ) -> HTMLResponse:
     profile_data = await service_locator.get_user_contr().get_user_profile(user_id)
-    active_events = await service_locator.get_event_serv().get_events_for_user(
-        user_id, "Активное"
-    )
-    completed_events = await service_locator.get_event_serv().get_events_for_user(
-        user_id, "Завершено"
+    sessions = await service_locator.get_session_serv().get_sessions_for_user(
+        user_id, ["Активное", "Завершено"]
     )
-    session_serv = service_locator.get_session_serv()
 
     active_sessions: list[dict[str, Any]] = []
-    for event in active_events:
-        sessions = await session_serv.get_sessions_by_event_id(event.event_id)
-        active_sessions.extend(_session_to_profile_dict(s) for s in sessions)
-
     completed_sessions: list[dict[str, Any]] = []
-    for event in completed_events:
-        sessions = await session_serv.get_sessions_by_event_id(event.event_id)
-        completed_sessions.extend(_session_to_profile_dict(s) for s in sessions)
+    for session in sessions:
+        status = session.event.status if session.event else None
+        if status == "Активное":
+            active_sessions.append(_session_to_profile_dict(session))
+        elif status == "Завершено":
+            completed_sessions.append(_session_to_profile_dict(session))
 
     logger.info("active_sessions %d, completed_sessions %d", len(active_sessions), len(completed_sessions))
 
@@ -199,11 +243,10 @@ async def get_user_profile(
 @user_router.get("/user.html", response_class=HTMLResponse)
 async def get_all_users(
     request: Request, service_locator: ServiceLocator = get_sl_dep
-) -> HTMLResponse:
-    users_data = await service_locator.get_user_contr().get_all_users()
-    users = users_data.get("users", [])
-    logger.info("Получено %d пользователей", len(users))
-    return templates.TemplateResponse("user.html", {"request": request, "users": users})
+) -> Response:
+    # Пользователи читаются курсором по мере вывода строк таблицы
+    users = service_locator.get_user_serv().iter_list(settings.STREAM_BATCH_SIZE)
+    return await stream_template("user.html", {"request": request, "users": users})
 
 
 @user_router.post("/user/delete/{user_id}", response_class=HTMLResponse)
@@ -217,21 +260,18 @@ async def delete_user(
 
 @user_router.post("/api/users/json")
 async def register_user_json(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    data: UserIn = user_body, service_locator: ServiceLocator = get_sl_dep
 ) -> JSONResponse:
-    result = await service_locator.get_user_contr().registrate(request)
+    result = await service_locator.get_user_contr().registrate(data)
     return JSONResponse(
         {"user_id": result.get("user_id"), "message": result.get("message")}
     )
 
 
-class RecoverPasswordRequest(BaseModel):
-    login: str
-
-
 @user_router.post("/api/recover-password")
 async def recover_password(
-    data: RecoverPasswordRequest, service_locator: ServiceLocator = get_sl_dep
+    data: RecoverPasswordIn = recover_password_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
 
     user = await service_locator.get_user_repo().get_by_login(data.login)
@@ -243,32 +283,26 @@ async def recover_password(
     return {"message": "Password recovery initiated"}
 
 
-class ResetPasswordRequest(BaseModel):
-    token: str
-    password: str
-
-
 @user_router.post("/api/reset-password")
 async def reset_password(
-    data: ResetPasswordRequest, service_locator: ServiceLocator = get_sl_dep
+    data: ResetPasswordIn = reset_password_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     user = await service_locator.get_user_serv().get_user_by_reset_token(data.token)
     if not user:
         raise HTTPException(status_code=404, detail="Token invalid or expired")
 
-    await service_locator.get_user_serv().update_password(user.login, data.password)
+    try:
+        await service_locator.get_user_serv().update_password(user.login, data.password)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     return {"message": "Password has been reset successfully"}
 
 
-class Verify2FARequest(BaseModel):
-    login: str
-    code: str
-    two_fa_token: str
-
-
-@user_router.post("/api/verify-2fa")
+@user_router.post("/api/verify-2fa", dependencies=[rate_limit(verify_2fa_body)])
 async def verify_2fa(
-    data: Verify2FARequest, service_locator: ServiceLocator = get_sl_dep
+    data: Verify2FAIn = verify_2fa_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     valid = await service_locator.get_auth_serv().verify_2fa_code(data.login, data.code)
     if not valid:
@@ -288,14 +322,10 @@ async def verify_2fa(
     }
 
 
-class TwoFARequest(BaseModel):
-    login: str
-    code: str
-
-
-@user_router.post("/api/login2")
+@user_router.post("/api/login2", dependencies=[rate_limit(two_fa_body)])
 async def login_2fa(
-    data: TwoFARequest, service_locator: ServiceLocator = get_sl_dep
+    data: TwoFAIn = two_fa_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     is_valid = await service_locator.get_auth_serv().verify_2fa_code(
         data.login, data.code
@@ -319,33 +349,26 @@ async def api_delete_user(
     return {"message": "User deleted", "result": result}
 
 
-class ExpirePasswordRequest(BaseModel):
-    login: str
-
-
 @user_router.post("/api/expire-password")
 async def expire_password(
-    req: ExpirePasswordRequest, service_locator: ServiceLocator = get_sl_dep
+    req: ExpirePasswordIn = expire_password_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     await service_locator.get_user_serv().update_password(req.login, "W1rong_pas@s")
     return {"expired": True}
 
 
-class ChangePasswordRequest(BaseModel):
-    login: str
-    new_password: str
-
-
 @user_router.post("/api/change-password")
 async def change_password(
-    data: ChangePasswordRequest, service_locator: ServiceLocator = get_sl_dep
+    data: ChangePasswordIn = change_password_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> dict[str, Any]:
     user = await service_locator.get_user_repo().get_by_login(data.login)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     await service_locator.get_user_serv().update_password(
-        user.login, service_locator.get_auth_serv().get_password_hash(data.new_password)
+        user.login, await service_locator.get_auth_serv().hash_password(data.new_password)
     )
 
     return {"message": "Password changed successfully"}
@@ -9,24 +9,33 @@ from fastapi import Depends
 from fastapi import Request
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
-
+from fastapi.responses import Response
+
+from conditional_get import VENUE_TABLES
+from conditional_get import get_validators
+from conditional_get import is_not_modified
+from conditional_get import not_modified
+from request_schemas import VenueIn
+from request_schemas import json_body
 from service_locator import ServiceLocator
 from service_locator import get_service_locator
+from templating import templates
 
 
 logger = logging.getLogger(__name__)
 
 venue_router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 get_sl_dep = Depends(get_service_locator)
+venue_body = json_body(VenueIn)
 
 
 @venue_router.post("/api/venues", response_class=HTMLResponse)
 async def create_venue(
-    request: Request, service_locator: ServiceLocator = get_sl_dep
+    request: Request,
+    data: VenueIn = venue_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_venue_contr().create_new_venue(request)
+    result = await service_locator.get_venue_contr().create_new_venue(data)
     logger.info("Площадка успешно создана: %s", result)
     return templates.TemplateResponse("venue.html", {"request": request})
 
@@ -34,13 +43,22 @@ async def create_venue(
 @venue_router.get("/venue.html", response_class=HTMLResponse)
 async def get_all_venues(
     request: Request, service_locator: ServiceLocator = get_sl_dep
-) -> HTMLResponse:
+) -> Response:
+    validators = await get_validators(
+        service_locator.get_table_version_repo(), request.url.path, VENUE_TABLES
+    )
+    if validators and is_not_modified(request, validators):
+        return not_modified(validators)
+
     venue_list = await service_locator.get_venue_contr().get_all_venues()
     venues = venue_list.get("venues", [])
     logger.info("Получено %d площадок", len(venues))
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "venue.html", {"request": request, "venues": venues}
     )
+    if validators:
+        response.headers.update(validators.headers())
+    return response
 
 
 @venue_router.get("/venue.html")
@@ -54,9 +72,12 @@ async def get_venue(
 
 @venue_router.put("/api/venues/{venue_id}", response_class=HTMLResponse)
 async def update_venue(
-    venue_id: int, request: Request, service_locator: ServiceLocator = get_sl_dep
+    venue_id: int,
+    request: Request,
+    data: VenueIn = venue_body,
+    service_locator: ServiceLocator = get_sl_dep,
 ) -> HTMLResponse:
-    result = await service_locator.get_venue_contr().update_venue(venue_id, request)
+    result = await service_locator.get_venue_contr().update_venue(venue_id, data)
     logger.info("Площадка ID %d успешно обновлена: %s", venue_id, result)
     return templates.TemplateResponse("venue.html", {"request": request})
 
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +16,7 @@ from abstract_repository.ievent_repository import IEventRepository
 from abstract_repository.ilodging_repository import ILodgingRepository
 from abstract_repository.iprogram_repository import IProgramRepository
 from abstract_repository.isession_repository import ISessionRepository
+from abstract_repository.itable_version_repository import ITableVersionRepository
 from abstract_repository.iuser_repository import IUserRepository
 from abstract_repository.ivenue_repository import IVenueRepository
 from controllers.activity_controller import ActivityController
@@ -28,6 +31,7 @@ from repository.event_repository import EventRepository
 from repository.lodging_repository import LodgingRepository
 from repository.program_repository import ProgramRepository
 from repository.session_repository import SessionRepository
+from repository.table_version_repository import TableVersionRepository
 from repository.user_repository import UserRepository
 from repository.venue_repository import VenueRepository
 from services.activity_service import ActivityService
@@ -58,6 +62,7 @@ class Repositories:
         session_repo: ISessionRepository,
         event_repo: IEventRepository,
         user_repo: IUserRepository,
+        table_version_repo: ITableVersionRepository,
     ):
         self.lodging_repo = lodging_repo
         self.venue_repo = venue_repo
@@ -66,6 +71,7 @@ class Repositories:
         self.session_repo = session_repo
         self.event_repo = event_repo
         self.user_repo = user_repo
+        self.table_version_repo = table_version_repo
 
 
 @dataclass
@@ -141,6 +147,9 @@ class ServiceLocator:
     def get_user_repo(self) -> IUserRepository:
         return self.repositories.user_repo
 
+    def get_table_version_repo(self) -> ITableVersionRepository:
+        return self.repositories.table_version_repo
+
     def get_lodging_serv(self) -> LodgingService:
         return self.services.lodging_serv
 
@@ -187,6 +196,14 @@ class ServiceLocator:
         return self.controllers.user_contr
 
 
+@asynccontextmanager
+async def _background_user_repo() -> AsyncIterator[IUserRepository]:
+    """Репозиторий пользователей на собственной сессии — для задач вне запроса."""
+    assert _pg_session_factory is not None
+    async with _pg_session_factory() as session:
+        yield UserRepository(session)
+
+
 async def get_service_locator() -> ServiceLocator:
     global _pg_engine, _pg_session_factory
 
@@ -211,6 +228,7 @@ async def get_service_locator() -> ServiceLocator:
     session_repo: ISessionRepository = SessionRepository(
         session, program_repo, event_repo
     )
+    table_version_repo: ITableVersionRepository = TableVersionRepository(session)
 
     lodging_serv = LodgingService(lodging_repo)
     venue_serv = VenueService(venue_repo)
@@ -219,7 +237,7 @@ async def get_service_locator() -> ServiceLocator:
     session_serv = SessionService(session_repo)
     event_serv = EventService(event_repo)
     user_serv = UserService(user_repo)
-    auth_serv = AuthService(user_repo)
+    auth_serv = AuthService(user_repo, background_repository=_background_user_repo)
 
     repositories = Repositories(
         lodging_repo,
@@ -229,6 +247,7 @@ async def get_service_locator() -> ServiceLocator:
         session_repo,
         event_repo,
         user_repo,
+        table_version_repo,
     )
 
     venue_contr = VenueController(venue_serv)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 
+from typing import Iterable
+
 from abstract_repository.iactivity_repository import IActivityRepository
 from abstract_service.activity_service import IActivityService
 from models.activity import Activity
@@ -19,6 +21,10 @@ class ActivityService(IActivityService):
         logger.debug("Получение активности по ID %d", activity_id)
         return await self.repository.get_by_id(activity_id)
 
+    async def get_by_ids(self, activity_ids: Iterable[int]) -> dict[int, Activity]:
+        logger.debug("Получение активностей по ID")
+        return await self.repository.get_by_ids(activity_ids)
+
     async def add(self, activity: Activity) -> Activity:
         try:
             logger.debug("Добавление активности с ID %d", activity.activity_id)
@@ -51,3 +57,7 @@ class ActivityService(IActivityService):
     async def get_list(self) -> list[Activity]:
         logger.debug("Получение списка всех активностей")
         return await self.repository.get_list()
+
+    async def get_page(self, limit: int, offset: int) -> list[Activity]:
+        logger.debug("Получение страницы активностей: limit=%d, offset=%d", limit, offset)
+        return await self.repository.get_page(limit, offset)
@@ -30,6 +30,10 @@ class EventService(IEventService):
         logger.debug("Получение списка всех мероприятий")
         return await self.repository.get_list()
 
+    async def get_page(self, limit: int, offset: int) -> list[Event]:
+        logger.debug("Получение страницы мероприятий: limit=%d, offset=%d", limit, offset)
+        return await self.repository.get_page(limit, offset)
+
     async def add(self, event: Event) -> Event:
         try:
             logger.debug("Добавление мероприятия с ID %d", event.event_id)
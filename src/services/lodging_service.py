@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 
+from typing import Iterable
+
 from abstract_repository.ilodging_repository import ILodgingRepository
 from abstract_service.lodging_service import ILodgingService
 from models.lodging import Lodging
@@ -19,10 +21,18 @@ class LodgingService(ILodgingService):
         logger.debug("Получение размещения по ID %d", lodging_id)
         return await self.repository.get_by_id(lodging_id)
 
+    async def get_by_ids(self, lodging_ids: Iterable[int]) -> dict[int, Lodging]:
+        logger.debug("Получение размещений по ID")
+        return await self.repository.get_by_ids(lodging_ids)
+
     async def get_list(self) -> list[Lodging]:
         logger.debug("Получение списка размещений")
         return await self.repository.get_list()
 
+    async def get_page(self, limit: int, offset: int) -> list[Lodging]:
+        logger.debug("Получение страницы размещений: limit=%d, offset=%d", limit, offset)
+        return await self.repository.get_page(limit, offset)
+
     async def add(self, lodging: Lodging) -> Lodging:
         try:
             logger.debug("Добавления размещения с ID %d", lodging.lodging_id)
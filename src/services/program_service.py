@@ -23,6 +23,10 @@ class ProgramService(IProgramService):
         logger.debug("Получение списка всех программ")
         return await self.repository.get_list()
 
+    async def get_page(self, limit: int, offset: int) -> list[Program]:
+        logger.debug("Получение страницы программ: limit=%d, offset=%d", limit, offset)
+        return await self.repository.get_page(limit, offset)
+
     async def add(self, program: Program) -> Program:
         try:
             logger.debug("Добавление программы с ID %d", program.program_id)
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import logging
 
+from datetime import datetime
 from typing import Any
 
+from abstract_repository.include import Include
 from abstract_repository.isession_repository import ISessionRepository
 from abstract_service.session_service import ISessionService
+from models.patch import validate_changes
 from models.session import Session
 
 
@@ -19,14 +22,20 @@ class SessionService(ISessionService):
         self.repository = repository
         logger.debug("SessionService инициализирован")
 
-    async def get_by_id(self, session_id: int) -> Session | None:
+    async def get_by_id(
+        self, session_id: int, include: Include = None
+    ) -> Session | None:
         logger.debug("Получение сессии по ID %d", session_id)
-        return await self.repository.get_by_id(session_id)
+        return await self.repository.get_by_id(session_id, include=include)
 
     async def get_all_sessions(self) -> list[Session]:
         logger.debug("Получение списка всех сессий")
         return await self.repository.get_list()
 
+    async def get_page(self, limit: int, offset: int) -> list[Session]:
+        logger.debug("Получение страницы сессий: limit=%d, offset=%d", limit, offset)
+        return await self.repository.get_page(limit, offset)
+
     async def add(self, session: Session) -> Session:
         try:
             logger.debug("Добавление сессии с ID %d", session.session_id)
@@ -45,6 +54,20 @@ class SessionService(ISessionService):
             raise ValueError("Сессия не найдена.")
         return updated_session
 
+    async def patch(self, session_id: int, changes: Any) -> Session | None:
+        """Частичное изменение: проверяются и записываются только переданные поля."""
+        validated = validate_changes(Session, changes, self.repository.PATCH_FIELDS)
+        logger.debug("Изменение сессии ID %d: %s", session_id, sorted(validated))
+        return await self.repository.patch(session_id, validated)
+
+    async def extend(self, session_id: int, end_time: datetime) -> Session | None:
+        logger.debug("Продление сессии ID %d до %s", session_id, end_time)
+        return await self.repository.extend(session_id, end_time)
+
+    async def join_event(self, session_id: int, user_id: int) -> Session | None:
+        logger.debug("Пользователь ID %d присоединяется к сессии ID %d", user_id, session_id)
+        return await self.repository.join_event(session_id, user_id)
+
     async def delete(self, session_id: int) -> None:
         try:
             logger.debug("Удаление сессии с ID %d", session_id)
@@ -109,9 +132,23 @@ class SessionService(ISessionService):
         logger.debug("Получение сессии по type: %s", type_session)
         return await self.repository.get_sessions_by_type(type_session)
 
+    async def get_sessions_overview(self) -> dict[str, list[dict[str, Any]]]:
+        logger.debug("Получение обзора сессий")
+        return await self.repository.get_sessions_overview()
+
+    async def get_catalog_by_type(self, type_session: str) -> list[dict[str, Any]] | None:
+        logger.debug("Получение каталога сессий по type: %s", type_session)
+        return await self.repository.get_catalog_by_type(type_session)
+
     async def get_sessions_by_event_id(self, event_id: int) -> list[Session]:
         logger.debug("Получение сессий для мероприятия ID %d", event_id)
         return await self.repository.get_sessions_by_event_id_ordered(event_id)
 
+    async def get_sessions_for_user(
+        self, user_id: int, statuses: list[str]
+    ) -> list[Session]:
+        logger.debug("Получение сессий пользователя ID %d (%s)", user_id, statuses)
+        return await self.repository.get_sessions_for_user(user_id, statuses)
+
     async def get_session_parts(self, session_id: int) -> list[dict[str, Any]]:
         return await self.repository.get_session_parts(session_id)
@@ -1,27 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import random
 import string
-import time
 
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
 from datetime import timedelta
 from typing import ClassVar
 from typing import Any, Dict
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterable
 
 # from typing import Any
 
-import bcrypt
-
 from fastapi import HTTPException
 from jose import jwt
 
 from abstract_repository.iuser_repository import IUserRepository
 from abstract_service.user_service import IAuthService
 from abstract_service.user_service import IUserService
+from models.patch import validate_changes
 from models.user import User
+from password_hashing import check_password
+from password_hashing import hash_password
+from password_hashing import password_hasher
 from settings import settings
+from ttl_store import TTLStore
+from ttl_store import auth_state
 
 
 logger = logging.getLogger(__name__)
@@ -51,10 +59,21 @@ class UserService(IUserService):
         logger.debug("Получение пользователя по ID %d", user_id)
         return await self.repository.get_by_id(user_id)
 
+    async def get_by_ids(self, user_ids: Iterable[int]) -> dict[int, User]:
+        logger.debug("Получение пользователей по ID")
+        return await self.repository.get_by_ids(user_ids)
+
     async def get_list(self) -> list[User]:
         logger.debug("Получение списка всех пользователей")
         return await self.repository.get_list()
 
+    async def get_page(self, limit: int, offset: int) -> list[User]:
+        logger.debug("Получение страницы пользователей: limit=%d, offset=%d", limit, offset)
+        return await self.repository.get_page(limit, offset)
+
+    def iter_list(self, batch_size: int = 500) -> AsyncIterator[User]:
+        return self.repository.iter_list(batch_size)
+
     async def update(self, updated_user: User) -> User:
         try:
             logger.debug("Обновление пользователя с ID %d", updated_user.user_id)
@@ -78,47 +97,53 @@ class UserService(IUserService):
             return None
         return await self.repository.get_by_login(login)
 
+    async def patch(self, user_id: int, changes: Any) -> User | None:
+        """Частичное изменение: проверяются и записываются только переданные поля."""
+        validated = validate_changes(User, changes, self.repository.PATCH_FIELDS)
+        logger.debug("Изменение пользователя ID %d: %s", user_id, sorted(validated))
+        return await self.repository.patch(user_id, validated)
+
     async def update_password(self, login: str, new_password: str) -> None:
-        user = await self.repository.get_by_login(login)
-        if not user:
+        validated = validate_changes(User, {"password": new_password}, {"password"})
+        if not await self.repository.update_password(login, validated["password"]):
             raise ValueError("User not found")
-        user.password = new_password
-        await self.repository.update(user)
 
 
 class AuthService(IAuthService):
-    failed_attempts: ClassVar[dict[str, list[float]]] = {}
-    blocked_users: ClassVar[dict[str, float]] = {}
-    two_fa_storage: ClassVar[dict[str, dict[str, float | str]]] = {}
     MAX_2FA_ATTEMPTS: ClassVar[int] = 5
     BLOCK_2FA_TIME: ClassVar[int] = 60
-
-    def __init__(self, repository: IUserRepository) -> None:
+    FAILED_ATTEMPTS_WINDOW: ClassVar[int] = 600
+    TWO_FA_CODE_TTL: ClassVar[int] = 300
+    _rehash_tasks: ClassVar[set[asyncio.Task[None]]] = set()
+
+    def __init__(
+        self,
+        repository: IUserRepository,
+        state: TTLStore | None = None,
+        background_repository: Callable[[], AbstractAsyncContextManager[IUserRepository]] | None = None,
+    ) -> None:
         self.repository = repository
+        # Фоновое перехеширование не трогает репозиторий запроса: его AsyncSession
+        # в это время может использовать обработчик
+        self.background_repository = background_repository
+        # Блокировки и коды 2FA живут в TTL-хранилище: по умолчанию в памяти процесса,
+        # общем для всех воркеров — только с AUTH_STATE_BACKEND=redis
+        self.state = state or auth_state
         logger.debug("AuthService инициализирован")
 
     async def generate_2fa_code(self, login: str) -> str:
         code = "".join(random.choices(string.digits, k=6))
-        self.two_fa_storage[login] = {
-            "code": code,
-            "expires": time.time() + 300,  # 5 минут
-        }
+        await self.state.set(f"2fa:{login}", code, self.TWO_FA_CODE_TTL)
         return code
 
     async def verify_2fa_code(self, login: str, code: str) -> bool:
-        data = self.two_fa_storage.get(login)
-        if not data:
-            return False
-        if float(data["expires"]) < time.time():
-            del self.two_fa_storage[login]
-            return False
-        if data["code"] != code:
-            return False
-        del self.two_fa_storage[login]
-        return True
+        # pop, а не get + delete: код одноразовый (и после неверной попытки),
+        # один код не примут два параллельных запроса
+        stored = await self.state.pop(f"2fa:{login}")
+        return stored is not None and stored == code
 
     async def registrate(self, user: User) -> User:
-        user.password = self.get_password_hash(user.password)
+        user.password = await self.hash_password(user.password)
 
         logger.debug("Регистрация пользователя с логином %s", user)
         try:
@@ -130,70 +155,70 @@ class AuthService(IAuthService):
         return user
 
     async def authenticate(self, login: str, password: str) -> User | None:
-        if login in self.blocked_users:
-            unblock_time = self.blocked_users[login]
-            if time.time() < unblock_time:
-                raise HTTPException(status_code=403, detail="User temporarily blocked")
-            del self.blocked_users[login]
-            self.failed_attempts[login] = []
+        if await self.is_blocked(login):
+            raise HTTPException(status_code=403, detail="User temporarily blocked")
 
         user = await self.repository.get_by_login(login)
         if not user:
             logger.info("Пользователь %s не найден", login)
             return None
 
-        if not self.verify_password(password, user.password):
+        if not await self.check_password(password, user.password):
             logger.info("Неверный пароль для пользователя %s", login)
-            self._register_failed_attempt(login)
+            await self._register_failed_attempt(login)
             return None
 
         # успешный вход — сбрасываем неудачные попытки
-        self.failed_attempts[login] = []
+        await self.state.delete(f"failed:{login}")
+        if password_hasher.needs_rehash(user.password):
+            task = asyncio.create_task(self._rehash(login, password, user.password))
+            self._rehash_tasks.add(task)
+            task.add_done_callback(self._rehash_tasks.discard)
         return user
 
-    def _register_failed_attempt(self, login: str) -> None:
-        now = time.time()
-        attempts = self.failed_attempts.get(login, [])
-        attempts.append(now)
-        self.failed_attempts[login] = attempts
+    async def _rehash(self, login: str, password: str, old_hash: str) -> None:
+        """Перехеширование с текущей стоимостью BCRYPT_ROUNDS после успешного входа.
 
-        if len(attempts) >= self.MAX_2FA_ATTEMPTS:  # например, 3 неверных попытки
-            self.blocked_users[login] = now + 60  # блокируем на 60 секунд
-            logger.warning(f"Пользователь {login} заблокирован на 60 секунд")
+        Запись только поверх old_hash: если пароль успели сменить, старый не возвращается.
+        """
+        try:
+            hashed = await self.hash_password(password)
+            if self.background_repository is None:
+                updated = await self.repository.update_password(login, hashed, expected=old_hash)
+            else:
+                async with self.background_repository() as repository:
+                    updated = await repository.update_password(login, hashed, expected=old_hash)
+            if not updated:
+                logger.info("Пароль пользователя %s уже изменён, перехеширование пропущено", login)
+                return
+            password_hasher.rehashed += 1
+            logger.info("Пароль пользователя %s перехеширован, cost %d", login, password_hasher.rounds)
+        except Exception as e:
+            logger.error("Не удалось перехешировать пароль пользователя %s: %s", login, str(e))
+
+    async def _register_failed_attempt(self, login: str) -> None:
+        attempts = await self.state.incr(f"failed:{login}", self.FAILED_ATTEMPTS_WINDOW)
+        if attempts >= self.MAX_2FA_ATTEMPTS:
+            await self.state.set(f"blocked:{login}", True, self.BLOCK_2FA_TIME)
+            await self.state.delete(f"failed:{login}")
+            logger.warning(f"Пользователь {login} заблокирован на {self.BLOCK_2FA_TIME} секунд")
 
-    def is_blocked(self, login: str) -> bool:
+    async def is_blocked(self, login: str) -> bool:
         """Проверка, заблокирован ли пользователь."""
-        if login not in self.blocked_users:
-            return False
-        unblock_time = self.blocked_users[login]
-        if time.time() >= unblock_time:
-            del self.blocked_users[login]
-            if login in self.failed_attempts:
-                self.failed_attempts[login] = []
-            return False
-        return True
+        return await self.state.get(f"blocked:{login}") is not None
 
     async def unblock_user(self, login: str) -> None:
-        if login in self.blocked_users:
-            del self.blocked_users[login]
-            logger.info(f"Пользователь {login} разблокирован вручную")
-
-        if login in self.failed_attempts:
-            self.failed_attempts[login] = []
+        await self.state.delete(f"blocked:{login}", f"failed:{login}")
+        logger.info(f"Пользователь {login} разблокирован вручную")
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str | bytes) -> bool:
-        try:
-            plain_bytes = plain_password.encode("utf-8")
-            hash_bytes = (
-                hashed_password.encode("utf-8")
-                if isinstance(hashed_password, str)
-                else hashed_password
-            )
-            return bcrypt.checkpw(plain_bytes, hash_bytes)
-        except Exception as e:
-            logger.error(f"Password verification failed: {e!s}")
-            return False
+        return check_password(plain_password, hashed_password)
+
+    @staticmethod
+    async def check_password(plain_password: str, hashed_password: str | bytes) -> bool:
+        """verify_password в пуле bcrypt, не блокируя event loop."""
+        return await password_hasher.verify(plain_password, hashed_password)
 
     @staticmethod
     def create_access_token(user: User) -> str:
@@ -210,9 +235,12 @@ class AuthService(IAuthService):
 
     @staticmethod
     def get_password_hash(password: str) -> str:
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
-        return hashed_password.decode("utf-8")
+        return hash_password(password, password_hasher.rounds)
+
+    @staticmethod
+    async def hash_password(password: str) -> str:
+        """get_password_hash в пуле bcrypt, не блокируя event loop."""
+        return await password_hasher.hash(password)
 
     @staticmethod
     def decode_token(token: str) -> Dict[str, Any]:
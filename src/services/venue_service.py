@@ -23,6 +23,10 @@ class VenueService(IVenueService):
         logger.debug("Получение списка всех площадок")
         return await self.repository.get_list()
 
+    async def get_page(self, limit: int, offset: int) -> list[Venue]:
+        logger.debug("Получение страницы площадок: limit=%d, offset=%d", limit, offset)
+        return await self.repository.get_page(limit, offset)
+
     async def add(self, venue: Venue) -> Venue:
         try:
             logger.debug("Добавление площадки с ID %d", venue.venue_id)
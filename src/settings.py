@@ -9,6 +9,19 @@ config = configparser.ConfigParser()
 config.read(os.path.join(BASE_DIR, "config.cfg"))
 
 
+def _get(name: str, default: str) -> str:
+    # Переменная окружения имеет приоритет над config.cfg
+    return os.environ.get(name, config["app"].get(name, default))
+
+
+def _get_bool(name: str, default: bool) -> bool:
+    return _get(name, "1" if default else "0").strip().lower() in {"1", "true", "yes"}
+
+
+def _get_list(name: str, default: str) -> list[str]:
+    return [item.strip() for item in _get(name, default).split(",") if item.strip()]
+
+
 class Settings:
     def __init__(self) -> None:
         app = config["app"]
@@ -41,6 +54,54 @@ class Settings:
                 app.get("EXTERNAL_SERVICE_TIMEOUT_SEC", "5"),
             )
         )
+        self.SINGLE_FLIGHT_ENABLED: bool = _get_bool("SINGLE_FLIGHT_ENABLED", True)
+        self.SINGLE_FLIGHT_ROUTES: list[str] = _get_list(
+            "SINGLE_FLIGHT_ROUTES",
+            "/programs/official,/tours,/programs/recommended,/recommended,/session.html",
+        )
+        self.CATALOG_SNAPSHOTS_ENABLED: bool = _get_bool("CATALOG_SNAPSHOTS_ENABLED", True)
+        self.CATALOG_SNAPSHOT_DIR: str = _get(
+            "CATALOG_SNAPSHOT_DIR", os.path.join(BASE_DIR, "snapshots")
+        )
+        self.NEGATIVE_CACHE_TTL_SEC: float = float(_get("NEGATIVE_CACHE_TTL_SEC", "30"))
+        self.NEGATIVE_CACHE_MAX_SIZE: int = int(_get("NEGATIVE_CACHE_MAX_SIZE", "10000"))
+        self.EVENT_PAGE_SIZE: int = int(_get("EVENT_PAGE_SIZE", "20"))
+        self.OPTIONS_PAGE_MAX_SIZE: int = int(_get("OPTIONS_PAGE_MAX_SIZE", "100"))
+        self.API_V2_PAGE_MAX_SIZE: int = int(_get("API_V2_PAGE_MAX_SIZE", "500"))
+        self.TEMPLATE_STREAMING_ENABLED: bool = _get_bool("TEMPLATE_STREAMING_ENABLED", True)
+        self.TEMPLATE_STREAM_CHUNK_SIZE: int = int(_get("TEMPLATE_STREAM_CHUNK_SIZE", "16384"))
+        self.STREAM_BATCH_SIZE: int = int(_get("STREAM_BATCH_SIZE", "500"))
+        self.TEMPLATE_DIR: str = _get("TEMPLATE_DIR", "templates")
+        self.TEMPLATE_BYTECODE_CACHE_DIR: str = _get(
+            "TEMPLATE_BYTECODE_CACHE_DIR", os.path.join(BASE_DIR, ".jinja_cache")
+        )
+        self.TEMPLATE_PRECOMPILE: bool = _get_bool("TEMPLATE_PRECOMPILE", True)
+        self.TEMPLATE_FAIL_FAST: bool = _get_bool("TEMPLATE_FAIL_FAST", False)
+        self.STATIC_DIR: str = _get("STATIC_DIR", os.path.join(BASE_DIR, "static"))
+        self.COMPRESSION_ENABLED: bool = _get_bool("COMPRESSION_ENABLED", True)
+        self.COMPRESSION_MIN_SIZE: int = int(_get("COMPRESSION_MIN_SIZE", "1024"))
+        self.COMPRESSION_GZIP_LEVEL: int = int(_get("COMPRESSION_GZIP_LEVEL", "6"))
+        self.COMPRESSION_BROTLI_QUALITY: int = int(_get("COMPRESSION_BROTLI_QUALITY", "4"))
+        self.COMPRESSION_CACHE_MAX_BYTES: int = int(
+            _get("COMPRESSION_CACHE_MAX_BYTES", str(16 * 1024 * 1024))
+        )
+        self.BCRYPT_MAX_WORKERS: int = int(_get("BCRYPT_MAX_WORKERS", str(os.cpu_count() or 2)))
+        self.BCRYPT_EXECUTOR: str = _get("BCRYPT_EXECUTOR", "thread")
+        self.BCRYPT_ROUNDS: int = int(_get("BCRYPT_ROUNDS", "12"))
+        self.AUTH_TOKEN_CACHE_MAX_SIZE: int = int(_get("AUTH_TOKEN_CACHE_MAX_SIZE", "10000"))
+        self.AUTH_STATE_BACKEND: str = _get("AUTH_STATE_BACKEND", "memory")
+        self.AUTH_STATE_REDIS_URL: str = _get("AUTH_STATE_REDIS_URL", "redis://localhost:6379/0")
+        self.AUTH_STATE_MAX_ENTRIES: int = int(_get("AUTH_STATE_MAX_ENTRIES", "100000"))
+        self.RATE_LIMIT_ENABLED: bool = _get_bool("RATE_LIMIT_ENABLED", True)
+        self.RATE_LIMIT_BACKEND: str = _get("RATE_LIMIT_BACKEND", "memory")
+        self.RATE_LIMIT_REDIS_URL: str = _get("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+        self.RATE_LIMIT_MAX_KEYS: int = int(_get("RATE_LIMIT_MAX_KEYS", "100000"))
+        self.RATE_LIMIT_SHARDS: int = int(_get("RATE_LIMIT_SHARDS", "16"))
+        self.RATE_LIMIT_IP_PER_MIN: float = float(_get("RATE_LIMIT_IP_PER_MIN", "60"))
+        self.RATE_LIMIT_IP_BURST: int = int(_get("RATE_LIMIT_IP_BURST", "20"))
+        self.RATE_LIMIT_LOGIN_PER_MIN: float = float(_get("RATE_LIMIT_LOGIN_PER_MIN", "10"))
+        self.RATE_LIMIT_LOGIN_BURST: int = int(_get("RATE_LIMIT_LOGIN_BURST", "5"))
+        self.RATE_LIMIT_TRUST_PROXY: bool = _get_bool("RATE_LIMIT_TRUST_PROXY", False)
 
     def get_secret_key(self) -> str:
         return self.SECRET_KEY
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from collections import defaultdict
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Iterable
+from typing import TypeVar
+
+from fastapi import Request
+
+from settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Объединяет одновременные одинаковые чтения в одно вычисление.
+
+    Пока вычисление по ключу выполняется, повторные запросы с тем же ключом
+    не запускают его заново, а ждут уже запущенную задачу.
+    """
+
+    def __init__(self, routes: Iterable[str], enabled: bool = True) -> None:
+        self.routes = frozenset(routes)
+        self.enabled = enabled
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self._executed: defaultdict[str, int] = defaultdict(int)
+        self._coalesced: defaultdict[str, int] = defaultdict(int)
+
+    def is_enabled(self, route: str) -> bool:
+        return self.enabled and route in self.routes
+
+    @staticmethod
+    def request_key(request: Request) -> str:
+        params = "&".join(
+            f"{k}={v}" for k, v in sorted(request.query_params.multi_items())
+        )
+        return f"{request.url.path}?{params}"
+
+    async def do(
+        self, key: str, fn: Callable[[], Awaitable[T]], route: str | None = None
+    ) -> T:
+        route = route or key
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._coalesced[route] += 1
+            logger.debug("Запрос %s присоединён к выполняющемуся вычислению", key)
+            return await asyncio.shield(future)
+
+        self._executed[route] += 1
+        future = asyncio.ensure_future(fn())
+        self._in_flight[key] = future
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: str, future: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+    async def run(self, request: Request, fn: Callable[[], Awaitable[T]]) -> T:
+        route = request.url.path
+        if not self.is_enabled(route):
+            return await fn()
+        return await self.do(self.request_key(request), fn, route)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            route: {
+                "executed": self._executed[route],
+                "coalesced": self._coalesced[route],
+                "in_flight": sum(
+                    1 for key in self._in_flight if key.startswith(f"{route}?")
+                ),
+            }
+            for route in sorted(self.routes)
+        }
+
+
+single_flight = SingleFlight(
+    settings.SINGLE_FLIGHT_ROUTES, enabled=settings.SINGLE_FLIGHT_ENABLED
+)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mimetypes
+import posixpath
+import re
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi.responses import Response
+
+from settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+MANIFEST_NAME = "vendor.json"
+
+mimetypes.add_type("font/woff2", ".woff2")
+mimetypes.add_type("font/woff", ".woff")
+
+_CSS_URL = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+
+@dataclass(frozen=True, slots=True)
+class Asset:
+    body: bytes
+    media_type: str
+    etag: str
+
+
+class StaticAssets:
+    """Файлы из static/ под именами с хэшем содержимого.
+
+    Хэшированный URL никогда не меняет содержимое, поэтому отдаётся с
+    Cache-Control: immutable — повторные просмотры не запрашивают ассеты.
+    Ссылки url(...) внутри CSS переписываются на хэшированные имена.
+    Файлы из vendor.json, которых нет на диске (vendor_assets.py не запускался),
+    дают ошибку в логе при загрузке и при каждом обращении — адресов CDN нет.
+    """
+
+    def __init__(self, directory: Path, prefix: str = "/static") -> None:
+        self.directory = directory
+        self.prefix = prefix
+        self._urls: dict[str, str] = {}
+        self._hashed: dict[str, Asset] = {}
+        self._plain: dict[str, Asset] = {}
+        self._missing: set[str] = set()
+        self._loaded = False
+
+    def load(self) -> None:
+        self._urls.clear()
+        self._hashed.clear()
+        self._plain.clear()
+        manifest = self.directory / MANIFEST_NAME
+        vendored = json.loads(manifest.read_text("utf-8")) if manifest.exists() else {}
+        files = sorted(
+            p.relative_to(self.directory).as_posix()
+            for p in self.directory.rglob("*")
+            if p.is_file() and p.name != MANIFEST_NAME
+        )
+        # CSS последними: к этому моменту известны хэши шрифтов и картинок
+        for name in sorted(files, key=lambda n: n.endswith(".css")):
+            self._add(name, (self.directory / name).read_bytes())
+        self._missing = {name for name in vendored if name not in self._plain}
+        if self._missing:
+            logger.error(
+                "Не скачаны сторонние ассеты (python vendor_assets.py): %s",
+                ", ".join(sorted(self._missing)),
+            )
+        self._loaded = True
+        logger.info("Загружено статических файлов: %d", len(self._plain))
+
+    def _add(self, name: str, body: bytes) -> None:
+        if name.endswith(".css"):
+            body = self._rewrite_css(name, body)
+        digest = hashlib.blake2b(body, digest_size=6).hexdigest()
+        stem, dot, suffix = name.rpartition(".")
+        hashed = f"{stem}.{digest}.{suffix}" if dot else f"{name}.{digest}"
+        media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        asset = Asset(body=body, media_type=media_type, etag=f'"{digest}"')
+        self._hashed[hashed] = asset
+        self._plain[name] = asset
+        self._urls[name] = f"{self.prefix}/{hashed}"
+
+    def _rewrite_css(self, name: str, body: bytes) -> bytes:
+        base = posixpath.dirname(name)
+
+        def replace(match: re.Match[str]) -> str:
+            path = match.group(2).split("?", 1)[0].split("#", 1)[0]
+            target = posixpath.normpath(posixpath.join(base, path))
+            url = self._urls.get(target)
+            if url is None:
+                return match.group(0)
+            return f'url("{url}")'
+
+        return _CSS_URL.sub(replace, body.decode("utf-8")).encode("utf-8")
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def url(self, name: str) -> str:
+        """URL ассета для шаблонов: {{ asset_url('vendor/jquery/jquery.min.js') }}."""
+        self._ensure_loaded()
+        if (url := self._urls.get(name)) is not None:
+            return url
+        if name in self._missing:
+            logger.error("Сторонний ассет %s не скачан, запустите vendor_assets.py", name)
+        else:
+            logger.warning("Статический файл %s не найден", name)
+        return f"{self.prefix}/{name}"
+
+    def response(self, path: str, if_none_match: str | None = None) -> Response:
+        self._ensure_loaded()
+        if (asset := self._hashed.get(path)) is not None:
+            cache_control = IMMUTABLE
+        elif (asset := self._plain.get(path)) is not None:
+            # Старые ссылки без хэша работают, но каждый раз перепроверяются
+            cache_control = "no-cache"
+        else:
+            return Response(status_code=404)
+        headers = {"Cache-Control": cache_control, "ETag": asset.etag}
+        if if_none_match == asset.etag:
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=asset.body,
+            media_type=asset.media_type,
+            headers=headers,
+        )
+
+
+static_assets = StaticAssets(Path(settings.STATIC_DIR))
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+
+from typing import Any
+from typing import AsyncIterator
+from typing import Mapping
+
+from fastapi.responses import HTMLResponse
+from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
+from jinja2 import Template
+
+from settings import settings
+from templating import async_env
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _render_chunks(
+    template: Template, context: dict[str, Any], chunk_size: int
+) -> AsyncIterator[bytes]:
+    buffer: list[str] = []
+    size = 0
+    try:
+        async for piece in template.generate_async(context):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(buffer).encode()
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer).encode()
+    except Exception as e:
+        # Заголовки уже отправлены — остаётся только оборвать ответ
+        logger.error("Ошибка при потоковом рендеринге %s: %s", template.name, str(e), exc_info=True)
+        raise
+
+
+async def stream_template(
+    name: str,
+    context: dict[str, Any],
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Рендерит шаблон по частям, не собирая страницу целиком в памяти.
+
+    В контексте можно передавать async-итераторы — шаблон читает их
+    по мере вывода строк.
+    """
+    template = async_env.get_template(name)
+    if not settings.TEMPLATE_STREAMING_ENABLED:
+        content = await template.render_async(context)
+        return HTMLResponse(content, status_code=status_code, headers=headers)
+    return StreamingResponse(
+        _render_chunks(template, context, settings.TEMPLATE_STREAM_CHUNK_SIZE),
+        status_code=status_code,
+        headers=headers,
+        media_type="text/html; charset=utf-8",
+    )
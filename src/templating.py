@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import logging
+import os
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import BytecodeCache
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import FileSystemLoader
+from jinja2 import TemplateError
+
+from settings import settings
+from static_assets import static_assets
+from view_models import dumps
+
+
+logger = logging.getLogger(__name__)
+
+
+def _bytecode_cache(pattern: str) -> BytecodeCache | None:
+    directory = settings.TEMPLATE_BYTECODE_CACHE_DIR
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return FileSystemBytecodeCache(directory, pattern)
+
+
+def _create_env() -> Environment:
+    env = Environment(
+        loader=FileSystemLoader(settings.TEMPLATE_DIR),
+        autoescape=True,
+        bytecode_cache=_bytecode_cache("__jinja2_%s.cache"),
+    )
+    env.policies["json.dumps_function"] = dumps
+    env.globals["asset_url"] = static_assets.url
+    return env
+
+
+# Одно окружение на процесс: шаблоны разбираются и компилируются один раз
+templates = Jinja2Templates(env=_create_env())
+
+# Для потокового рендеринга. Ключ байткод-кэша Jinja не учитывает enable_async,
+# поэтому у async-варианта свои файлы кэша.
+async_env = templates.env.overlay(
+    enable_async=True,
+    cache_size=400,
+    bytecode_cache=_bytecode_cache("__jinja2_async_%s.cache"),
+)
+
+
+def precompile_templates(fail_fast: bool = False) -> int:
+    """Компилирует все шаблоны заранее, чтобы первые запросы не платили за это.
+
+    При fail_fast ошибка в любом шаблоне прерывает запуск приложения.
+    """
+    compiled = 0
+    for name in templates.env.list_templates(extensions=["html"]):
+        try:
+            templates.env.get_template(name)
+            async_env.get_template(name)
+            compiled += 1
+        except TemplateError as e:
+            if fail_fast:
+                raise
+            logger.error("Ошибка компиляции шаблона %s: %s", name, str(e))
+    logger.info("Скомпилировано шаблонов: %d", compiled)
+    return compiled
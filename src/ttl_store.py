@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+
+from settings import settings
+
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # общий backend нужен только при AUTH_STATE_BACKEND=redis
+    redis = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class TTLStore(ABC):
+    """Ключ-значение с истечением по времени: блокировки входа, коды 2FA.
+
+    Значения должны сериализоваться в JSON, чтобы общий backend мог
+    хранить их вне процесса.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    async def pop(self, key: str) -> Any | None:
+        """Атомарно читает и удаляет значение: его получит только один вызов."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str, ttl: float) -> int:
+        """Счётчик +1; TTL отсчитывается от первого увеличения."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        pass
+
+
+class MemoryTTLStore(TTLStore):
+    """Хранилище в памяти процесса с ограничением по числу записей.
+
+    Истёкшие записи удаляются при чтении и периодическим проходом при записи.
+    При превышении max_entries сначала вытесняются самые давно изменённые
+    записи с префиксами evict_first (счётчики неудачных попыток), и только
+    когда их нет — остальные (блокировки, коды 2FA).
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        sweep_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        evict_first: tuple[str, ...] = (),
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.sweep_interval = sweep_interval
+        self.evict_first = evict_first
+        self._clock = clock
+        self._volatile: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._last_sweep = clock()
+        self.expired = 0
+        self.evicted = 0
+
+    def _table(self, key: str) -> OrderedDict[str, tuple[float, Any]]:
+        return self._volatile if key.startswith(self.evict_first) else self._entries
+
+    def _size(self) -> int:
+        return len(self._volatile) + len(self._entries)
+
+    def _live(self, key: str, now: float) -> tuple[float, Any] | None:
+        table = self._table(key)
+        entry = table.get(key)
+        if entry is not None and entry[0] <= now:
+            del table[key]
+            self.expired += 1
+            return None
+        return entry
+
+    def _sweep(self, now: float) -> None:
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        for table in (self._volatile, self._entries):
+            dead = [key for key, (expires_at, _) in table.items() if expires_at <= now]
+            for key in dead:
+                del table[key]
+            self.expired += len(dead)
+
+    def _put(self, key: str, expires_at: float, value: Any) -> None:
+        table = self._table(key)
+        table[key] = (expires_at, value)
+        table.move_to_end(key)
+        while self._size() > self.max_entries:
+            (self._volatile or self._entries).popitem(last=False)
+            self.evicted += 1
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._live(key, self._clock())
+        return entry[1] if entry else None
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        now = self._clock()
+        self._sweep(now)
+        self._put(key, now + ttl, value)
+
+    async def pop(self, key: str) -> Any | None:
+        entry = self._live(key, self._clock())
+        if entry is None:
+            return None
+        del self._table(key)[key]
+        return entry[1]
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._table(key).pop(key, None)
+
+    async def incr(self, key: str, ttl: float) -> int:
+        now = self._clock()
+        self._sweep(now)
+        entry = self._live(key, now)
+        expires_at, count = entry if entry else (now + ttl, 0)
+        self._put(key, expires_at, count + 1)
+        return int(count + 1)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "memory",
+            "size": self._size(),
+            "max_entries": self.max_entries,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+
+_INCR_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then redis.call('PEXPIRE', KEYS[1], ARGV[1]) end
+return count
+"""
+
+
+class RedisTTLStore(TTLStore):
+    """Общее для всех воркеров хранилище в Redis; TTL и память — на стороне Redis."""
+
+    def __init__(self, url: str, prefix: str = "event-manager:auth:") -> None:
+        if redis is None:
+            raise RuntimeError("AUTH_STATE_BACKEND=redis требует пакет redis")
+        self._client = redis.from_url(url)
+        self._incr = self._client.register_script(_INCR_SCRIPT)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self._client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self._client.set(self.prefix + key, json.dumps(value), px=max(1, int(ttl * 1000)))
+
+    async def pop(self, key: str) -> Any | None:
+        raw = await self._client.getdel(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*(self.prefix + key for key in keys))
+
+    async def incr(self, key: str, ttl: float) -> int:
+        # INCR и PEXPIRE одним скриптом: счётчик не останется без TTL
+        count = await self._incr(keys=[self.prefix + key], args=[max(1, int(ttl * 1000))])
+        return int(count)
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": "redis"}
+
+
+def make_ttl_store(backend: str) -> TTLStore:
+    if backend == "redis":
+        logger.info("Состояние входа хранится в Redis")
+        return RedisTTLStore(settings.AUTH_STATE_REDIS_URL)
+    # счётчики неудачных попыток дешевле потерять, чем действующие блокировки
+    return MemoryTTLStore(settings.AUTH_STATE_MAX_ENTRIES, evict_first=("failed:",))
+
+
+auth_state = make_ttl_store(settings.AUTH_STATE_BACKEND)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+
+from dataclasses import dataclass
+from dataclasses import fields
+from dataclasses import is_dataclass
+from datetime import date
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from models.activity import Activity
+from models.event import Event
+from models.lodging import Lodging
+from models.program import Program
+from models.session import Session
+from models.user import User
+from models.venue import Venue
+
+
+NO_VENUE = "Не указан"
+
+
+def _venue_name(venue: Venue | None) -> str:
+    return venue.name if venue else NO_VENUE
+
+
+def _venue_from_row(row: dict[str, Any]) -> Venue | None:
+    if row["venue_id"] is None:
+        return None
+    return Venue(venue_id=row["venue_id"], name=row["venue_name"])
+
+
+@dataclass(slots=True)
+class UserView:
+    user_id: int
+    fio: str
+    email: str
+
+    @classmethod
+    def from_model(cls, user: User) -> UserView:
+        return cls(user_id=user.user_id, fio=user.fio, email=user.email)
+
+
+@dataclass(slots=True)
+class ActivityView:
+    id: int
+    duration: str
+    address: str
+    activity_type: str
+    activity_time: datetime
+    venue_name: str
+    venue: Venue | None
+
+    @classmethod
+    def from_model(cls, activity: Activity) -> ActivityView:
+        return cls(
+            id=activity.activity_id,
+            duration=activity.duration,
+            address=activity.address,
+            activity_type=activity.activity_type,
+            activity_time=activity.activity_time,
+            venue_name=_venue_name(activity.venue),
+            venue=activity.venue,
+        )
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> ActivityView:
+        return cls(
+            id=row["id"],
+            duration=row["duration"],
+            address=row["address"],
+            activity_type=row["activity_type"],
+            activity_time=row["activity_time"],
+            venue_name=row["venue_name"] or NO_VENUE,
+            venue=_venue_from_row(row),
+        )
+
+
+@dataclass(slots=True)
+class LodgingView:
+    id: int
+    price: int
+    address: str
+    name: str
+    type: str
+    rating: int
+    check_in: datetime
+    check_out: datetime
+    venue_name: str
+    venue: Venue | None
+
+    @classmethod
+    def from_model(cls, lodging: Lodging) -> LodgingView:
+        return cls(
+            id=lodging.lodging_id,
+            price=lodging.price,
+            address=lodging.address,
+            name=lodging.name,
+            type=lodging.type,
+            rating=lodging.rating,
+            check_in=lodging.check_in,
+            check_out=lodging.check_out,
+            venue_name=_venue_name(lodging.venue),
+            venue=lodging.venue,
+        )
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> LodgingView:
+        return cls(
+            id=row["id"],
+            price=row["price"],
+            address=row["address"],
+            name=row["name"],
+            type=row["type"],
+            rating=row["rating"],
+            check_in=row["check_in"],
+            check_out=row["check_out"],
+            venue_name=row["venue_name"] or NO_VENUE,
+            venue=_venue_from_row(row),
+        )
+
+
+@dataclass(slots=True)
+class ProgramView:
+    id: int
+    transfer_type: str
+    cost: int
+    transfer_duration_minutes: int
+    start_venue: str | None
+    end_venue: str | None
+
+    @classmethod
+    def from_model(cls, program: Program) -> ProgramView:
+        return cls(
+            id=program.program_id,
+            transfer_type=program.transfer_type,
+            cost=program.cost,
+            transfer_duration_minutes=program.transfer_duration_minutes,
+            start_venue=program.start_venue.name if program.start_venue else None,
+            end_venue=program.end_venue.name if program.end_venue else None,
+        )
+
+
+@dataclass(slots=True)
+class EventView:
+    id: int
+    status: str
+    users: list[UserView]
+    activities: list[ActivityView]
+    lodgings: list[LodgingView]
+
+    @classmethod
+    def from_model(
+        cls,
+        event: Event,
+        users: list[User] | None = None,
+        activities: list[Activity] | None = None,
+        lodgings: list[Lodging] | None = None,
+    ) -> EventView:
+        """Связанные сущности можно передать явно, иначе берутся из event."""
+        return cls(
+            id=event.event_id,
+            status=event.status,
+            users=[UserView.from_model(u) for u in (event.users if users is None else users) or []],
+            activities=[
+                ActivityView.from_model(a)
+                for a in (event.activities if activities is None else activities) or []
+            ],
+            lodgings=[
+                LodgingView.from_model(ldg)
+                for ldg in (event.lodgings if lodgings is None else lodgings) or []
+            ],
+        )
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> EventView:
+        return cls(
+            id=row["id"],
+            status=row["status"],
+            users=[UserView(**u) for u in row["users"]],
+            activities=[ActivityView.from_row(a) for a in row["activities"]],
+            lodgings=[LodgingView.from_row(ldg) for ldg in row["lodgings"]],
+        )
+
+
+@dataclass(slots=True)
+class SessionView:
+    id: int
+    start_time: datetime | None
+    end_time: datetime | None
+    type: str
+    program: ProgramView | None
+    event: EventView | None
+
+    @classmethod
+    def from_model(cls, session: Session, event: EventView | None = None) -> SessionView:
+        return cls(
+            id=session.session_id,
+            start_time=session.start_time,
+            end_time=session.end_time,
+            type=session.type,
+            program=ProgramView.from_model(session.program) if session.program else None,
+            event=event,
+        )
+
+
+def _default(obj: Any) -> Any:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, **kwargs: Any) -> str:
+    """json.dumps, понимающий view-модели; используется фильтром tojson."""
+    return json.dumps(obj, default=_default, **kwargs)
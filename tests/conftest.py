@@ -229,7 +229,8 @@ async def create_tables(session: AsyncSession) -> None:
             event_id INT NOT NULL,
             users_id INT NOT NULL,
             CONSTRAINT fk_event_id FOREIGN KEY (event_id) REFERENCES Event(id) ON DELETE CASCADE,
-            CONSTRAINT fk_users_id FOREIGN KEY (users_id) REFERENCES users(id) ON DELETE CASCADE
+            CONSTRAINT fk_users_id FOREIGN KEY (users_id) REFERENCES users(id) ON DELETE CASCADE,
+            CONSTRAINT users_event_event_user_key UNIQUE (event_id, users_id)
         )
         """,
         """
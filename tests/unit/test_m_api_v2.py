@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from builders import EventMother
+from builders import LodgingBuilder
+from builders import VenueMother
+from fastapi import HTTPException
+
+from repository.session_repository import SessionRepository
+from routers.api_v2 import parse_fields
+from routers.api_v2 import parse_includes
+from routers.api_v2 import serialize
+from service_locator import ServiceLocator
+from service_locator import get_service_locator
+from services.event_service import EventService
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_relations_are_ids_unless_included() -> None:
+    event = EventMother.active()
+    event.lodgings = [LodgingBuilder().with_id(2).with_venue(VenueMother.moscow()).build()]
+
+    flat = serialize(event, "events")
+    nested = serialize(event, "events", includes=parse_includes("events", "lodgings.venue,users"))
+
+    assert flat["users"] == [1] and flat["lodgings"] == [2]
+    assert nested["lodgings"][0]["venue"]["name"] == event.lodgings[0].venue.name
+    assert nested["activities"] == [1]
+    assert "password" not in nested["users"][0]
+    assert "number_passport" not in nested["users"][0]
+
+
+def test_fields_select_top_level_keys_and_reject_unknown() -> None:
+    event = EventMother.active()
+
+    assert serialize(event, "events", parse_fields("events", "status,event_id")) == {
+        "event_id": 1,
+        "status": "Активное",
+    }
+    with pytest.raises(HTTPException):
+        parse_fields("users", "password")
+    with pytest.raises(HTTPException):
+        parse_includes("events", "users.venue")
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_serialises_without_templates() -> None:
+    import main
+
+    event_service = Mock(spec=EventService)
+    event_service.get_page = AsyncMock(return_value=[EventMother.active()])
+    service_locator = Mock(spec=ServiceLocator)
+    service_locator.get_event_serv.return_value = event_service
+    main.app.dependency_overrides[get_service_locator] = lambda: service_locator
+    try:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/api/v2/events", params={"include": "activities", "limit": 10, "offset": 5}
+            )
+            bad = await client.get("/api/v2/events", params={"fields": "nope"})
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = json.loads(response.content)
+    assert body["items"][0]["activities"][0]["activity_time"] == "2025-06-10T09:00:00"
+    event_service.get_page.assert_awaited_once_with(10, 5)
+    assert bad.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_session_page_is_limited_in_sql_and_loads_relations_in_batches() -> None:
+    start = datetime(2025, 6, 10, 9, 0)
+    rows = [
+        {"id": session_id, "program_id": 7, "event_id": 1, "start_time": start, "end_time": start, "type": "Лекция"}
+        for session_id in (42, 41)
+    ]
+    page, by_ids = MagicMock(), MagicMock()
+    page.scalars.return_value.all.return_value = [41, 42]
+    by_ids.mappings.return_value.all.return_value = rows
+    db = Mock()
+    db.execute = AsyncMock(side_effect=[page, by_ids])
+    program_repo, event_repo = Mock(), Mock()
+    program_repo.get_by_ids = AsyncMock(return_value={})
+    event_repo.get_by_ids = AsyncMock(return_value={1: EventMother.active()})
+
+    sessions = await SessionRepository(db, program_repo, event_repo).get_page(2, 40)
+
+    assert [s.session_id for s in sessions] == [41, 42]
+    assert "LIMIT :limit OFFSET :offset" in str(db.execute.await_args_list[0].args[0])
+    assert db.execute.await_args_list[0].args[1] == {"limit": 2, "offset": 40}
+    assert db.execute.await_count == 2
+    program_repo.get_by_ids.assert_awaited_once()
+    event_repo.get_by_ids.assert_awaited_once()
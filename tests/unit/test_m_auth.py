@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from fastapi import HTTPException
+
+from auth import CurrentUser
+from auth import TokenCache
+from auth import token_cache
+from controllers.session_controller import SessionController
+from models.user import User
+from request_schemas import JoinSessionIn
+from request_schemas import UserSessionIn
+from service_locator import ServiceLocator
+from service_locator import get_service_locator
+from services.user_service import AuthService
+
+
+pytestmark = pytest.mark.unit
+
+USER = User(
+    user_id=7,
+    fio="Иванов Иван",
+    number_passport="1234567890",
+    phone_number="89991234567",
+    email="ivan@example.com",
+    login="ivan",
+    password="Password123!",
+)
+
+
+async def request(
+    method: str, url: str, token: str | None = None, body: Any = None, sl: Mock | None = None
+) -> httpx.Response:
+    import main
+
+    main.app.dependency_overrides[get_service_locator] = lambda: sl or Mock(spec=ServiceLocator)
+    headers = {"Content-Type": "application/json"}
+    if token is not None:
+        headers["Authorization"] = f"Bearer {token}"
+    try:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(
+                method, url, headers=headers,
+                content=json.dumps(body) if body is not None else None,
+            )
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_me_is_served_from_token_and_cached() -> None:
+    token_cache.clear()
+    token = AuthService.create_access_token(USER)
+
+    with patch.object(AuthService, "decode_token", wraps=AuthService.decode_token) as decode:
+        first = await request("GET", "/api/me", token)
+        second = await request("GET", "/api/me", token)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == {"user_id": 7, "login": "ivan", "is_admin": False}
+    assert decode.call_count == 1
+    assert (await request("GET", "/api/me", "broken")).status_code == 401
+    assert (await request("GET", "/api/me")).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_join_takes_user_from_token() -> None:
+    controller = Mock(spec=SessionController)
+    controller.join_to_event = AsyncMock(return_value={"message": "ok"})
+    sl = Mock(spec=ServiceLocator)
+    sl.get_session_contr.return_value = controller
+    token = AuthService.create_access_token(USER)
+
+    ok = await request("POST", "/sessions/3/join", token, {}, sl)
+    foreign = await request("POST", "/sessions/3/join", token, {"user_id": 8}, sl)
+    anonymous = await request("POST", "/sessions/3/join", None, {"user_id": 8}, sl)
+
+    assert ok.status_code == 200
+    assert foreign.status_code == 403
+    assert anonymous.status_code == 401
+    assert [c.args for c in controller.join_to_event.await_args_list] == [
+        (3, JoinSessionIn(user_id=7)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_new_session_for_deleted_token_user_is_400() -> None:
+    services = {name: Mock() for name in ("session", "event", "program", "user", "activity", "lodging")}
+    services["program"].get_by_venues = AsyncMock(return_value=Mock())
+    services["user"].get_by_id = AsyncMock(return_value=None)
+    services["event"].add = AsyncMock()
+    controller = SessionController(*services.values())
+    data = UserSessionIn(
+        start_date="01.05.2025", end_date="03.05.2025", start_venue=1, end_venue=2,
+        transfer_type="Автобус", user_id=7,
+    )
+
+    with pytest.raises(HTTPException) as error:
+        await controller.create_new_session_user(data)
+
+    assert error.value.status_code == 400
+    services["user"].get_by_id.assert_awaited_once_with(7)
+    services["event"].add.assert_not_called()
+
+
+def test_token_cache_drops_expired_and_least_recent() -> None:
+    now = [100.0]
+    cache = TokenCache(max_size=2, clock=lambda: now[0])
+    user = CurrentUser(user_id=1, login="a", is_admin=False)
+    cache.put("a", user, expires_at=150.0)
+    cache.put("b", user, expires_at=500.0)
+    cache.get("a")
+    cache.put("c", user, expires_at=500.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == user
+    now[0] = 200.0
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 1
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import gzip
+
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from starlette.requests import Request
+
+from catalog_snapshots import CatalogSnapshots
+from catalog_snapshots import accepts_encoding
+
+
+pytestmark = pytest.mark.unit
+
+HTML = "<html><body>Официальные программы</body></html>"
+
+
+def make_request(accept_encoding: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/programs/official",
+            "headers": [(b"accept-encoding", accept_encoding.encode())],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_rendered_once_per_digest(tmp_path: Path) -> None:
+    render = AsyncMock(return_value=HTML)
+    snapshots = CatalogSnapshots(tmp_path)
+
+    first = await snapshots.ensure("official", "abc", render)
+    second = await snapshots.ensure("official", "abc", render)
+
+    assert first == second
+    render.assert_awaited_once()
+    assert first.html.read_text(encoding="utf-8") == HTML
+    assert gzip.decompress(first.gzip.read_bytes()).decode("utf-8") == HTML
+    assert not list(tmp_path.glob(".*"))
+
+
+@pytest.mark.asyncio
+async def test_old_generations_are_pruned(tmp_path: Path) -> None:
+    snapshots = CatalogSnapshots(tmp_path)
+
+    for digest in ("v1", "v2", "v3"):
+        await snapshots.ensure("official", digest, AsyncMock(return_value=HTML))
+    await snapshots.ensure("recommended", "v1", AsyncMock(return_value=HTML))
+
+    names = {p.name for p in tmp_path.glob("*.html")}
+    assert names == {"official-v2.html", "official-v3.html", "recommended-v1.html"}
+    assert not (tmp_path / "official-v1.html.gz").exists()
+
+
+@pytest.mark.asyncio
+async def test_file_response_negotiates_encoding(tmp_path: Path) -> None:
+    snapshots = CatalogSnapshots(tmp_path)
+    snapshot = await snapshots.ensure("official", "abc", AsyncMock(return_value=HTML))
+
+    gz = snapshots.file_response(make_request("gzip, deflate"), snapshot, {"ETag": 'W/"abc"'})
+    plain = snapshots.file_response(make_request("identity"), snapshot, {})
+
+    assert gz.path == snapshot.gzip
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.headers["etag"] == 'W/"abc"'
+    assert plain.path == snapshot.html
+    assert "content-encoding" not in plain.headers
+
+
+def test_accepts_encoding_respects_zero_quality() -> None:
+    assert accepts_encoding(make_request("br;q=1.0, gzip"), "br")
+    assert not accepts_encoding(make_request("gzip;q=0, br"), "gzip")
+    assert not accepts_encoding(make_request(""), "gzip")
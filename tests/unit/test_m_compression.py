@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import gzip
+
+from typing import AsyncIterator
+
+import brotli
+import httpx
+import pytest
+
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse
+from fastapi.responses import PlainTextResponse
+from fastapi.responses import StreamingResponse
+
+from compression import CompressionCache
+from compression import CompressionMiddleware
+
+
+pytestmark = pytest.mark.unit
+
+PAGE = "<tr><td>строка</td></tr>" * 200
+
+
+def make_app(cache: CompressionCache) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, cache=cache)
+
+    @app.get("/page")
+    async def page() -> HTMLResponse:
+        return HTMLResponse(PAGE, headers={"ETag": '"v1"'})
+
+    @app.get("/other")
+    async def other() -> HTMLResponse:
+        return HTMLResponse(PAGE.upper(), headers={"ETag": '"v1"'})
+
+    @app.get("/partial")
+    async def partial() -> HTMLResponse:
+        return HTMLResponse(
+            PAGE, status_code=206, headers={"Content-Range": f"bytes 0-{len(PAGE)}/*"}
+        )
+
+    @app.get("/small")
+    async def small() -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for _ in range(3):
+                yield PAGE.encode()
+
+        return StreamingResponse(chunks(), media_type="text/html")
+
+    @app.get("/precompressed")
+    async def precompressed() -> HTMLResponse:
+        body = gzip.compress(PAGE.encode())
+        return HTMLResponse(body, headers={"Content-Encoding": "gzip"})
+
+    return app
+
+
+async def fetch(app: FastAPI, url: str, encoding: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(url, headers={"Accept-Encoding": encoding})
+
+
+@pytest.mark.asyncio
+async def test_gzip_and_brotli_are_negotiated() -> None:
+    app = make_app(CompressionCache(1024 * 1024))
+
+    gz = await fetch(app, "/page", "gzip")
+    br = await fetch(app, "/page", "gzip, br")
+    plain = await fetch(app, "/page", "identity")
+
+    assert gz.headers["content-encoding"] == "gzip"
+    assert br.headers["content-encoding"] == "br"
+    assert "content-encoding" not in plain.headers
+    assert gz.text == br.text == plain.text == PAGE
+    assert int(gz.headers["content-length"]) < len(PAGE.encode()) // 10
+    assert gz.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.asyncio
+async def test_small_and_precompressed_responses_pass_through() -> None:
+    app = make_app(CompressionCache(1024 * 1024))
+
+    small = await fetch(app, "/small", "gzip")
+    ready = await fetch(app, "/precompressed", "br")
+
+    assert "content-encoding" not in small.headers
+    assert ready.headers["content-encoding"] == "gzip"
+    assert ready.text == PAGE
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_chunk_by_chunk() -> None:
+    app = make_app(CompressionCache(1024 * 1024))
+
+    response = await fetch(app, "/stream", "br")
+
+    assert response.headers["content-encoding"] == "br"
+    assert "content-length" not in response.headers
+    assert response.text == PAGE * 3
+
+
+@pytest.mark.asyncio
+async def test_responses_with_etag_reuse_compressed_body() -> None:
+    cache = CompressionCache(1024 * 1024)
+    app = make_app(cache)
+
+    first = await fetch(app, "/page", "br")
+    second = await fetch(app, "/page", "br")
+
+    assert first.content == second.content
+    assert cache.stats()["hits"] == 1
+    assert brotli.decompress(cache.get("/page", '"v1"', "br") or b"") == PAGE.encode()
+    other = await fetch(app, "/other", "br")
+    assert other.text == PAGE.upper()
+
+
+@pytest.mark.asyncio
+async def test_partial_content_is_not_compressed() -> None:
+    response = await fetch(make_app(CompressionCache(1024 * 1024)), "/partial", "gzip")
+
+    assert response.status_code == 206
+    assert "content-encoding" not in response.headers
+    assert response.text == PAGE
+
+
+def test_cache_evicts_oldest_bodies_over_byte_limit() -> None:
+    cache = CompressionCache(max_bytes=10)
+
+    cache.put("/a", "a", "gzip", b"12345")
+    cache.put("/b", "b", "gzip", b"12345")
+    cache.put("/c", "c", "gzip", b"12345")
+
+    assert cache.get("/a", "a", "gzip") is None
+    assert cache.get("/c", "c", "gzip") == b"12345"
+    assert cache.stats()["bytes"] == 10
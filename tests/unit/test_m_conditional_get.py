@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import pytest
+
+from starlette.requests import Request
+
+from conditional_get import VENUE_TABLES
+from conditional_get import get_validators
+from conditional_get import is_not_modified
+from conditional_get import not_modified
+from repository.table_version_repository import TableVersionRepository
+
+
+pytestmark = pytest.mark.unit
+
+UPDATED_AT = datetime(2025, 4, 1, 12, 30, 15, 123456, tzinfo=UTC)
+
+
+def make_request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/venue.html",
+            "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+
+
+def make_repo(version: int) -> Mock:
+    repo = Mock(spec=TableVersionRepository)
+    repo.get_versions = AsyncMock(return_value={"venue": (version, UPDATED_AT)})
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_with_table_version() -> None:
+    first = await get_validators(make_repo(1), "/venue.html", VENUE_TABLES)
+    second = await get_validators(make_repo(2), "/venue.html", VENUE_TABLES)
+
+    assert first is not None and second is not None
+    assert first.etag != second.etag
+    assert first.last_modified == UPDATED_AT.replace(microsecond=0)
+
+
+@pytest.mark.asyncio
+async def test_missing_versions_disable_validation() -> None:
+    repo = Mock(spec=TableVersionRepository)
+    repo.get_versions = AsyncMock(return_value={})
+
+    assert await get_validators(repo, "/venue.html", VENUE_TABLES) is None
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_is_not_modified() -> None:
+    validators = await get_validators(make_repo(3), "/venue.html", VENUE_TABLES)
+    assert validators is not None
+
+    assert is_not_modified(make_request(if_none_match=validators.etag), validators)
+    assert not is_not_modified(make_request(if_none_match='W/"other"'), validators)
+
+    response = not_modified(validators)
+    assert response.status_code == 304
+    assert response.headers["etag"] == validators.etag
+
+
+@pytest.mark.asyncio
+async def test_if_modified_since_is_used_without_etag() -> None:
+    validators = await get_validators(make_repo(3), "/venue.html", VENUE_TABLES)
+    assert validators is not None
+    last_modified = validators.headers()["Last-Modified"]
+
+    assert is_not_modified(make_request(if_modified_since=last_modified), validators)
+    assert not is_not_modified(
+        make_request(if_modified_since="Mon, 31 Mar 2025 00:00:00 GMT"), validators
+    )
+    assert not is_not_modified(make_request(), validators)
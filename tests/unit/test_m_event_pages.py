@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+import pytest
+
+from builders import EventMother
+
+from controllers.event_controller import EventController
+from repository.event_repository import EventRepository
+from services.activity_service import ActivityService
+from services.event_service import EventService
+from services.lodging_service import LodgingService
+from services.user_service import UserService
+
+
+pytestmark = pytest.mark.unit
+
+
+def make_controller(total: int) -> tuple[EventController, Mock, Mock]:
+    event = EventMother.active()
+    event_service = Mock(spec=EventService)
+    event_service.get_page = AsyncMock(
+        side_effect=lambda limit, offset: [event] * min(limit, max(0, total - offset))
+    )
+    user_service = Mock(spec=UserService)
+    user_service.get_page = AsyncMock(
+        side_effect=lambda limit, offset: event.users * min(limit, max(0, total - offset))
+    )
+    controller = EventController(
+        event_service, user_service, Mock(spec=ActivityService), Mock(spec=LodgingService)
+    )
+    return controller, event_service, user_service
+
+
+@pytest.mark.asyncio
+async def test_events_page_reads_one_extra_row_to_detect_next_page() -> None:
+    controller, event_service, _ = make_controller(total=25)
+
+    first = await controller.get_events_page(1, 20)
+    last = await controller.get_events_page(2, 20)
+
+    assert len(first["events"]) == 20 and first["has_next"]
+    assert len(last["events"]) == 5 and not last["has_next"]
+    event_service.get_page.assert_any_await(21, 20)
+
+
+@pytest.mark.asyncio
+async def test_options_page_returns_next_offset_until_exhausted() -> None:
+    controller, _, user_service = make_controller(total=150)
+
+    first = await controller.get_options_page("users", 0, 100)
+    second = await controller.get_options_page("users", 100, 100)
+
+    assert first["next_offset"] == 100
+    assert len(second["items"]) == 50 and second["next_offset"] is None
+    user_service.get_page.assert_any_await(101, 100)
+
+    with pytest.raises(ValueError):
+        await controller.get_options_page("venues", 0, 10)
+
+
+@pytest.mark.asyncio
+async def test_event_page_query_count_does_not_grow_with_limit() -> None:
+    user = EventMother.active().users[0]
+    rows = [
+        {"id": event_id, "status": "Активное", "user_ids": [1], "activity_ids": [], "lodging_ids": []}
+        for event_id in (5, 4)
+    ]
+    page, by_ids = MagicMock(), MagicMock()
+    page.scalars.return_value.all.return_value = [4, 5]
+    by_ids.mappings.return_value.all.return_value = rows
+    session = Mock()
+    session.execute = AsyncMock(side_effect=[page, by_ids])
+    user_repo, activity_repo, lodging_repo = Mock(), Mock(), Mock()
+    user_repo.get_by_ids = AsyncMock(return_value={1: user})
+    activity_repo.get_by_ids = AsyncMock(return_value={})
+    lodging_repo.get_by_ids = AsyncMock(return_value={})
+
+    events = await EventRepository(session, user_repo, activity_repo, lodging_repo).get_page(2, 0)
+
+    assert [e.event_id for e in events] == [4, 5]
+    assert session.execute.await_count == 2
+    user_repo.get_by_ids.assert_awaited_once()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+import pytest
+
+from abstract_repository.include import SHALLOW
+from abstract_repository.include import resolve_include
+from models.session import Session
+from models.unloaded import RelationNotLoadedError
+from models.unloaded import Unloaded
+from negative_cache import negative_cache
+from repository.event_repository import EventRepository
+from repository.program_repository import ProgramRepository
+from repository.session_repository import SessionRepository
+
+
+pytestmark = pytest.mark.unit
+
+SESSION_PATHS = SessionRepository.INCLUDE_PATHS
+
+ROW = {
+    "id": 5,
+    "program_id": 3,
+    "event_id": 7,
+    "start_time": datetime(2025, 5, 1),
+    "end_time": datetime(2025, 5, 3),
+    "type": "Личные",
+}
+
+
+def make_repo() -> tuple[SessionRepository, Mock, Mock]:
+    db = MagicMock()
+    result = MagicMock()
+    result.mappings.return_value.first.return_value = ROW
+    db.execute = AsyncMock(return_value=result)
+    program_repo = Mock(spec=ProgramRepository)
+    program_repo.get_by_id = AsyncMock(return_value=None)
+    event_repo = Mock(spec=EventRepository)
+    event_repo.get_by_id = AsyncMock(return_value=None)
+    return SessionRepository(db, program_repo, event_repo), program_repo, event_repo
+
+
+def test_resolve_include() -> None:
+    assert resolve_include(None, SESSION_PATHS) == SESSION_PATHS
+    assert resolve_include(SHALLOW, SESSION_PATHS) == frozenset()
+    assert resolve_include({"program.venues"}, SESSION_PATHS) == {"program", "program.venues"}
+    with pytest.raises(ValueError):
+        resolve_include({"event.users"}, SESSION_PATHS)
+
+
+def test_unloaded_exposes_only_its_id() -> None:
+    event = Unloaded("event", 7)
+    session = Session(
+        session_id=1,
+        event=event,
+        start_time=datetime(2025, 5, 1),
+        end_time=datetime(2025, 5, 3),
+        type="Личные",
+    )
+
+    assert session.event.event_id == 7
+    with pytest.raises(RelationNotLoadedError):
+        _ = session.event.users
+    assert session.model_dump()["event"] == {"event_id": 7, "loaded": False}
+
+
+@pytest.mark.asyncio
+async def test_shallow_session_does_not_touch_relations() -> None:
+    negative_cache.clear()
+    repo, program_repo, event_repo = make_repo()
+
+    session = await repo.get_by_id(5, include=SHALLOW)
+
+    assert session is not None
+    assert session.program == Unloaded("program", 3)
+    assert session.event == Unloaded("event", 7)
+    program_repo.get_by_id.assert_not_awaited()
+    event_repo.get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_include_selects_relations_and_depth() -> None:
+    negative_cache.clear()
+    repo, program_repo, event_repo = make_repo()
+
+    await repo.get_by_id(5, include={"program"})
+    program_repo.get_by_id.assert_awaited_once_with(3, include=SHALLOW)
+    event_repo.get_by_id.assert_not_awaited()
+
+    await repo.get_by_id(5)
+    program_repo.get_by_id.assert_awaited_with(3, include=None)
+    event_repo.get_by_id.assert_awaited_once_with(7)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+import pytest
+
+from repository.event_repository import EventRepository
+from repository.program_repository import ProgramRepository
+from repository.session_repository import SessionRepository
+
+
+pytestmark = pytest.mark.unit
+
+CREATED = {
+    "session_found": True,
+    "id": 42,
+    "program_id": 3,
+    "event_id": 7,
+    "start_time": datetime(2025, 5, 1),
+    "end_time": datetime(2025, 5, 3),
+    "type": "Личные",
+}
+
+
+def make_repo(row: dict[str, Any]) -> tuple[SessionRepository, MagicMock]:
+    db = MagicMock()
+    result = MagicMock()
+    result.mappings.return_value.one.return_value = row
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+    return SessionRepository(db, Mock(spec=ProgramRepository), Mock(spec=EventRepository)), db
+
+
+@pytest.mark.asyncio
+async def test_join_is_one_statement_with_on_conflict() -> None:
+    repo, db = make_repo(CREATED)
+
+    personal = await repo.join_event(5, 1)
+
+    assert personal is not None and personal.session_id == 42
+    assert personal.type == "Личные"
+    assert db.execute.await_count == 1
+    assert "ON CONFLICT (event_id, users_id) DO NOTHING" in str(db.execute.await_args.args[0])
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_second_join_is_rejected_without_new_session() -> None:
+    repo, _ = make_repo({**CREATED, "id": None, "program_id": None, "event_id": None})
+
+    with pytest.raises(ValueError, match="already joined"):
+        await repo.join_event(5, 1)
+
+
+@pytest.mark.asyncio
+async def test_join_unknown_session() -> None:
+    repo, _ = make_repo({**CREATED, "session_found": False, "id": None})
+
+    assert await repo.join_event(404, 1) is None
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from negative_cache import NegativeCache
+from negative_cache import negative_cache
+from repository.venue_repository import VenueRepository
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_miss_expires_after_ttl() -> None:
+    clock = FakeClock()
+    cache = NegativeCache(ttl=30, max_size=10, clock=clock)
+
+    cache.remember("venue", 7)
+    assert cache.is_missing("venue", 7)
+    assert not cache.is_missing("program", 7)
+
+    clock.now = 30
+    assert not cache.is_missing("venue", 7)
+    assert cache.stats()["size"] == 0
+
+
+def test_forget_and_size_limit() -> None:
+    cache = NegativeCache(ttl=30, max_size=2)
+
+    for entity_id in (1, 2, 3):
+        cache.remember("session", entity_id)
+    cache.forget("session", 3)
+
+    assert not cache.is_missing("session", 1)
+    assert cache.is_missing("session", 2)
+    assert not cache.is_missing("session", 3)
+
+
+def test_zero_ttl_disables_cache() -> None:
+    cache = NegativeCache(ttl=0, max_size=10)
+    cache.remember("user", 1)
+
+    assert not cache.is_missing("user", 1)
+
+
+@pytest.mark.asyncio
+async def test_repository_skips_query_for_known_miss_until_insert() -> None:
+    negative_cache.clear()
+    db = MagicMock()
+    missing = MagicMock()
+    missing.mappings.return_value.first.return_value = None
+    inserted = MagicMock()
+    inserted.scalar_one.return_value = 404
+    db.execute = AsyncMock(side_effect=[missing, inserted])
+    db.commit = AsyncMock()
+    repo = VenueRepository(db)
+
+    assert await repo.get_by_id(404) is None
+    assert await repo.get_by_id(404) is None
+    assert db.execute.await_count == 1
+
+    venue = MagicMock(name="venue")
+    venue.name = "Казань"
+    await repo.add(venue)
+
+    assert not negative_cache.is_missing("venue", 404)
+    negative_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_reads_in_one_query_and_remembers_misses() -> None:
+    negative_cache.clear()
+    db = MagicMock()
+    found = MagicMock()
+    found.mappings.return_value = [
+        {"venue_id": 1, "name": "Москва"},
+        {"venue_id": 2, "name": "Казань"},
+    ]
+    db.execute = AsyncMock(return_value=found)
+    repo = VenueRepository(db)
+
+    venues = await repo.get_by_ids([2, 1, 2, 404])
+
+    assert {k: v.name for k, v in venues.items()} == {1: "Москва", 2: "Казань"}
+    assert db.execute.await_args.args[1] == {"ids": [2, 1, 404]}
+    assert await repo.get_by_ids([404]) == {}
+    assert db.execute.await_count == 1
+    negative_cache.clear()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import bcrypt
+import pytest
+
+from models.user import User
+from password_hashing import PasswordHasher
+from password_hashing import check_password
+from password_hashing import hash_rounds
+from password_hashing import password_hasher
+from repository.user_repository import UserRepository
+from services.user_service import AuthService
+
+
+pytestmark = pytest.mark.unit
+
+PASSWORD = "Password123!"
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_runs_off_the_event_loop() -> None:
+    hasher = PasswordHasher(max_workers=1)
+    hashed = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(10)).decode()
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        results = await asyncio.gather(
+            hasher.verify(PASSWORD, hashed), hasher.verify("wrong", hashed)
+        )
+    finally:
+        task.cancel()
+        hasher.shutdown()
+
+    assert results == [True, False]
+    assert ticks >= 3
+    stats = hasher.stats()
+    assert stats["completed"] == 2
+    assert stats["in_flight"] == 0
+    # второй вызов ждал, пока единственный воркер освободится
+    assert stats["queue_wait_max_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_hash_roundtrip_and_broken_hash() -> None:
+    hasher = PasswordHasher(max_workers=2)
+    try:
+        hashed = await hasher.hash(PASSWORD)
+
+        assert await hasher.verify(PASSWORD, hashed)
+        assert not await hasher.verify(PASSWORD, "not-a-bcrypt-hash")
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_to_target_cost(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(password_hasher, "rounds", 5)
+    old_hash = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(4)).decode()
+    user = User(
+        user_id=1,
+        fio="Иванов Иван",
+        number_passport="1234567890",
+        phone_number="89991234567",
+        email="ivan@example.com",
+        login="ivan",
+        password=old_hash,
+    )
+    repo = Mock(spec=UserRepository)
+    repo.get_by_login = AsyncMock(return_value=user)
+    repo.update_password = AsyncMock()
+    auth = AuthService(repo)
+
+    assert await auth.authenticate("ivan", "wrong") is None
+    assert await auth.authenticate("ivan", PASSWORD) == user
+    await asyncio.gather(*AuthService._rehash_tasks)
+
+    repo.update_password.assert_awaited_once()
+    login, new_hash = repo.update_password.await_args.args
+    assert login == "ivan"
+    assert repo.update_password.await_args.kwargs == {"expected": old_hash}
+    assert hash_rounds(new_hash) == 5
+    assert check_password(PASSWORD, new_hash)
+
+
+@pytest.mark.asyncio
+async def test_rehash_does_not_overwrite_changed_password() -> None:
+    db = Mock()
+    db.execute = AsyncMock(return_value=Mock(mappings=Mock(return_value=Mock(first=Mock(return_value=None)))))
+    db.commit = AsyncMock()
+    repo = UserRepository(db)
+    await asyncio.gather(*AuthService._rehash_tasks)
+    rehashed = password_hasher.rehashed
+
+    await AuthService(repo)._rehash("ivan", PASSWORD, "$2b$04$old")
+
+    query, params = db.execute.await_args.args
+    assert "AND password = :expected" in str(query)
+    assert params["expected"] == "$2b$04$old"
+    assert password_hasher.rehashed == rehashed
+
+
+@pytest.mark.asyncio
+async def test_rehash_writes_through_its_own_repository() -> None:
+    request_repo = Mock(spec=UserRepository)
+    own_repo = Mock(spec=UserRepository)
+    own_repo.update_password = AsyncMock(return_value=Mock(spec=User))
+
+    @asynccontextmanager
+    async def background_repository() -> AsyncIterator[UserRepository]:
+        yield own_repo
+
+    auth = AuthService(request_repo, background_repository=background_repository)
+    await auth._rehash("ivan", PASSWORD, "$2b$04$old")
+
+    own_repo.update_password.assert_awaited_once()
+    request_repo.update_password.assert_not_called()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+import main
+
+from models.patch import validate_changes
+from models.unloaded import Unloaded
+from models.user import User
+from repository.event_repository import EventRepository
+from repository.program_repository import ProgramRepository
+from repository.session_repository import SessionRepository
+from repository.user_repository import UserRepository
+from service_locator import ServiceLocator
+from service_locator import get_service_locator
+from services.session_service import SessionService
+from services.user_service import UserService
+
+
+pytestmark = pytest.mark.unit
+
+ROW = {
+    "id": 5,
+    "program_id": 3,
+    "event_id": 7,
+    "start_time": datetime(2025, 5, 1),
+    "end_time": datetime(2025, 5, 10),
+    "type": "Личные",
+}
+
+
+def make_repo(row: dict | None) -> tuple[SessionRepository, MagicMock]:
+    db = MagicMock()
+    result = MagicMock()
+    result.mappings.return_value.first.return_value = row
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+    repo = SessionRepository(db, Mock(spec=ProgramRepository), Mock(spec=EventRepository))
+    return repo, db
+
+
+def test_only_changed_fields_are_validated() -> None:
+    assert validate_changes(User, {"phone_number": "89991234567"}, {"phone_number"}) == {
+        "phone_number": "89991234567"
+    }
+    with pytest.raises(ValueError):
+        validate_changes(User, {"phone_number": "123"}, {"phone_number"})
+    with pytest.raises(ValueError):
+        validate_changes(User, {"is_admin": True}, {"phone_number"})
+
+
+@pytest.mark.asyncio
+async def test_session_patch_is_a_single_update_returning() -> None:
+    repo, db = make_repo(ROW)
+
+    session = await repo.patch(5, {"end_time": datetime(2025, 5, 10)})
+
+    assert db.execute.await_count == 1
+    sql = str(db.execute.await_args.args[0])
+    assert "UPDATE session SET end_time = :end_time" in sql and "RETURNING" in sql
+    assert session is not None and session.event == Unloaded("event", 7)
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_patch_rolls_back_when_dates_out_of_order() -> None:
+    repo, db = make_repo({**ROW, "end_time": datetime(2025, 4, 1)})
+
+    with pytest.raises(ValueError):
+        await repo.patch(5, {"end_time": datetime(2025, 4, 1)})
+
+    db.rollback.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_password_does_not_read_user_first() -> None:
+    repo = Mock(spec=UserRepository)
+    repo.update_password = AsyncMock(return_value=Mock(spec=User))
+    service = UserService(repo)
+
+    await service.update_password("ivanov", "$2b$12$hash")
+
+    repo.update_password.assert_awaited_once_with("ivanov", "$2b$12$hash")
+    repo.get_by_login.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_patch_endpoint_validates_before_repository() -> None:
+    repo = Mock(spec=SessionRepository)
+    repo.PATCH_FIELDS = SessionRepository.PATCH_FIELDS
+    repo.patch = AsyncMock(return_value=None)
+    service_locator = Mock(spec=ServiceLocator)
+    service_locator.get_session_serv.return_value = SessionService(repo)
+    main.app.dependency_overrides[get_service_locator] = lambda: service_locator
+    try:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            invalid = await client.patch("/api/sessions/5", json={"type": "Чужие"})
+            missing = await client.patch("/api/sessions/5", json={"type": "Личные"})
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert invalid.status_code == 422
+    assert missing.status_code == 404
+    repo.patch.assert_awaited_once_with(5, {"type": "Личные"})
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from sqlalchemy.exc import SQLAlchemyError
+
+import service_locator
+
+from main import app
+from repository.session_repository import SessionRepository
+
+
+pytestmark = pytest.mark.unit
+
+USER = {
+    "id": 1,
+    "full_name": "Иванов Иван Иванович",
+    "passport": "1234567890",
+    "phone": "89991234567",
+    "email": "ivan@example.com",
+    "login": "ivanov",
+    "password": "Password123!",
+}
+
+
+class Result:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+
+    def mappings(self) -> Result:
+        return self
+
+    def first(self) -> dict[str, Any] | None:
+        return self.rows[0] if self.rows else None
+
+    def all(self) -> list[dict[str, Any]]:
+        return self.rows
+
+    def __iter__(self) -> Any:
+        return iter(self.rows)
+
+
+class CountingSession:
+    """Отвечает на запросы профиля: n_events мероприятий по две сессии в каждом."""
+
+    def __init__(self, n_events: int) -> None:
+        self.n_events = n_events
+        self.queries = 0
+
+    async def execute(self, query: Any, params: Any = None) -> Result:
+        self.queries += 1
+        sql = str(query)
+        if "FROM users WHERE id" in sql:
+            return Result([USER])
+        events = range(1, self.n_events + 1)
+        if "FROM session s" in sql:
+            return Result([
+                {
+                    "id": event_id * 10 + part,
+                    "start_time": datetime(2025, 5, part),
+                    "end_time": datetime(2025, 5, part + 1),
+                    "type": "Личные",
+                    "event_id": event_id,
+                    "status": "Активное" if event_id % 2 else "Завершено",
+                    "program_id": 1,
+                    "transfer_type": "Поезд",
+                    "cost": 500,
+                    "transfer_duration_minutes": 60,
+                    "start_venue_id": 1,
+                    "start_venue_name": "Москва",
+                    "end_venue_id": 2,
+                    "end_venue_name": "Казань",
+                }
+                for event_id in events
+                for part in (1, 2)
+            ])
+        if "FROM users_event ue" in sql:
+            return Result([{"event_id": event_id, **USER} for event_id in events])
+        if "FROM event_activity ea" in sql:
+            return Result([
+                {
+                    "event_id": event_id,
+                    "id": event_id,
+                    "duration": "2 часа",
+                    "address": "ул. Ленина, 1",
+                    "activity_type": "Семинар",
+                    "activity_time": datetime(2025, 5, 1, 10),
+                    "venue_id": 2,
+                    "venue_name": "Казань",
+                }
+                for event_id in events
+            ])
+        return Result([])
+
+
+async def count_queries(monkeypatch: pytest.MonkeyPatch, n_events: int) -> int:
+    db = CountingSession(n_events)
+    monkeypatch.setattr(service_locator, "_pg_engine", object())
+    monkeypatch.setattr(service_locator, "_pg_session_factory", lambda: db)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/profile_user/1")
+    assert response.status_code == 200
+    assert response.text.count("Казань") >= 2 * n_events
+    return db.queries
+
+
+@pytest.mark.asyncio
+async def test_profile_query_count_does_not_grow_with_sessions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    small = await count_queries(monkeypatch, 1)
+    large = await count_queries(monkeypatch, 30)
+
+    assert small == large == 5
+
+
+@pytest.mark.asyncio
+async def test_profile_sessions_query_error_is_not_hidden() -> None:
+    db = Mock()
+    db.execute = AsyncMock(side_effect=SQLAlchemyError("down"))
+    repo = SessionRepository(db, Mock(), Mock())
+
+    with pytest.raises(SQLAlchemyError):
+        await repo.get_sessions_for_user(1, ["Активное"])
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from controllers.user_controller import UserController
+from rate_limit import MemoryRateLimitBackend
+from rate_limit import RateLimiter
+from service_locator import ServiceLocator
+from service_locator import get_service_locator
+
+
+pytestmark = pytest.mark.unit
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_bucket_refills_at_rate() -> None:
+    clock = Clock()
+    backend = MemoryRateLimitBackend(max_keys=100, shards=4, clock=clock)
+
+    assert await backend.take("ip:1", rate=1.0, burst=2) == 0
+    assert await backend.take("ip:1", rate=1.0, burst=2) == 0
+    assert await backend.take("ip:1", rate=1.0, burst=2) == pytest.approx(1.0)
+    assert await backend.take("ip:2", rate=1.0, burst=2) == 0
+    clock.now = 1.0
+    assert await backend.take("ip:1", rate=1.0, burst=2) == 0
+
+
+@pytest.mark.asyncio
+async def test_login_is_limited_before_service_locator(monkeypatch: pytest.MonkeyPatch) -> None:
+    import main
+    import rate_limit
+
+    limiter = RateLimiter(
+        MemoryRateLimitBackend(max_keys=100), {"ip": (0.01, 100), "login": (0.01, 2)}
+    )
+    monkeypatch.setattr(rate_limit, "auth_rate_limiter", limiter)
+    controller = Mock(spec=UserController)
+    controller.login = AsyncMock(return_value={"access_token": "t"})
+    service_locator = Mock(spec=ServiceLocator)
+    service_locator.get_user_contr.return_value = controller
+    resolved = Mock(return_value=service_locator)
+    main.app.dependency_overrides[get_service_locator] = lambda: resolved()
+
+    async def login(name: str) -> httpx.Response:
+        return await client.post(
+            "/api/login",
+            content=json.dumps({"login": name, "password": "Password123!"}),
+            headers={"Content-Type": "application/json"},
+        )
+
+    try:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = [await login("ivan") for _ in range(3)]
+            other = await login("petr")
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert int(responses[2].headers["Retry-After"]) == 100
+    assert other.status_code == 200
+    assert resolved.call_count == 3
+    assert controller.login.await_count == 3
+    assert limiter.stats()["scopes"]["login"]["limited"] == 1
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from pydantic import ValidationError
+
+from controllers.user_controller import UserController
+from controllers.venue_controller import VenueController
+from request_schemas import UserIn
+from request_schemas import UserSessionIn
+from request_schemas import VenueIn
+from service_locator import ServiceLocator
+from service_locator import get_service_locator
+
+
+pytestmark = pytest.mark.unit
+
+
+async def post(service_locator: Mock, url: str, body: Any) -> httpx.Response:
+    import main
+
+    main.app.dependency_overrides[get_service_locator] = lambda: service_locator
+    try:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            content = body if isinstance(body, bytes) else json.dumps(body)
+            return await client.post(
+                url, content=content, headers={"Content-Type": "application/json"}
+            )
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_invalid_body_is_rejected_before_controller() -> None:
+    controller = Mock(spec=VenueController)
+    controller.create_new_venue = AsyncMock()
+    service_locator = Mock(spec=ServiceLocator)
+    service_locator.get_venue_contr.return_value = controller
+
+    empty_name = await post(service_locator, "/api/venues", {"name": ""})
+    broken = await post(service_locator, "/api/venues", b"{not json")
+    ok = await post(service_locator, "/api/venues", {"name": "Москва"})
+
+    assert empty_name.status_code == 422
+    assert empty_name.json()["detail"][0]["loc"] == ["body", "name"]
+    assert broken.status_code == 422
+    assert ok.status_code == 200
+    controller.create_new_venue.assert_awaited_once_with(VenueIn(name="Москва"))
+
+
+@pytest.mark.asyncio
+async def test_login_without_password_is_422() -> None:
+    controller = Mock(spec=UserController)
+    controller.login = AsyncMock()
+    service_locator = Mock(spec=ServiceLocator)
+    service_locator.get_user_contr.return_value = controller
+
+    response = await post(service_locator, "/api/login", {"login": "user"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "password"]
+    controller.login.assert_not_awaited()
+
+
+def test_user_session_form_is_decoded_from_raw_json() -> None:
+    raw = json.dumps(
+        {
+            "start_date": "01.05.2025",
+            "end_date": "03.05.2025",
+            "start_venue": "1",
+            "end_venue": "2",
+            "transfer_type": "Поезд",
+            "user_id": "7",
+            "activities[]": "4",
+            "lodgings[]": ["5", "6"],
+        }
+    )
+
+    data = UserSessionIn.model_validate_json(raw)
+
+    assert data.start_date == datetime(2025, 5, 1)
+    assert data.activities == [4]
+    assert data.lodgings == [5, 6]
+    with pytest.raises(ValidationError, match="ДД.ММ.ГГГГ"):
+        UserSessionIn.model_validate_json(raw.replace("01.05.2025", "2025-05-01"))
+
+
+def test_registration_ignores_client_is_admin() -> None:
+    data = UserIn.model_validate_json(
+        json.dumps(
+            {
+                "fio": "Иванов Иван",
+                "number_passport": "1234567890",
+                "phone_number": "89991234567",
+                "email": "ivan@example.com",
+                "login": "ivan",
+                "password": "Password123!",
+                "is_admin": True,
+            }
+        )
+    )
+
+    assert "is_admin" not in data.model_dump()
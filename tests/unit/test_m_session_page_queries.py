@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+import service_locator
+
+from main import app
+
+
+pytestmark = pytest.mark.unit
+
+
+def make_overview(n_sessions: int) -> dict[str, Any]:
+    """Строка обзора в том виде, в каком её возвращает PostgreSQL (jsonb)."""
+    events = [
+        {
+            "id": i,
+            "status": "Активное",
+            "users": [{"user_id": i, "fio": f"Пользователь {i}", "email": f"u{i}@example.com"}],
+            "activities": [
+                {
+                    "id": i,
+                    "duration": "2 часа",
+                    "address": "ул. Ленина, 1",
+                    "activity_type": "Семинар",
+                    "activity_time": "2025-05-01T10:00:00",
+                    "venue_id": None,
+                    "venue_name": None,
+                }
+            ],
+            "lodgings": [
+                {
+                    "id": i,
+                    "price": 1000,
+                    "address": "ул. Мира, 2",
+                    "name": "Отель",
+                    "type": "Отель",
+                    "rating": 5,
+                    "check_in": "2025-05-01T00:00:00",
+                    "check_out": "2025-05-03T00:00:00",
+                    "venue_id": 1,
+                    "venue_name": "Москва",
+                }
+            ],
+        }
+        for i in range(1, n_sessions + 1)
+    ]
+    sessions = [
+        {
+            "id": i,
+            "start_time": "2025-05-01T00:00:00",
+            "end_time": "2025-05-03T00:00:00",
+            "type": "Личные",
+            "program_id": 1,
+            "event_id": i,
+        }
+        for i in range(1, n_sessions + 1)
+    ]
+    programs = [
+        {
+            "id": 1,
+            "transfer_type": "Автобус",
+            "cost": 500,
+            "transfer_duration_minutes": 60,
+            "start_venue": "Москва",
+            "end_venue": "Казань",
+        }
+    ]
+    return {"sessions": sessions, "events": events, "programs": programs}
+
+
+class CountingSession:
+    def __init__(self, n_sessions: int) -> None:
+        self.n_sessions = n_sessions
+        self.queries = 0
+
+    async def execute(self, query: Any, params: Any = None) -> MagicMock:
+        self.queries += 1
+        result = MagicMock()
+        result.mappings.return_value.one.return_value = make_overview(self.n_sessions)
+        return result
+
+
+async def count_queries(monkeypatch: pytest.MonkeyPatch, n_sessions: int) -> int:
+    db = CountingSession(n_sessions)
+    monkeypatch.setattr(service_locator, "_pg_engine", object())
+    monkeypatch.setattr(service_locator, "_pg_session_factory", lambda: db)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/session.html")
+    assert response.status_code == 200
+    assert response.text.count("/session/delete/") == n_sessions
+    return db.queries
+
+
+@pytest.mark.asyncio
+async def test_session_page_query_count_does_not_grow_with_sessions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    small = await count_queries(monkeypatch, 1)
+    large = await count_queries(monkeypatch, 50)
+
+    assert small == large == 1
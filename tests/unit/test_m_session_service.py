@@ -33,7 +33,7 @@ async def test_should_successfull_get_session_by_id() -> None:
     result = await service.get_by_id(1)
 
     assert result == session
-    repo.get_by_id.assert_awaited_once_with(1)
+    repo.get_by_id.assert_awaited_once_with(1, include=None)
 
 
 @pytest.mark.asyncio
@@ -289,6 +289,19 @@ async def test_should_successfull_get_sessions_by_type() -> None:
     repo.get_sessions_by_type.assert_awaited_once_with("Личные")
 
 
+@pytest.mark.asyncio
+async def test_should_successfull_get_catalog_by_type() -> None:
+    rows = [{"session_id": 2, "total_cost": 1500, "user_ids": [1, 3]}]
+    repo = Mock(spec=SessionRepository, autospec=True)
+    repo.get_catalog_by_type = AsyncMock(return_value=rows)
+
+    service = SessionService(repo)
+    result = await service.get_catalog_by_type("Официальные")
+
+    assert result == rows
+    repo.get_catalog_by_type.assert_awaited_once_with("Официальные")
+
+
 @pytest.mark.asyncio
 async def test_should_successfull_get_session_parts() -> None:
     parts = [{"venue": "Москва"}]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+pytestmark = pytest.mark.unit
+
+ROUTE = "/programs/official"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_computation() -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def load() -> list[int]:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await release.wait()
+        return [1, 2, 3]
+
+    flight = SingleFlight([ROUTE])
+    leader = asyncio.create_task(flight.do(f"{ROUTE}?", load, ROUTE))
+    await started.wait()
+    followers = [
+        asyncio.create_task(flight.do(f"{ROUTE}?", load, ROUTE)) for _ in range(4)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(leader, *followers)
+
+    assert calls == 1
+    assert all(r == [1, 2, 3] for r in results)
+    assert flight.stats()[ROUTE] == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_sequential_reads_are_not_cached() -> None:
+    load = AsyncMock(return_value="page")
+    flight = SingleFlight([ROUTE])
+
+    await flight.do(f"{ROUTE}?", load, ROUTE)
+    await flight.do(f"{ROUTE}?", load, ROUTE)
+
+    assert load.await_count == 2
+    assert flight.stats()[ROUTE]["coalesced"] == 0
+
+
+@pytest.mark.asyncio
+async def test_error_is_propagated_to_every_waiter() -> None:
+    release = asyncio.Event()
+
+    async def load() -> None:
+        await release.wait()
+        raise ValueError("db is down")
+
+    flight = SingleFlight([ROUTE])
+    tasks = [asyncio.create_task(flight.do("key", load, ROUTE)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_break_followers() -> None:
+    release = asyncio.Event()
+
+    async def load() -> str:
+        await release.wait()
+        return "page"
+
+    flight = SingleFlight([ROUTE])
+    leader = asyncio.create_task(flight.do("key", load, ROUTE))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", load, ROUTE))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == "page"
+
+
+def test_route_must_be_configured() -> None:
+    assert SingleFlight([ROUTE]).is_enabled(ROUTE)
+    assert not SingleFlight([ROUTE]).is_enabled("/venue.html")
+    assert not SingleFlight([ROUTE], enabled=False).is_enabled(ROUTE)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from static_assets import IMMUTABLE
+from static_assets import StaticAssets
+
+
+pytestmark = pytest.mark.unit
+
+CDN_JS = "https://cdn.example.com/lib.min.js"
+
+
+@pytest.fixture
+def assets(tmp_path: Path) -> StaticAssets:
+    icons = tmp_path / "vendor" / "icons"
+    icons.mkdir(parents=True)
+    (icons / "icons.woff2").write_bytes(b"\x00font")
+    (icons / "icons.css").write_text(
+        '@font-face { src: url("./icons.woff2") format("woff2"), url(data:x) }', "utf-8"
+    )
+    (tmp_path / "vendor.json").write_text(
+        json.dumps({"vendor/lib.min.js": {"url": CDN_JS, "sha256": None}}), "utf-8"
+    )
+    return StaticAssets(tmp_path)
+
+
+def test_urls_are_fingerprinted_and_served_immutable(assets: StaticAssets) -> None:
+    url = assets.url("vendor/icons/icons.woff2")
+
+    assert url.startswith("/static/vendor/icons/icons.") and url.endswith(".woff2")
+    response = assets.response(url.removeprefix("/static/"))
+    assert response.headers["cache-control"] == IMMUTABLE
+    assert response.body == b"\x00font"
+    assert response.media_type == "font/woff2"
+
+
+def test_css_references_point_to_fingerprinted_files(assets: StaticAssets) -> None:
+    css = assets.response(assets.url("vendor/icons/icons.css").removeprefix("/static/"))
+
+    assert f'url("{assets.url("vendor/icons/icons.woff2")}")' in css.body.decode()
+    assert "url(data:x)" in css.body.decode()
+
+
+def test_missing_vendor_file_is_an_error_not_a_cdn_link(
+    assets: StaticAssets, caplog: pytest.LogCaptureFixture
+) -> None:
+    assert assets.url("vendor/lib.min.js") == "/static/vendor/lib.min.js"
+    assert assets.response("vendor/lib.min.js").status_code == 404
+    errors = [r.getMessage() for r in caplog.records if r.levelname == "ERROR"]
+    assert any("vendor/lib.min.js" in message for message in errors)
+
+
+def test_unhashed_path_revalidates(assets: StaticAssets) -> None:
+    response = assets.response("vendor/icons/icons.woff2")
+
+    assert response.headers["cache-control"] == "no-cache"
+    etag = response.headers["etag"]
+    assert assets.response("vendor/icons/icons.woff2", etag).status_code == 304
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+
+from fastapi.responses import HTMLResponse
+from fastapi.responses import StreamingResponse
+from jinja2 import Environment
+from jinja2 import FileSystemLoader
+
+import template_streaming
+
+from settings import settings
+from template_streaming import stream_template
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def rows_template(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "rows.html").write_text(
+        "<table>{% for row in rows %}<tr><td>{{ row }}</td></tr>{% endfor %}</table>",
+        encoding="utf-8",
+    )
+    env = Environment(loader=FileSystemLoader(str(tmp_path)), enable_async=True)
+    monkeypatch.setattr(template_streaming, "async_env", env)
+
+
+@pytest.mark.asyncio
+async def test_first_chunk_is_sent_before_rows_are_exhausted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "TEMPLATE_STREAMING_ENABLED", True)
+    monkeypatch.setattr(settings, "TEMPLATE_STREAM_CHUNK_SIZE", 64)
+    produced: list[int] = []
+
+    async def rows() -> AsyncIterator[int]:
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    response = await stream_template("rows.html", {"rows": rows()})
+
+    assert isinstance(response, StreamingResponse)
+    chunks = response.body_iterator
+    first = await chunks.__anext__()
+    assert first.startswith(b"<table><tr>")
+    assert len(produced) < 100
+    rest = [chunk async for chunk in chunks]
+    assert all(len(chunk) < 64 + 64 for chunk in rest)
+    assert (first + b"".join(rest)).endswith(b"<tr><td>99</td></tr></table>")
+
+
+@pytest.mark.asyncio
+async def test_streaming_can_be_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "TEMPLATE_STREAMING_ENABLED", False)
+
+    response = await stream_template("rows.html", {"rows": [1, 2]})
+
+    assert isinstance(response, HTMLResponse)
+    assert response.body == b"<table><tr><td>1</td></tr><tr><td>2</td></tr></table>"
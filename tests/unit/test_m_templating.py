@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import FileSystemLoader
+from jinja2 import TemplateSyntaxError
+
+import templating
+
+from templating import precompile_templates
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def broken_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "ok.html").write_text("<p>{{ value }}</p>", encoding="utf-8")
+    (tmp_path / "broken.html").write_text("{% for x in %}", encoding="utf-8")
+    cache = FileSystemBytecodeCache(str(tmp_path), "%s.cache")
+    env = Environment(loader=FileSystemLoader(str(tmp_path)), bytecode_cache=cache)
+    monkeypatch.setattr(templating, "templates", Jinja2Templates(env=env))
+    monkeypatch.setattr(templating, "async_env", env.overlay(enable_async=True))
+    return tmp_path
+
+
+def test_all_templates_compile() -> None:
+    assert precompile_templates(fail_fast=True) == len(list(Path("templates").glob("*.html")))
+
+
+def test_precompile_logs_errors_unless_fail_fast(broken_dir: Path) -> None:
+    assert precompile_templates() == 1
+    assert list(broken_dir.glob("*.cache"))
+
+    with pytest.raises(TemplateSyntaxError):
+        precompile_templates(fail_fast=True)
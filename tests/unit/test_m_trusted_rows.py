@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+import pytest
+
+from pydantic import ValidationError
+
+from models.activity import Activity
+from models.event import Event
+from models.trusted import trusted
+from models.venue import Venue
+from repository.activity_repository import ActivityRepository
+
+
+pytestmark = pytest.mark.unit
+
+ROW = {
+    "id": 1,
+    "duration": "90 минут",
+    "address": "ул. Ленина, 1",
+    "activity_type": "Семинар",
+    "activity_time": datetime(2025, 5, 1, 10, 0),
+    "venue": 2,
+    "venue_name": "Москва",
+}
+
+
+@pytest.mark.asyncio
+async def test_rows_from_db_are_not_revalidated() -> None:
+    result = MagicMock()
+    result.mappings.return_value = [ROW]
+    session = Mock()
+    session.execute = AsyncMock(return_value=result)
+
+    activities = await ActivityRepository(session, Mock()).get_page(10, 0)
+
+    assert activities[0].duration == "90 минут"
+    assert activities[0].venue == Venue(venue_id=2, name="Москва")
+    with pytest.raises(ValidationError, match="в часах"):
+        Activity(
+            activity_id=1,
+            duration=ROW["duration"],
+            address=ROW["address"],
+            activity_type=ROW["activity_type"],
+            activity_time=ROW["activity_time"],
+        )
+
+
+def test_trusted_matches_validated_model() -> None:
+    venue = trusted(Venue, venue_id=1, name="Москва")
+    event = trusted(Event, event_id=3, status="Активное")
+    other = trusted(Event, event_id=4, status="Активное")
+
+    assert venue == Venue(venue_id=1, name="Москва")
+    assert event.users == [] and event.activities == [] and event.lodgings == []
+    assert event.users is not other.users
+    assert event.model_fields_set == {"event_id", "status"}
+    assert event.model_dump() == {
+        "event_id": 3,
+        "status": "Активное",
+        "users": [],
+        "activities": [],
+        "lodgings": [],
+    }
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import pytest
+
+from fastapi import HTTPException
+
+from models.user import User
+from password_hashing import hash_password
+from repository.user_repository import UserRepository
+from services.user_service import AuthService
+from ttl_store import MemoryTTLStore
+
+
+pytestmark = pytest.mark.unit
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_cap_evicts_oldest() -> None:
+    clock = Clock()
+    store = MemoryTTLStore(max_entries=2, sweep_interval=0, clock=clock)
+
+    await store.set("a", 1, ttl=10)
+    await store.set("b", 2, ttl=100)
+    await store.set("c", 3, ttl=100)
+    assert await store.get("a") is None
+    assert store.stats()["evicted"] == 1
+
+    assert await store.incr("n", ttl=10) == 1
+    assert await store.incr("n", ttl=10) == 2
+    clock.now += 11
+    assert await store.get("n") is None
+    await store.set("d", 4, ttl=100)
+    # истёкший счётчик удалён при чтении, а не вытеснением
+    assert store.stats() == {
+        "backend": "memory", "size": 2, "max_entries": 2, "expired": 1, "evicted": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_counters_are_evicted_before_lockouts() -> None:
+    store = MemoryTTLStore(max_entries=3, sweep_interval=0, clock=Clock(), evict_first=("failed:",))
+
+    await store.set("blocked:ivan", True, ttl=60)
+    await store.set("2fa:ivan", "123456", ttl=60)
+    for login in ("a", "b", "c", "d"):
+        await store.incr(f"failed:{login}", ttl=600)
+
+    assert await store.get("blocked:ivan") is True
+    assert await store.pop("2fa:ivan") == "123456"
+    assert await store.pop("2fa:ivan") is None
+    assert await store.get("failed:d") == 1
+    assert await store.get("failed:c") is None
+    assert store.stats()["evicted"] == 3
+
+
+@pytest.mark.asyncio
+async def test_lockout_and_2fa_go_through_store() -> None:
+    clock = Clock()
+    store = MemoryTTLStore(max_entries=100, clock=clock)
+    user = User(
+        user_id=1,
+        fio="Иванов Иван",
+        number_passport="1234567890",
+        phone_number="89991234567",
+        email="ivan@example.com",
+        login="ivan",
+        password=hash_password("Password123!", 4),
+    )
+    repo = Mock(spec=UserRepository)
+    repo.get_by_login = AsyncMock(return_value=user)
+    auth = AuthService(repo, state=store)
+
+    for _ in range(AuthService.MAX_2FA_ATTEMPTS):
+        assert await auth.authenticate("ivan", "wrong") is None
+    with pytest.raises(HTTPException) as blocked:
+        await auth.authenticate("ivan", "Password123!")
+    assert blocked.value.status_code == 403
+
+    clock.now += AuthService.BLOCK_2FA_TIME
+    assert await auth.authenticate("ivan", "Password123!") == user
+
+    code = await auth.generate_2fa_code("ivan")
+    assert not await auth.verify_2fa_code("ivan", "000000" if code != "000000" else "111111")
+    assert not await auth.verify_2fa_code("ivan", code)
+    code = await auth.generate_2fa_code("ivan")
+    assert await auth.verify_2fa_code("ivan", code)
+    assert not await auth.verify_2fa_code("ivan", code)
+    code = await auth.generate_2fa_code("ivan")
+    clock.now += AuthService.TWO_FA_CODE_TTL
+    assert not await auth.verify_2fa_code("ivan", code)
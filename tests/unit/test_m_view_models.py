@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+
+from datetime import datetime
+
+import pytest
+
+from models.activity import Activity
+from models.event import Event
+from models.lodging import Lodging
+from models.program import Program
+from models.session import Session
+from models.user import User
+from models.venue import Venue
+from view_models import EventView
+from view_models import SessionView
+from view_models import dumps
+
+
+pytestmark = pytest.mark.unit
+
+VENUE = Venue(venue_id=1, name="Москва")
+
+
+def make_event() -> Event:
+    return Event(
+        event_id=3,
+        status="Активное",
+        users=[
+            User(
+                user_id=1,
+                fio="Иванов Иван Иванович",
+                number_passport="1234567890",
+                phone_number="89999999999",
+                email="ivan@example.com",
+                login="ivan123",
+                password="Password123!",
+            )
+        ],
+        activities=[
+            Activity(
+                activity_id=1,
+                duration="2 часа",
+                address="ул. Ленина, 1",
+                activity_type="Семинар",
+                activity_time=datetime(2025, 5, 1, 10, 0),
+                venue=None,
+            )
+        ],
+        lodgings=[
+            Lodging(
+                lodging_id=2,
+                price=1000,
+                address="ул. Мира, 2",
+                name="Отель",
+                type="Отель",
+                rating=5,
+                check_in=datetime(2025, 5, 1),
+                check_out=datetime(2025, 5, 3),
+                venue=VENUE,
+            )
+        ],
+    )
+
+
+def test_session_view_keeps_datetimes_and_venue_names() -> None:
+    program = Program(
+        program_id=7,
+        transfer_type="Автобус",
+        cost=500,
+        transfer_duration_minutes=60,
+        start_venue=VENUE,
+        end_venue=None,
+    )
+    session = Session(
+        session_id=5,
+        program=program,
+        event=None,
+        start_time=datetime(2025, 5, 1),
+        end_time=datetime(2025, 5, 3),
+        type="Личные",
+    )
+
+    view = SessionView.from_model(session, EventView.from_model(make_event()))
+
+    assert view.start_time == datetime(2025, 5, 1)
+    assert view.program is not None
+    assert (view.program.start_venue, view.program.end_venue) == ("Москва", None)
+    assert view.event is not None
+    assert view.event.activities[0].venue_name == "Не указан"
+    assert view.event.lodgings[0].venue_name == "Москва"
+
+
+def test_dumps_serialises_view_models_for_tojson() -> None:
+    event = EventView.from_model(make_event())
+
+    data = json.loads(dumps(event.lodgings, sort_keys=True))
+
+    assert data[0]["check_in"] == "2025-05-01T00:00:00"
+    assert data[0]["venue"] == {"venue_id": 1, "name": "Москва"}
+    with pytest.raises(TypeError):
+        dumps(object())
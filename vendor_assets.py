@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Скачивает сторонние ассеты (Materialize, jQuery, Material Icons) в static/.
+
+Список файлов, их исходные адреса и ожидаемые sha256 — static/vendor.json.
+Каждый файл, скачанный или уже лежащий в static/, сверяется с sha256: при
+несовпадении или незакреплённом хэше скрипт завершается с ошибкой. После
+закрепления хэшей запускается при сборке образа (см. README), чтобы в рантайме
+страницы не ходили на публичные CDN.
+
+--pin скачивает файлы заново и записывает их sha256 в vendor.json — только при
+смене версии, после проверки содержимого; обновлённый vendor.json коммитится.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import urllib.request
+
+from pathlib import Path
+
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+MANIFEST = STATIC_DIR / "vendor.json"
+
+
+def download(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return response.read()
+
+
+def pin(manifest: dict[str, dict[str, str | None]]) -> int:
+    for name, entry in manifest.items():
+        body = download(entry["url"])
+        entry["sha256"] = hashlib.sha256(body).hexdigest()
+        target = STATIC_DIR / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(body)
+        print(f"  {name}: {len(body)} байт, sha256 {entry['sha256']}")
+    MANIFEST.write_text(json.dumps(manifest, indent=2) + "\n", "utf-8")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Скачать сторонние ассеты в static/")
+    parser.add_argument("--force", action="store_true", help="Перекачать существующие файлы")
+    parser.add_argument("--pin", action="store_true", help="Скачать и закрепить sha256 в vendor.json")
+    args = parser.parse_args()
+
+    manifest = json.loads(MANIFEST.read_text("utf-8"))
+    if args.pin:
+        return pin(manifest)
+
+    failed = 0
+    for name, entry in manifest.items():
+        url, expected = entry["url"], entry.get("sha256")
+        if not expected:
+            print(f"  {name}: sha256 не закреплён, запустите vendor_assets.py --pin", file=sys.stderr)
+            failed += 1
+            continue
+        target = STATIC_DIR / name
+        if target.exists() and not args.force:
+            body = target.read_bytes()
+        else:
+            try:
+                body = download(url)
+            except OSError as e:
+                print(f"  {name}: ошибка загрузки {url}: {e}", file=sys.stderr)
+                failed += 1
+                continue
+        actual = hashlib.sha256(body).hexdigest()
+        if actual != expected:
+            print(f"  {name}: sha256 {actual}, ожидался {expected}", file=sys.stderr)
+            failed += 1
+            continue
+        if not target.exists() or args.force:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(body)
+        print(f"  {name}: {len(body)} байт, sha256 совпадает")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())